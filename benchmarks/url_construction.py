@@ -0,0 +1,34 @@
+"""Compares constructing URLs with the precompiled endpoint templates against `construct_url` (run with `python -m benchmarks.url_construction`)."""  # noqa
+import timeit
+
+from src.utils import ENDPOINTS, construct_url
+
+CASES = {
+    "event": (
+        lambda: construct_url("event", key="2022chcmp"),
+        lambda: ENDPOINTS["event"].url("2022chcmp"),
+    ),
+    "event matches (simple)": (
+        lambda: construct_url("event", key="2022chcmp", endpoint="matches", simple=True, keys=False, timeseries=False),
+        lambda: ENDPOINTS["event_matches"].url("2022chcmp", simple=True, keys=False, timeseries=False),
+    ),
+    "team events (year)": (
+        lambda: construct_url("team", key="frc4099", endpoint="events", year=2022, simple=False, keys=False),
+        lambda: ENDPOINTS["team_events"].url("frc4099", year=2022, simple=False, keys=False),
+    ),
+    "teams page": (
+        lambda: construct_url("teams", year=2022, page_num=3, simple=False, keys=True),
+        lambda: ENDPOINTS["teams"].url(year=2022, page_num=3, simple=False, keys=True),
+    ),
+}
+
+if __name__ == "__main__":
+    for name, (construct_url_case, endpoint_case) in CASES.items():
+        assert construct_url_case() == endpoint_case()
+
+        construct_url_time = min(timeit.repeat(construct_url_case, number=100_000, repeat=5)) * 10
+        endpoint_time = min(timeit.repeat(endpoint_case, number=100_000, repeat=5)) * 10
+        print(
+            f"{name:<24} construct_url: {construct_url_time:.2f} µs  Endpoint.url: {endpoint_time:.2f} µs  "
+            f"({construct_url_time / endpoint_time:.1f}x)"
+        )
@@ -1,3 +1,10 @@
+from .analysis import *
 from .api_client import *
+from .export import *
+from .job import *
 from .schemas import *
+from .season import *
+from .serialization import *
 from .utils import *
+from .watcher import *
+from .webhooks import *
@@ -0,0 +1,7 @@
+from .breakdowns import *
+from .districts import *
+from .elo import *
+from .match_arrays import *
+from .playoffs import *
+from .predictions import *
+from .rankings import *
@@ -0,0 +1,246 @@
+import itertools
+import typing
+from dataclasses import dataclass
+
+from .match_arrays import MatchArrays
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = ["BreakdownColumns", "BreakdownDecoder", "decode_breakdowns"]
+
+# Types of breakdown columns, mapped to the dtype of their arrays and the value of alliances that don't have them
+COLUMN_TYPES = {
+    "bool": ("bool", False),
+    "int": ("int64", 0),
+    "float": ("float64", float("nan")),
+    "category": ("int32", -1),
+}
+
+
+def _flatten(breakdown: typing.Union[dict, list], flat_breakdown: dict[str, typing.Any], prefix: str = "") -> dict:
+    """Flattens a nested score breakdown into `flat_breakdown`, joining keys and list indices with dots."""
+    for key, value in breakdown.items() if isinstance(breakdown, dict) else enumerate(breakdown):
+        if isinstance(value, (dict, list)):
+            _flatten(value, flat_breakdown, f"{prefix}{key}.")
+        else:
+            flat_breakdown[f"{prefix}{key}"] = value
+
+    return flat_breakdown
+
+
+def _column_type(values: list[typing.Any]) -> typing.Optional[str]:
+    """Determines the narrowest column type that fits every value (None if every value is missing)."""
+    value_types = set(map(type, values)) - {type(None)}
+
+    if not value_types:
+        return None
+    elif value_types == {bool}:
+        return "bool"
+    elif value_types <= {bool, int}:
+        return "int"
+    elif value_types <= {bool, int, float}:
+        return "float"
+    else:
+        return "category"
+
+
+def _widen(column_type: typing.Optional[str], values_type: typing.Optional[str]) -> typing.Optional[str]:
+    """Determines the narrowest column type that fits values of both types."""
+    if column_type is None or column_type == values_type:
+        return values_type or column_type
+    elif values_type is None:
+        return column_type
+    elif {column_type, values_type} <= {"bool", "int", "float"}:
+        return "float" if "float" in {column_type, values_type} else "int"
+    else:
+        return "category"
+
+
+@dataclass()
+class BreakdownColumns:
+    """Class representing the score breakdowns of matches as columns, with each column being an array of shape (matches, 2) containing the red alliance's value followed by the blue alliance's."""  # noqa
+
+    match_keys: list[str]
+    teams: "numpy.ndarray"
+    team_index: dict[str, int]
+    columns: dict[str, "numpy.ndarray"]
+    categories: dict[str, list[str]]
+
+    def __getitem__(self, column: str) -> "numpy.ndarray":
+        return self.columns[column]
+
+    def __contains__(self, column: str) -> bool:
+        return column in self.columns
+
+    def __len__(self) -> int:
+        return len(self.match_keys)
+
+    def labels(self, column: str) -> "numpy.ndarray":
+        """
+        Converts a category column (a column of strings, stored as the index of each string in `categories[column]`) back into strings.
+
+        Parameters:
+            column:
+                A string representing the name of the column (eg 'endgameRobot1').
+
+        Returns:
+            An array of shape (matches, 2) containing the strings, with None for alliances that don't have the column.
+        """  # noqa
+        return numpy.array(self.categories[column] + [None], dtype=object)[self.columns[column]]
+
+    def team_averages(self, column: str) -> dict[str, float]:
+        """
+        Averages a numeric column over every alliance each team was on (eg to see which teams' alliances score the most auto points).
+
+        Parameters:
+            column:
+                A string representing the name of the column (eg 'autoPoints').
+
+        Returns:
+            A dictionary mapping each team key to the average value of the column for its alliances, ignoring alliances that don't have the column.
+        """  # noqa
+        values = numpy.broadcast_to(self.columns[column].astype(numpy.float64)[:, :, None], self.teams.shape)
+        counted = (self.teams >= 0) & ~numpy.isnan(values)
+        totals = numpy.bincount(self.teams[counted], weights=values[counted], minlength=len(self.team_index))
+        counts = numpy.bincount(self.teams[counted], minlength=len(self.team_index))
+
+        return {
+            team_key: float(totals[team_num] / counts[team_num])
+            for team_key, team_num in self.team_index.items()
+            if counts[team_num]
+        }
+
+
+class BreakdownDecoder:
+    """Class representing a decoder that converts the score breakdowns of one year's matches into typed columns, keeping the same columns and category codes for every batch of matches of that year."""  # noqa
+
+    _decoders: dict[int, "BreakdownDecoder"] = {}
+
+    def __init__(self, year: int, column_types: typing.Optional[dict[str, str]] = None):
+        """
+        Parameters:
+            year:
+                An integer representing the year of the matches the decoder is for.
+            column_types:
+                A dictionary mapping each column (nested keys joined with dots, eg 'autoReef.topRow.nodeA') to its type ('bool', 'int', 'float' or 'category'). `column_types` is optional, and if not passed in, the columns and their types are inferred from the breakdowns that are decoded. If passed in, only those columns are decoded.
+        """  # noqa
+        if numpy is None:
+            raise ImportError("numpy is required to decode score breakdowns (pip install falcon-alliance[analysis]).")
+
+        self.year = year
+        self.column_types = dict(column_types or {})
+        self.categories: dict[str, list[str]] = {}
+        self.fixed_columns = column_types is not None
+
+        self._category_codes: dict[str, dict[str, int]] = {}
+
+    @classmethod
+    def for_year(cls, year: int) -> "BreakdownDecoder":
+        """
+        Retrieves the decoder of a year, creating it the first time a year is decoded.
+
+        Parameters:
+            year:
+                An integer representing the year of the matches.
+
+        Returns:
+            The BreakdownDecoder object that every match of the year is decoded with.
+        """
+        if year not in cls._decoders:
+            cls._decoders[year] = cls(year)
+
+        return cls._decoders[year]
+
+    @classmethod
+    def register(cls, decoder: "BreakdownDecoder") -> None:
+        """
+        Replaces the decoder of a year (eg with one that has its columns passed in), which is then used by `decode_breakdowns`.
+
+        Parameters:
+            decoder:
+                A BreakdownDecoder object.
+        """  # noqa
+        cls._decoders[decoder.year] = decoder
+
+    def decode(self, matches: typing.Iterable[typing.Any]) -> BreakdownColumns:
+        """
+        Decodes the score breakdowns of matches into columns, walking each breakdown only once.
+
+        Parameters:
+            matches:
+                An iterable of Match objects (or projections of them containing at least `key`, `alliances` and `score_breakdown`) from the decoder's year.
+
+        Returns:
+            A BreakdownColumns object containing every column of the decoder, in the order the matches were passed in. Alliances without a value for a column are filled with False for bool columns, 0 for int columns, NaN for float columns and -1 for category columns.
+        """  # noqa
+        matches = list(matches)
+        team_index = {}
+        match_arrays = MatchArrays.from_matches(matches, team_index, sort=False)
+        flat_breakdowns = [
+            _flatten(((match.score_breakdown or {}).get(color)) or {}, {})
+            for match in matches
+            for color in ("red", "blue")
+        ]
+
+        if not self.fixed_columns:
+            # New columns are added in the order they first appear, after the columns of earlier batches
+            for column in dict.fromkeys(itertools.chain.from_iterable(flat_breakdowns)):
+                self.column_types.setdefault(column, None)
+
+        columns = {}
+
+        for column in self.column_types:
+            values = [flat_breakdown.get(column) for flat_breakdown in flat_breakdowns]
+
+            if not self.fixed_columns:
+                self.column_types[column] = _widen(self.column_types[column], _column_type(values))
+
+            # Columns that only had missing values so far are stored as floats until their type is known
+            dtype, fill_value = COLUMN_TYPES[self.column_types[column] or "float"]
+
+            if self.column_types[column] == "category":
+                category_codes = self._category_codes.setdefault(column, {})
+                categories = self.categories.setdefault(column, [])
+
+                for value in values:
+                    if value is not None and str(value) not in category_codes:
+                        category_codes[str(value)] = len(categories)
+                        categories.append(str(value))
+
+                values = [fill_value if value is None else category_codes[str(value)] for value in values]
+            elif None in values:
+                values = [fill_value if value is None else value for value in values]
+
+            columns[column] = numpy.array(values, dtype=dtype).reshape(len(matches), 2)
+
+        return BreakdownColumns(
+            match_keys=match_arrays.match_keys,
+            teams=match_arrays.teams,
+            team_index=team_index,
+            columns=columns,
+            categories={column: list(categories) for column, categories in self.categories.items()},
+        )
+
+
+def decode_breakdowns(matches: typing.Iterable[typing.Any]) -> dict[int, BreakdownColumns]:
+    """
+    Decodes the score breakdowns of matches from any amount of years, using the decoder of each year.
+
+    Parameters:
+        matches:
+            An iterable of Match objects (or projections of them containing at least `key`, `alliances` and `score_breakdown`).
+
+    Returns:
+        A dictionary mapping each year to a BreakdownColumns object containing that year's matches.
+    """  # noqa
+    matches_by_year = {}
+
+    for match in matches:
+        matches_by_year.setdefault(int(match.key[:4]), []).append(match)
+
+    return {
+        year: BreakdownDecoder.for_year(year).decode(year_matches) for year, year_matches in matches_by_year.items()
+    }
@@ -0,0 +1,373 @@
+import functools
+import math
+import statistics
+import typing
+
+from ..schemas import *
+from .playoffs import BRACKETS, PlayoffType, simulate_bracket
+from .rankings import RankDistribution
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = ["DistrictProjection", "calculate_district_points", "qualification_points"]
+
+# Award types that aren't given district points (Winner, Finalist, Woodie Flowers, Dean's List, Volunteer, Founder's, Bart Kamen and Highest Rookie Seed)  # noqa
+NON_POINT_AWARD_TYPES = frozenset({1, 2, 3, 4, 5, 6, 7, 14})
+
+# District points given for Chairman's/Impact, Engineering Inspiration and Rookie All-Star, with every other award giving 5  # noqa
+AWARD_POINTS = {0: 10, 9: 8, 10: 8}
+
+# District points given to each team of the alliances that finish first through fourth in a double-elimination bracket
+DOUBLE_ELIMINATION_POINTS = (30, 20, 13, 7)
+
+# Index of the series in each double-elimination bracket whose loser finishes third and fourth
+ELIMINATION_SERIES = {PlayoffType.DOUBLE_ELIM_8_TEAM: (12, 11), PlayoffType.DOUBLE_ELIM_4_TEAM: (4, 2)}
+
+# District points given to each team that plays in a playoff match their alliance wins in a best-of-3 bracket
+LEGACY_MATCH_WIN_POINTS = 5
+
+# Types of district points given to each team, in the order TBA returns them
+POINT_TYPES = ("qual_points", "alliance_points", "elim_points", "award_points")
+
+
+def _erfinv(value: float) -> float:
+    """Computes the inverse of the error function."""
+    return statistics.NormalDist().inv_cdf((value + 1) / 2) / math.sqrt(2)
+
+
+@functools.lru_cache(maxsize=None)
+def qualification_points(team_count: int) -> tuple[int, ...]:
+    """
+    Computes the district points given for each qualification rank at an event (between 4 and 22 points).
+
+    Parameters:
+        team_count:
+            An integer representing the amount of teams ranked at the event.
+
+    Returns:
+        A tuple containing the points given to the team at each rank (the first element being rank 1).
+    """
+    alpha = 1.07
+    return tuple(
+        math.ceil(_erfinv((team_count - 2 * rank + 2) / (alpha * team_count)) * (10 / _erfinv(1 / alpha)) + 12)
+        for rank in range(1, team_count + 1)
+    )
+
+
+def _alliance_teams(alliance: Event.Alliance) -> list[str]:
+    """Retrieves every team on an alliance, including the backup team that came in."""
+    return alliance.picks + ([alliance.backup["in"]] if alliance.backup else [])
+
+
+def _double_elimination_places(
+    playoff_type: PlayoffType, alliances: list[Event.Alliance], matches: list[Match]
+) -> dict[int, int]:
+    """Determines which alliances finished first through fourth in a double-elimination bracket from its matches."""
+    bracket = BRACKETS[playoff_type]
+    series_numbers = {series.key: series_num for series_num, series in enumerate(bracket)}
+    alliance_index = {
+        team_key: alliance_num
+        for alliance_num, alliance in enumerate(alliances)
+        for team_key in _alliance_teams(alliance)
+    }
+    wins = [{} for _ in bracket]
+    participants = [set() for _ in bracket]
+
+    for match in matches:
+        series_num = series_numbers.get(f"{match.comp_level}{match.set_number}")
+
+        if series_num is None or not match.alliances:
+            continue
+
+        red, blue = match.alliances["red"], match.alliances["blue"]
+        red_alliance, blue_alliance = (
+            next((alliance_index[team_key] for team_key in color.team_keys if team_key in alliance_index), None)
+            for color in (red, blue)
+        )
+        participants[series_num].update({red_alliance, blue_alliance} - {None})
+
+        if (
+            red.score is not None
+            and blue.score is not None
+            and min(red.score, blue.score) >= 0
+            and red.score != blue.score
+        ):
+            winner = red_alliance if red.score > blue.score else blue_alliance
+            wins[series_num][winner] = wins[series_num].get(winner, 0) + 1
+
+    def result(series_num: int) -> tuple[typing.Optional[int], typing.Optional[int]]:
+        winner = next(
+            (alliance for alliance, count in wins[series_num].items() if count >= bracket[series_num].wins_needed), None
+        )
+        return (winner, next(iter(participants[series_num] - {winner}), None)) if winner is not None else (None, None)
+
+    third_place_series, fourth_place_series = ELIMINATION_SERIES[playoff_type]
+    places = dict(zip(result(len(bracket) - 1), (1, 2)))
+    places[result(third_place_series)[1]] = 3
+    places[result(fourth_place_series)[1]] = 4
+    places.pop(None, None)
+
+    return places
+
+
+def calculate_district_points(
+    rankings: dict[str, Event.Ranking],
+    alliances: list[Event.Alliance],
+    awards: list[Award],
+    matches: list[Match],
+    playoff_type: typing.Optional[int] = None,
+    district_cmp: bool = False,
+) -> Event.DistrictPoints:
+    """
+    Calculates the district points of every team at an event from what happened so far, in the same format as `Event.district_points`.
+
+    Parameters:
+        rankings:
+            A dictionary mapping team keys to their Ranking objects, as retrieved from `Event.rankings`.
+        alliances:
+            A list of Alliance objects in order of their seed, as retrieved from `Event.alliances`.
+        awards:
+            A list of Award objects given at the event, as retrieved from `Event.awards`.
+        matches:
+            A list of Match objects from the event, as retrieved from `Event.matches`.
+        playoff_type:
+            An integer representing the playoff format of the event (`Event.playoff_type`). Double-elimination brackets give points based on where each alliance finishes and other brackets give points for each match won.
+        district_cmp:
+            A boolean representing whether the event is a district championship (`Event.event_type` 2) or one of its divisions (`Event.event_type` 5), where every point is tripled.
+
+    Returns:
+        A DistrictPoints object containing the qualification, alliance, elimination and award points of each team along with their total, and the tiebreakers of each team (their qualification wins and highest qualification scores).
+    """  # noqa
+    multiplier = 3 if district_cmp else 1
+    ranking_points = qualification_points(len(rankings)) if rankings else ()
+    points = {
+        team_key: {
+            **dict.fromkeys(POINT_TYPES, 0),
+            "qual_points": ranking_points[ranking.rank - 1] if ranking.rank else 0,
+        }
+        for team_key, ranking in rankings.items()
+    }
+
+    def team_points(team_key: str) -> dict[str, int]:
+        return points.setdefault(team_key, dict.fromkeys(POINT_TYPES, 0))
+
+    # Captains and first picks get 17 minus their alliance's number, and second picks get their alliance's number
+    for alliance_number, alliance in enumerate(alliances, start=1):
+        for pick_num, team_key in enumerate(alliance.picks[:3]):
+            team_points(team_key)["alliance_points"] = 17 - alliance_number if pick_num < 2 else alliance_number
+
+    if playoff_type in ELIMINATION_SERIES:
+        for alliance_num, place in _double_elimination_places(PlayoffType(playoff_type), alliances, matches).items():
+            for team_key in _alliance_teams(alliances[alliance_num]):
+                team_points(team_key)["elim_points"] = DOUBLE_ELIMINATION_POINTS[place - 1]
+    else:
+        for match in matches:
+            if match.comp_level == "qm" or not match.alliances:
+                continue
+
+            red, blue = match.alliances["red"], match.alliances["blue"]
+
+            if red.score is None or blue.score is None or min(red.score, blue.score) < 0 or red.score == blue.score:
+                continue
+
+            for team_key in (red if red.score > blue.score else blue).team_keys:
+                team_points(team_key)["elim_points"] += LEGACY_MATCH_WIN_POINTS
+
+    for award in awards:
+        if award.award_type in NON_POINT_AWARD_TYPES:
+            continue
+
+        for recipient in award.recipient_list:
+            if recipient.team_key:
+                team_points(recipient.team_key)["award_points"] += AWARD_POINTS.get(award.award_type, 5)
+
+    qual_scores = {}
+
+    for match in matches:
+        if match.comp_level != "qm" or not match.alliances:
+            continue
+
+        for alliance in match.alliances.values():
+            if alliance.score is not None and alliance.score >= 0:
+                for team_key in alliance.team_keys:
+                    qual_scores.setdefault(team_key, []).append(alliance.score)
+
+    for team_points_info in points.values():
+        for point_type in POINT_TYPES:
+            team_points_info[point_type] *= multiplier
+
+        team_points_info["total"] = sum(team_points_info[point_type] for point_type in POINT_TYPES)
+
+    return Event.DistrictPoints(
+        points=points,
+        tiebreakers={
+            team_key: {
+                "highest_qual_scores": sorted(qual_scores.get(team_key, []), reverse=True)[:3],
+                "qual_wins": (rankings[team_key].record or {}).get("wins", 0) if team_key in rankings else 0,
+            }
+            for team_key in points
+        },
+    )
+
+
+class DistrictProjection:
+    """Class representing a Monte Carlo projection of a district's rankings at the end of the season, simulating the district events that haven't finished yet."""  # noqa
+
+    # Maximum amount of district events (excluding the district championship) that count towards a team's ranking
+    COUNTED_EVENTS = 2
+
+    def __init__(
+        self,
+        rankings: list[District.Ranking],
+        remaining_events: dict[str, list[str]],
+        strengths: dict[str, float],
+        year: int,
+        deviation: typing.Optional[float] = None,
+    ):
+        """
+        Parameters:
+            rankings:
+                A list of Ranking objects representing the current district rankings, as retrieved from `District.rankings`.
+            remaining_events:
+                A dictionary mapping the key of each district event that hasn't finished yet (in the order they're played) to the keys of the teams attending it (eg from `Event.teams(keys=True)`). District championships shouldn't be included.
+            strengths:
+                A dictionary mapping team keys to a measure of their strength, such as their OPRs or their Elo ratings (eg from `EloRatings.to_dict`). Teams without one are assumed to be as strong as the average team.
+            year:
+                An integer representing the year of the season, which determines the playoff format (double-elimination since 2023 and best-of-3 brackets before).
+            deviation:
+                A number representing how much a team's performance at an event varies around its strength, on the same scale as the strengths. `deviation` is optional, and if not passed in, the standard deviation of the strengths is used.
+        """  # noqa
+        if numpy is None:
+            raise ImportError("numpy is required for district projections (pip install falcon-alliance[analysis]).")
+
+        self.team_keys = list(
+            dict.fromkeys(
+                [ranking.team_key for ranking in rankings]
+                + [team_key for team_keys in remaining_events.values() for team_key in team_keys]
+            )
+        )
+        self.team_index = {team_key: team_num for team_num, team_key in enumerate(self.team_keys)}
+        self.year = year
+
+        current_rankings = {ranking.team_key: ranking for ranking in rankings}
+        self.points = numpy.array(
+            [
+                current_rankings[team_key].point_total if team_key in current_rankings else 0
+                for team_key in self.team_keys
+            ],
+            dtype=numpy.float64,
+        )
+
+        average_strength = sum(strengths.values()) / len(strengths) if strengths else 0
+        self.strengths = numpy.array([strengths.get(team_key, average_strength) for team_key in self.team_keys])
+        self.deviation = deviation if deviation is not None else float(self.strengths.std()) or 1.0
+
+        # Only the first two district events a team attends count, so teams attending more are only counted in time
+        events_counted = {
+            ranking.team_key: sum(not event_points.get("district_cmp") for event_points in ranking.event_points or [])
+            for ranking in rankings
+        }
+        self.remaining_events = {}
+
+        for event_key, event_team_keys in remaining_events.items():
+            counted = []
+
+            for team_key in event_team_keys:
+                counted.append(events_counted.get(team_key, 0) < self.COUNTED_EVENTS)
+                events_counted[team_key] = events_counted.get(team_key, 0) + 1
+
+            self.remaining_events[event_key] = (
+                numpy.array([self.team_index[team_key] for team_key in event_team_keys], dtype=numpy.int64),
+                numpy.array(counted, dtype=bool),
+            )
+
+    def simulate(self, simulations: int = 10000, seed: typing.Optional[int] = None) -> RankDistribution:
+        """
+        Simulates every remaining event many times and ranks the teams by their district points after each simulation.
+
+        Each simulated event ranks its teams by their strength plus random noise, has the top seeds pick the strongest teams left, simulates the playoffs and gives out district points for all of it. Award points aren't simulated, and ties are broken randomly.
+
+        Parameters:
+            simulations:
+                An integer representing the amount of times to simulate the remaining events.
+            seed:
+                An integer used to seed the random number generator, to get the same results every time.
+
+        Returns:
+            A RankDistribution object containing how many times each team finished at each district rank.
+        """  # noqa
+        generator = numpy.random.default_rng(seed)
+        points = numpy.tile(self.points, (simulations, 1))
+
+        for team_nums, counted in self.remaining_events.values():
+            event_points = self._simulate_event(team_nums, simulations, generator)
+            points[:, team_nums[counted]] += event_points[:, counted]
+
+        order = numpy.lexsort([generator.random(points.shape), -points])
+        return RankDistribution.from_orders(self.team_keys, order)
+
+    def _simulate_event(
+        self, team_nums: "numpy.ndarray", simulations: int, generator: "numpy.random.Generator"
+    ) -> "numpy.ndarray":
+        """Simulates an event and returns the district points each of its teams earned in each simulation."""
+        team_count = len(team_nums)
+        strengths = self.strengths[team_nums]
+        rows = numpy.arange(simulations)[:, None]
+        points = numpy.zeros((simulations, team_count))
+
+        ranks = numpy.argsort(-(strengths + generator.normal(0, self.deviation, (simulations, team_count))), axis=1)
+        numpy.put_along_axis(points, ranks, numpy.array(qualification_points(team_count), dtype=numpy.float64), axis=1)
+
+        alliance_count = 8 if team_count >= 24 else 4 if team_count >= 12 else 0
+
+        if not alliance_count:
+            return points
+
+        # The top seeds pick the strongest teams left, in the order they're picked (first round down, second round up)
+        captains = ranks[:, :alliance_count]
+        pick_values = strengths + generator.normal(0, self.deviation, (simulations, team_count))
+        numpy.put_along_axis(pick_values, captains, -numpy.inf, axis=1)
+        picks = numpy.argsort(-pick_values, axis=1)[:, : alliance_count * 2]
+        alliance_teams = numpy.stack([captains, picks[:, :alliance_count], picks[:, alliance_count:][:, ::-1]], axis=2)
+
+        alliance_numbers = numpy.arange(1, alliance_count + 1)
+        points[rows, alliance_teams[:, :, 0]] += 17 - alliance_numbers
+        points[rows, alliance_teams[:, :, 1]] += 17 - alliance_numbers
+        points[rows, alliance_teams[:, :, 2]] += alliance_numbers
+
+        alliance_strengths = strengths[alliance_teams].sum(axis=2)
+        playoff_type = (
+            (PlayoffType.DOUBLE_ELIM_8_TEAM if alliance_count == 8 else PlayoffType.DOUBLE_ELIM_4_TEAM)
+            if self.year >= 2023
+            else (PlayoffType.BRACKET_8_TEAM if alliance_count == 8 else PlayoffType.BRACKET_4_TEAM)
+        )
+        simulation_nums = numpy.arange(simulations)
+
+        # Each alliance's performance is the sum of three teams', so the difference between two of them varies by sqrt(6) times as much  # noqa
+        def win_probabilities(red: "numpy.ndarray", blue: "numpy.ndarray") -> "numpy.ndarray":
+            differences = alliance_strengths[simulation_nums, red] - alliance_strengths[simulation_nums, blue]
+            return 0.5 * (1 + numpy.vectorize(math.erf)(differences / (self.deviation * math.sqrt(12))))
+
+        winners, losers, loser_wins = simulate_bracket(
+            BRACKETS[playoff_type], win_probabilities, simulations, generator
+        )
+        elim_points = numpy.zeros((simulations, alliance_count))
+
+        if playoff_type in ELIMINATION_SERIES:
+            third_place_series, fourth_place_series = ELIMINATION_SERIES[playoff_type]
+
+            for place, alliances in enumerate(
+                (winners[-1], losers[-1], losers[third_place_series], losers[fourth_place_series]), start=1
+            ):
+                elim_points[simulation_nums, alliances] = DOUBLE_ELIMINATION_POINTS[place - 1]
+        else:
+            for series_num, series in enumerate(BRACKETS[playoff_type]):
+                elim_points[simulation_nums, winners[series_num]] += series.wins_needed * LEGACY_MATCH_WIN_POINTS
+                elim_points[simulation_nums, losers[series_num]] += loser_wins[series_num] * LEGACY_MATCH_WIN_POINTS
+
+        points[rows[:, :, None], alliance_teams] += elim_points[:, :, None]
+
+        return points
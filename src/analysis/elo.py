@@ -0,0 +1,126 @@
+import typing
+
+from .match_arrays import MatchArrays
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = ["EloRatings"]
+
+
+class EloRatings:
+    """Class representing Elo ratings of teams, stored in an array indexed by team and updated by replaying matches in the order they were played."""  # noqa
+
+    def __init__(
+        self,
+        k: float = 12.0,
+        initial_rating: float = 1500.0,
+        year_regression: float = 0.2,
+        scale: float = 400.0,
+    ):
+        """
+        Parameters:
+            k:
+                A number representing how much each team's rating changes after a match it wasn't expected to win (or lose).
+            initial_rating:
+                A number representing the rating of a team that hasn't played a match yet, which is also the mean ratings are regressed towards.
+            year_regression:
+                A number between 0 and 1 representing how much every rating is regressed towards `initial_rating` at the start of each year (0 to keep ratings as is and 1 to reset them).
+            scale:
+                A number representing the difference in rating at which an alliance is 10 times as likely to win as the other alliance.
+        """  # noqa
+        if numpy is None:
+            raise ImportError("numpy is required for Elo ratings (pip install falcon-alliance[analysis]).")
+
+        self.k = k
+        self.initial_rating = initial_rating
+        self.year_regression = year_regression
+        self.scale = scale
+
+        self.team_index: dict[str, int] = {}
+        self.ratings = numpy.zeros(0)
+        self.year: typing.Optional[int] = None
+        self.matches_played = 0
+
+    def __getitem__(self, team_key: str) -> float:
+        if team_key not in self.team_index:
+            return self.initial_rating
+
+        return float(self.ratings[self.team_index[team_key]])
+
+    def __len__(self) -> int:
+        return len(self.team_index)
+
+    def to_dict(self) -> dict[str, float]:
+        """Returns a dictionary mapping each team key to its rating."""
+        return dict(zip(self.team_index, self.ratings.tolist()))
+
+    def update(self, matches: typing.Union[typing.Iterable[typing.Any], MatchArrays]) -> None:
+        """
+        Updates the ratings with the results of matches, which are replayed in the order they were played.
+
+        Every match that doesn't depend on the result of another remaining match is updated at once, which gives the same ratings as updating them one by one.
+
+        Parameters:
+            matches:
+                An iterable of Match objects (eg from `Team.matches` or `Season.matches.values()`; projections with `fields=['key', 'alliances', 'actual_time', 'time']` also work) or a MatchArrays object created with `self.team_index`. Matches that weren't played are skipped.
+        """  # noqa
+        match_arrays = (
+            matches if isinstance(matches, MatchArrays) else MatchArrays.from_matches(matches, self.team_index)
+        )
+        match_arrays = match_arrays[match_arrays.played]
+        self._add_teams()
+
+        # Sorting the matches by batch makes every batch a contiguous slice of the arrays
+        batches = match_arrays.dependency_batches()
+        order = numpy.concatenate(batches) if batches else numpy.zeros(0, dtype=numpy.int64)
+        teams, years, outcomes = match_arrays.teams[order], match_arrays.years[order], match_arrays.outcomes[order]
+        boundaries = numpy.cumsum([0] + [len(batch) for batch in batches]).tolist()
+
+        # The padding in `teams` (-1) indexes an extra rating of 0 at the end of the array
+        ratings = numpy.append(self.ratings, 0.0)
+        alliance_signs = numpy.array([[1.0], [-1.0]])
+
+        for start, end in zip(boundaries, boundaries[1:]):
+            batch_year = int(years[start])
+
+            if self.year is not None and batch_year > self.year:
+                ratings[:-1] += (self.initial_rating - ratings[:-1]) * self.year_regression
+
+            self.year = max(batch_year, self.year or batch_year)
+
+            batch_teams = teams[start:end]
+            alliance_ratings = ratings[batch_teams].sum(axis=2)
+            win_probabilities = 1 / (1 + 10 ** ((alliance_ratings[:, 1] - alliance_ratings[:, 0]) / self.scale))
+
+            # The red alliance gains what the blue alliance loses, and no team plays twice in a batch
+            ratings[batch_teams] += (self.k * (outcomes[start:end] - win_probabilities))[:, None, None] * alliance_signs
+            ratings[-1] = 0.0
+
+        self.ratings = ratings[:-1]
+        self.matches_played += len(match_arrays)
+
+    def win_probabilities(self, teams: "numpy.ndarray") -> "numpy.ndarray":
+        """
+        Computes the probability of the red alliance winning each match based off the current ratings.
+
+        Parameters:
+            teams:
+                An integer array of shape (matches, 2, teams per alliance) containing the index of each team in `self.team_index` (padded with -1), such as `MatchArrays.teams`.
+
+        Returns:
+            An array containing the probability of the red alliance winning each match.
+        """  # noqa
+        self._add_teams()
+        alliance_ratings = numpy.where(teams >= 0, self.ratings[teams], 0).sum(axis=2)
+
+        return 1 / (1 + 10 ** ((alliance_ratings[:, 1] - alliance_ratings[:, 0]) / self.scale))
+
+    def _add_teams(self) -> None:
+        """Extends the ratings array with the initial rating of teams that were added to `self.team_index`."""
+        if len(self.team_index) > len(self.ratings):
+            self.ratings = numpy.concatenate(
+                [self.ratings, numpy.full(len(self.team_index) - len(self.ratings), self.initial_rating)]
+            )
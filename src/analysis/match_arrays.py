@@ -0,0 +1,167 @@
+import datetime
+import re
+import typing
+from dataclasses import dataclass
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = ["MatchArrays"]
+
+# Order comp levels are played in during an event, used to sort matches that don't have a time
+COMP_LEVEL_ORDER = {"qm": 0, "ef": 1, "qf": 2, "sf": 3, "f": 4}
+
+
+@dataclass()
+class MatchArrays:
+    """
+    Class representing matches as arrays indexed by match, with teams replaced by their index in a team index.
+
+    Alliances are stored red first and blue second along the second axis of `teams` and `scores`.
+    """
+
+    match_keys: list[str]
+    years: "numpy.ndarray"
+    teams: "numpy.ndarray"
+    scores: "numpy.ndarray"
+
+    @classmethod
+    def from_matches(
+        cls, matches: typing.Iterable[typing.Any], team_index: dict[str, int], sort: bool = True
+    ) -> "MatchArrays":
+        """
+        Converts matches into arrays.
+
+        Parameters:
+            matches:
+                An iterable of Match objects (or projections of them containing at least `key` and `alliances`).
+            team_index:
+                A dictionary mapping team keys to their index, which teams that aren't in it yet are added to.
+            sort:
+                A boolean representing whether the matches should be sorted in the order they were played (by `actual_time`, then `time`, then by key).
+
+        Returns:
+            A MatchArrays object where `teams` is an integer array of shape (matches, 2, teams per alliance) padded with -1 and `scores` is an array of shape (matches, 2) with -1 for matches that weren't played.
+        """  # noqa
+        if numpy is None:
+            raise ImportError("numpy is required for match analysis (pip install falcon-alliance[analysis]).")
+
+        matches = list(matches)
+
+        if sort:
+            matches.sort(key=cls.chronological_key)
+
+        alliances = [(match.alliances["red"], match.alliances["blue"]) for match in matches]
+        alliance_size = max(
+            (len(match_alliance.team_keys) for match_alliances in alliances for match_alliance in match_alliances),
+            default=0,
+        )
+        padding = [-1] * alliance_size
+        teams = numpy.array(
+            [
+                [
+                    ([team_index.setdefault(team_key, len(team_index)) for team_key in red.team_keys] + padding)[
+                        :alliance_size
+                    ],
+                    ([team_index.setdefault(team_key, len(team_index)) for team_key in blue.team_keys] + padding)[
+                        :alliance_size
+                    ],
+                ]
+                for red, blue in alliances
+            ],
+            dtype=numpy.int64,
+        ).reshape(len(matches), 2, alliance_size)
+        scores = numpy.array(
+            [
+                [-1 if red.score is None else red.score, -1 if blue.score is None else blue.score]
+                for red, blue in alliances
+            ],
+            dtype=numpy.float64,
+        ).reshape(len(matches), 2)
+
+        return cls(
+            match_keys=[match.key for match in matches],
+            years=numpy.array([int(match.key[:4]) for match in matches], dtype=numpy.int64),
+            teams=teams,
+            scores=scores,
+        )
+
+    @staticmethod
+    def chronological_key(match: typing.Any) -> tuple:
+        """
+        Computes the key matches are sorted by to replay them in the order they were played.
+
+        Parameters:
+            match:
+                A Match object (or a projection of one).
+
+        Returns:
+            A tuple of the match's year, the time it was played (infinity if unknown) and its position within its event.
+        """
+        played_time = getattr(match, "actual_time", None) or getattr(match, "time", None)
+        comp_level = getattr(match, "comp_level", None) or re.match(r"[a-z]+", match.key.split("_")[-1])[0]
+
+        return (
+            int(match.key[:4]),
+            played_time.timestamp() if isinstance(played_time, datetime.datetime) else float("inf"),
+            match.key.split("_")[0],
+            COMP_LEVEL_ORDER.get(comp_level, len(COMP_LEVEL_ORDER)),
+            getattr(match, "set_number", None) or 0,
+            getattr(match, "match_number", None) or 0,
+        )
+
+    def __len__(self) -> int:
+        return len(self.match_keys)
+
+    def __getitem__(self, index: typing.Union[slice, "numpy.ndarray"]) -> "MatchArrays":
+        return MatchArrays(
+            match_keys=list(numpy.array(self.match_keys, dtype=object)[index]),
+            years=self.years[index],
+            teams=self.teams[index],
+            scores=self.scores[index],
+        )
+
+    @property
+    def played(self) -> "numpy.ndarray":
+        """A boolean array representing which matches have been played."""
+        return (self.scores >= 0).all(axis=1)
+
+    @property
+    def outcomes(self) -> "numpy.ndarray":
+        """An array representing the result of each match for the red alliance (1 for a win, 0.5 for a tie and 0 for a loss)."""  # noqa
+        return numpy.sign(self.scores[:, 0] - self.scores[:, 1]) * 0.5 + 0.5
+
+    def dependency_batches(self) -> list["numpy.ndarray"]:
+        """
+        Groups the matches into batches that can each be processed at once while giving the same result as processing every match one by one in order.
+
+        A match is put in the batch after the latest batch any of its teams played in, so no team plays twice in a batch and every team's matches stay in order. Batches never contain matches from different years.
+
+        Returns:
+            A list of integer arrays containing the indices of the matches in each batch, in the order the batches should be processed.
+        """  # noqa
+        levels = numpy.zeros(len(self), dtype=numpy.int64)
+        team_levels = {}
+        year_start_level = 0
+        current_year = None
+
+        for match_num, (match_teams, year) in enumerate(
+            zip(self.teams.reshape(len(self), -1).tolist(), self.years.tolist())
+        ):
+            if year != current_year:
+                year_start_level = int(levels[:match_num].max(initial=-1)) + 1
+                current_year = year
+
+            match_teams = [team for team in match_teams if team >= 0]
+            level = max([team_levels.get(team, -1) + 1 for team in match_teams] + [year_start_level])
+            levels[match_num] = level
+
+            for team in match_teams:
+                team_levels[team] = level
+
+        order = numpy.argsort(levels, kind="stable")
+        boundaries = numpy.flatnonzero(numpy.diff(levels[order])) + 1
+
+        return numpy.split(order, boundaries) if len(self) else []
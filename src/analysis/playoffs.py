@@ -0,0 +1,434 @@
+import concurrent.futures
+import copy
+import enum
+import math
+import typing
+from dataclasses import dataclass
+
+from ..schemas import *
+from .elo import EloRatings
+from .rankings import RankingSimulator
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = ["BRACKETS", "PlayoffDistribution", "PlayoffSimulator", "PlayoffType", "Series", "simulate_bracket"]
+
+
+class PlayoffType(enum.IntEnum):
+    """Enum representing the playoff formats TBA assigns to events (`Event.playoff_type`) that can be simulated (TBA's other formats, such as custom brackets, can't be)."""  # noqa
+
+    BRACKET_8_TEAM = 0
+    BRACKET_16_TEAM = 1
+    BRACKET_4_TEAM = 2
+    BO5_FINALS = 6
+    BO3_FINALS = 7
+    BRACKET_2_TEAM = 9
+    DOUBLE_ELIM_8_TEAM = 10
+    DOUBLE_ELIM_4_TEAM = 11
+
+
+@dataclass(frozen=True)
+class Series:
+    """
+    Class representing a series of matches between two alliances in a playoff bracket.
+
+    `red` and `blue` are where each alliance comes from: a tuple of 'seed' and an alliance number or a tuple of 'winner' or 'loser' and the index of an earlier series in the bracket.
+    """  # noqa
+
+    comp_level: str
+    set_number: int
+    red: tuple[str, int]
+    blue: tuple[str, int]
+    wins_needed: int
+
+    @property
+    def key(self) -> str:
+        """The key of the series within its event (eg 'sf1'), which the keys of its matches start with."""
+        return f"{self.comp_level}{self.set_number}"
+
+
+def _single_elimination(alliance_count: int, wins_needed: int = 2) -> list[Series]:
+    """Creates a bracket where alliances are eliminated after losing a series (best-of-3 unless `wins_needed` says otherwise)."""  # noqa
+    seeds = [1, 2]
+
+    # Each seed plays the seed that adds up to one more than the alliance count, and the top seeds meet as late as possible  # noqa
+    while len(seeds) < alliance_count:
+        seeds = [seed for top_seed in seeds for seed in (top_seed, len(seeds) * 2 + 1 - top_seed)]
+
+    comp_levels = ["f", "sf", "qf", "ef"][: int(math.log2(alliance_count))][::-1]
+    bracket = [
+        Series(comp_levels[0], set_number, ("seed", red), ("seed", blue), wins_needed)
+        for set_number, (red, blue) in enumerate(zip(seeds[::2], seeds[1::2]), start=1)
+    ]
+    round_start = 0
+
+    for comp_level in comp_levels[1:]:
+        round_end = len(bracket)
+        bracket.extend(
+            Series(comp_level, set_number, ("winner", red), ("winner", red + 1), wins_needed)
+            for set_number, red in enumerate(range(round_start, round_end, 2), start=1)
+        )
+        round_start = round_end
+
+    return bracket
+
+
+def _double_elimination(alliance_count: int) -> list[Series]:
+    """Creates the bracket introduced in 2023, where alliances are eliminated after losing twice and the finals are best-of-3."""  # noqa
+    if alliance_count == 8:
+        upper_final = 10
+        matches = [
+            (("seed", 1), ("seed", 8)),
+            (("seed", 4), ("seed", 5)),
+            (("seed", 2), ("seed", 7)),
+            (("seed", 3), ("seed", 6)),
+            (("loser", 0), ("loser", 1)),
+            (("loser", 2), ("loser", 3)),
+            (("winner", 0), ("winner", 1)),
+            (("winner", 2), ("winner", 3)),
+            (("loser", 6), ("winner", 5)),
+            (("loser", 7), ("winner", 4)),
+            (("winner", 6), ("winner", 7)),
+            (("winner", 9), ("winner", 8)),
+            (("loser", 10), ("winner", 11)),
+        ]
+    else:
+        upper_final = 3
+        matches = [
+            (("seed", 1), ("seed", 4)),
+            (("seed", 2), ("seed", 3)),
+            (("loser", 0), ("loser", 1)),
+            (("winner", 0), ("winner", 1)),
+            (("loser", 3), ("winner", 2)),
+        ]
+
+    return [Series("sf", set_number, red, blue, 1) for set_number, (red, blue) in enumerate(matches, start=1)] + [
+        Series("f", 1, ("winner", upper_final), ("winner", len(matches) - 1), 2)
+    ]
+
+
+BRACKETS = {
+    PlayoffType.BRACKET_16_TEAM: _single_elimination(16),
+    PlayoffType.BRACKET_8_TEAM: _single_elimination(8),
+    PlayoffType.BRACKET_4_TEAM: _single_elimination(4),
+    PlayoffType.BRACKET_2_TEAM: _single_elimination(2),
+    PlayoffType.BO3_FINALS: _single_elimination(2),
+    PlayoffType.BO5_FINALS: _single_elimination(2, wins_needed=3),
+    PlayoffType.DOUBLE_ELIM_8_TEAM: _double_elimination(8),
+    PlayoffType.DOUBLE_ELIM_4_TEAM: _double_elimination(4),
+}
+
+
+def simulate_bracket(
+    bracket: list[Series],
+    win_probabilities: typing.Callable[["numpy.ndarray", "numpy.ndarray"], "numpy.ndarray"],
+    simulations: int,
+    generator: "numpy.random.Generator",
+    results: typing.Optional["numpy.ndarray"] = None,
+) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+    """
+    Simulates a bracket many times at once, one series at a time.
+
+    Parameters:
+        bracket:
+            A list of Series objects in the order they're played (eg `BRACKETS[PlayoffType.DOUBLE_ELIM_8_TEAM]`).
+        win_probabilities:
+            A function that takes two integer arrays containing the index of the red and blue alliance (0 for the first seed) in each simulation and returns the probability of the red alliance winning a match in each simulation.
+        simulations:
+            An integer representing the amount of times to simulate the bracket.
+        generator:
+            A numpy Generator object used to simulate the matches.
+        results:
+            An integer array of shape (series, alliances) containing the amount of matches each alliance already won in each series.
+
+    Returns:
+        A tuple of three arrays of shape (series, simulations) containing the index of the alliance that won each series, the index of the alliance that lost it and the amount of matches the losing alliance won.
+    """  # noqa
+    winners = numpy.empty((len(bracket), simulations), dtype=numpy.int64)
+    losers = numpy.empty((len(bracket), simulations), dtype=numpy.int64)
+    loser_wins = numpy.empty((len(bracket), simulations), dtype=numpy.int64)
+
+    for series_num, series in enumerate(bracket):
+        red, blue = (
+            numpy.full(simulations, source_num - 1)
+            if source == "seed"
+            else (winners if source == "winner" else losers)[source_num]
+            for source, source_num in (series.red, series.blue)
+        )
+        red_wins, blue_wins = (
+            (results[series_num, red], results[series_num, blue])
+            if results is not None
+            else (numpy.zeros(simulations, dtype=numpy.int64),) * 2
+        )
+
+        # Every match that could be left is simulated, and the series ends once an alliance has won enough of them
+        match_wins = generator.random((simulations, series.wins_needed * 2 - 1)) < win_probabilities(red, blue)[:, None]
+        red_totals = red_wins[:, None] + numpy.cumsum(match_wins, axis=1)
+        blue_totals = blue_wins[:, None] + numpy.cumsum(~match_wins, axis=1)
+        last_match = ((red_totals >= series.wins_needed) | (blue_totals >= series.wins_needed)).argmax(axis=1)
+        decided = (red_wins >= series.wins_needed) | (blue_wins >= series.wins_needed)
+        red_wins = numpy.where(decided, red_wins, red_totals[numpy.arange(simulations), last_match])
+        blue_wins = numpy.where(decided, blue_wins, blue_totals[numpy.arange(simulations), last_match])
+
+        red_won = red_wins > blue_wins
+        winners[series_num] = numpy.where(red_won, red, blue)
+        losers[series_num] = numpy.where(red_won, blue, red)
+        loser_wins[series_num] = numpy.minimum(red_wins, blue_wins)
+
+    return winners, losers, loser_wins
+
+
+@dataclass()
+class PlayoffDistribution:
+    """Class representing how many times each alliance played in and won each series over many simulations of a playoff bracket."""  # noqa
+
+    alliance_names: list[str]
+    series_keys: list[str]
+    played: "numpy.ndarray"
+    won: "numpy.ndarray"
+    simulations: int
+
+    def reach_probabilities(self, series_key: str) -> dict[str, float]:
+        """
+        Computes the probability of each alliance playing in a series (eg 'f1' to reach the finals).
+
+        Parameters:
+            series_key:
+                A string representing the key of the series (eg 'sf13' or 'f1').
+
+        Returns:
+            A dictionary mapping each alliance's name to the probability of it playing in the series.
+        """
+        return dict(
+            zip(self.alliance_names, (self.played[:, self.series_keys.index(series_key)] / self.simulations).tolist())
+        )
+
+    def win_probabilities(self, series_key: typing.Optional[str] = None) -> dict[str, float]:
+        """
+        Computes the probability of each alliance winning a series.
+
+        Parameters:
+            series_key:
+                A string representing the key of the series (eg 'sf1'). `series_key` is optional, and if not passed in, the probability of winning the event (the last series) is computed.
+
+        Returns:
+            A dictionary mapping each alliance's name to the probability of it winning the series.
+        """  # noqa
+        series_num = self.series_keys.index(series_key) if series_key else -1
+        return dict(zip(self.alliance_names, (self.won[:, series_num] / self.simulations).tolist()))
+
+
+class PlayoffSimulator:
+    """Class representing a Monte Carlo simulation of an event's playoff bracket, which can be updated with the results of playoff matches as they're played."""  # noqa
+
+    # Maximum amount of simulations run at once by a process, which bounds the memory used by each of them
+    CHUNK_SIZE = 100000
+
+    def __init__(
+        self,
+        playoff_type: int,
+        alliances: list[Event.Alliance],
+        oprs: typing.Optional[dict[str, float]] = None,
+        elo: typing.Optional[EloRatings] = None,
+        matches: typing.Optional[list[Match]] = None,
+        score_deviation: typing.Optional[float] = None,
+    ):
+        """
+        Parameters:
+            playoff_type:
+                An integer representing the playoff format of the event (`Event.playoff_type`); see PlayoffType for the formats that are supported.
+            alliances:
+                A list of Alliance objects in order of their seed, as retrieved from `Event.alliances`.
+            oprs:
+                A dictionary mapping team keys to their OPRs (eg `Event.oprs().oprs`), where the strength of an alliance is the sum of the OPRs of the three teams that play. Mutually exclusive with `elo`.
+            elo:
+                An EloRatings object used to compute the probability of each alliance beating each other alliance. Mutually exclusive with `oprs`.
+            matches:
+                A list of Match objects from the event. The results of playoff matches that were played are applied to the bracket (see `PlayoffSimulator.update`) and the other matches are used to estimate `score_deviation`.
+            score_deviation:
+                A number representing the standard deviation of an alliance's score around the sum of its teams' OPRs. `score_deviation` is optional, and if not passed in, it's estimated from `matches`.
+        """  # noqa
+        if numpy is None:
+            raise ImportError("numpy is required for playoff simulations (pip install falcon-alliance[analysis]).")
+        elif (oprs is None) == (elo is None):
+            raise ValueError("Exactly one of oprs and elo must be passed in to simulate matches.")
+
+        try:
+            self.playoff_type = PlayoffType(playoff_type)
+        except ValueError:
+            raise ValueError(f"Playoff type {playoff_type} isn't supported.") from None
+
+        self.bracket = BRACKETS[self.playoff_type]
+        self.alliance_names = [alliance.name or f"Alliance {seed}" for seed, alliance in enumerate(alliances, start=1)]
+        self.alliance_teams = [self._playing_teams(alliance) for alliance in alliances]
+        self.alliance_index = {
+            team_key: alliance_num
+            for alliance_num, alliance in enumerate(alliances)
+            for team_key in alliance.picks + ([alliance.backup["in"]] if alliance.backup else [])
+        }
+
+        if oprs is not None:
+            score_deviation = (
+                score_deviation
+                if score_deviation is not None
+                else RankingSimulator._estimate_score_deviation(oprs, matches or [])
+            )
+            strengths = numpy.array([sum(oprs.get(team_key, 0) for team_key in teams) for teams in self.alliance_teams])
+            score_differences = strengths[:, None] - strengths[None, :]
+
+            # Both alliances' scores vary independently, so the difference between them varies by sqrt(2) times as much
+            self.win_probabilities = 0.5 * (1 + numpy.vectorize(math.erf)(score_differences / (2 * score_deviation)))
+        else:
+            # Teams that haven't played a match yet are added to a copy, so the ratings passed in aren't modified
+            elo = copy.copy(elo)
+            elo.team_index = dict(elo.team_index)
+            padding = [-1] * max(map(len, self.alliance_teams), default=0)
+            alliance_teams = [
+                ([elo.team_index.setdefault(team_key, len(elo.team_index)) for team_key in teams] + padding)[
+                    : len(padding)
+                ]
+                for teams in self.alliance_teams
+            ]
+            self.win_probabilities = elo.win_probabilities(
+                numpy.array(
+                    [[red, blue] for red in alliance_teams for blue in alliance_teams], dtype=numpy.int64
+                ).reshape(len(alliances) ** 2, 2, len(padding))
+            ).reshape(len(alliances), len(alliances))
+
+        # The amount of matches each alliance won in each series
+        self.results = numpy.zeros((len(self.bracket), len(alliances)), dtype=numpy.int64)
+        self._match_results: dict[str, tuple[int, int]] = {}
+        self.update(matches or [])
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: Event.Snapshot, elo: typing.Optional[EloRatings] = None, **kwargs
+    ) -> "PlayoffSimulator":
+        """
+        Creates a simulator from a snapshot of an event (see `Event.snapshot`), with alliances' strengths based off their teams' OPRs at the event unless Elo ratings are passed in.
+
+        Parameters:
+            snapshot:
+                A Snapshot object representing the event after alliance selection.
+            elo:
+                An EloRatings object used to compute the probability of each alliance beating each other alliance instead of the OPRs.
+            kwargs:
+                The other parameters passed into the simulator (`score_deviation`).
+
+        Returns:
+            A PlayoffSimulator object with the results of the playoff matches that were played applied to it.
+        """  # noqa
+        return cls(
+            playoff_type=snapshot.event.playoff_type,
+            alliances=snapshot.alliances,
+            oprs=snapshot.oprs.oprs if elo is None else None,
+            elo=elo,
+            matches=snapshot.matches,
+            **kwargs,
+        )
+
+    def update(self, matches: typing.Iterable[Match]) -> None:
+        """
+        Applies the results of playoff matches to the bracket, so that future simulations only simulate what's left of it.
+
+        Matches can be passed in again as they're updated (eg from `EventWatcher`), and ties or matches that weren't played are ignored since they're replayed.
+
+        Parameters:
+            matches:
+                An iterable of Match objects from the event. Qualification matches and matches without a series in the bracket are ignored.
+        """  # noqa
+        series_numbers = {series.key: series_num for series_num, series in enumerate(self.bracket)}
+
+        for match in matches:
+            series_num = series_numbers.get(f"{match.comp_level}{match.set_number}")
+
+            if series_num is None or not match.alliances:
+                continue
+            elif match.key in self._match_results:
+                self.results[self._match_results.pop(match.key)] -= 1
+
+            red, blue = match.alliances["red"], match.alliances["blue"]
+
+            if red.score is None or blue.score is None or min(red.score, blue.score) < 0 or red.score == blue.score:
+                continue
+
+            winner = next(
+                (
+                    self.alliance_index[team_key]
+                    for team_key in (red if red.score > blue.score else blue).team_keys
+                    if team_key in self.alliance_index
+                ),
+                None,
+            )
+
+            if winner is not None:
+                self._match_results[match.key] = (series_num, winner)
+                self.results[series_num, winner] += 1
+
+    def simulate(
+        self, simulations: int = 10000, processes: typing.Optional[int] = 1, seed: typing.Optional[int] = None
+    ) -> PlayoffDistribution:
+        """
+        Simulates what's left of the bracket many times.
+
+        Parameters:
+            simulations:
+                An integer representing the amount of times to simulate the bracket.
+            processes:
+                An integer representing the maximum amount of processes to run the simulations in. Since a bracket is small, one process can simulate over a million brackets per second, so the simulations are only split across processes if a larger amount is passed in (or None to use every CPU).
+            seed:
+                An integer used to seed the random number generator, to get the same results every time (regardless of the amount of processes).
+
+        Returns:
+            A PlayoffDistribution object containing how many times each alliance played in and won each series.
+        """  # noqa
+        chunk_sizes = [min(self.CHUNK_SIZE, simulations - start) for start in range(0, simulations, self.CHUNK_SIZE)]
+        seeds = numpy.random.SeedSequence(seed).spawn(len(chunk_sizes))
+
+        if processes == 1 or len(chunk_sizes) <= 1:
+            chunk_counts = list(map(self._simulate_chunk, chunk_sizes, seeds))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+                chunk_counts = list(executor.map(self._simulate_chunk, chunk_sizes, seeds))
+
+        played, won = (sum(counts) for counts in zip(*chunk_counts)) if chunk_counts else (0, 0)
+        return PlayoffDistribution(
+            alliance_names=self.alliance_names,
+            series_keys=[series.key for series in self.bracket],
+            played=played,
+            won=won,
+            simulations=simulations,
+        )
+
+    def _simulate_chunk(
+        self, simulations: int, seed: "numpy.random.SeedSequence"
+    ) -> tuple["numpy.ndarray", "numpy.ndarray"]:
+        """Runs a chunk of simulations and returns how many times each alliance played in and won each series."""
+        generator = numpy.random.default_rng(seed)
+        alliance_count = len(self.alliance_names)
+        winners, losers, _ = simulate_bracket(
+            self.bracket, lambda red, blue: self.win_probabilities[red, blue], simulations, generator, self.results
+        )
+        played = numpy.zeros((alliance_count, len(self.bracket)), dtype=numpy.int64)
+        won = numpy.zeros((alliance_count, len(self.bracket)), dtype=numpy.int64)
+
+        for series_num in range(len(self.bracket)):
+            played[:, series_num] = numpy.bincount(winners[series_num], minlength=alliance_count) + numpy.bincount(
+                losers[series_num], minlength=alliance_count
+            )
+            won[:, series_num] = numpy.bincount(winners[series_num], minlength=alliance_count)
+
+        return played, won
+
+    @staticmethod
+    def _playing_teams(alliance: Event.Alliance) -> list[str]:
+        """Retrieves the three teams that play for an alliance, with the backup team replacing the team it came in for."""  # noqa
+        teams = alliance.picks[:3]
+
+        if alliance.backup and alliance.backup.get("out") in teams:
+            teams = [alliance.backup["in"] if team_key == alliance.backup["out"] else team_key for team_key in teams]
+
+        return teams
@@ -0,0 +1,336 @@
+import abc
+import math
+import typing
+from dataclasses import dataclass
+
+from .elo import EloRatings
+from .match_arrays import MatchArrays
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = ["EloPredictor", "LogisticPredictor", "MatchPredictions", "MatchPredictor", "OPRPredictor"]
+
+
+def _logit(probabilities: "numpy.ndarray") -> "numpy.ndarray":
+    """Converts probabilities into log-odds, clipping them so that certain outcomes stay finite."""
+    probabilities = numpy.clip(probabilities, 1e-6, 1 - 1e-6)
+    return numpy.log(probabilities / (1 - probabilities))
+
+
+def _sigmoid(log_odds: "numpy.ndarray") -> "numpy.ndarray":
+    """Converts log-odds into probabilities."""
+    return 0.5 * (1 + numpy.tanh(log_odds / 2))
+
+
+@dataclass()
+class MatchPredictions:
+    """Class representing the predicted outcome of a batch of matches, with arrays indexed in the order the matches were passed in."""  # noqa
+
+    match_keys: list[str]
+    red_win_probabilities: "numpy.ndarray"
+    red_scores: "numpy.ndarray"
+    blue_scores: "numpy.ndarray"
+
+    def __getitem__(self, match_key: str) -> dict[str, dict[str, float]]:
+        match_num = self.match_keys.index(match_key)
+        return {
+            "red": {
+                "win_probability": float(self.red_win_probabilities[match_num]),
+                "score": float(self.red_scores[match_num]),
+            },
+            "blue": {
+                "win_probability": float(1 - self.red_win_probabilities[match_num]),
+                "score": float(self.blue_scores[match_num]),
+            },
+        }
+
+    def __len__(self) -> int:
+        return len(self.match_keys)
+
+    def to_dict(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Returns a dictionary mapping each match key to the predicted win probability and score of each alliance."""
+        return {match_key: self[match_key] for match_key in self.match_keys}
+
+
+class MatchPredictor(abc.ABC):
+    """Base class for models that are trained on matches that were played and predict the outcome of batches of matches at once."""  # noqa
+
+    def __init__(self):
+        self.team_index: dict[str, int] = {}
+        self.calibration = (1.0, 0.0)
+
+    def fit(self, matches: typing.Iterable[typing.Any]) -> "MatchPredictor":
+        """
+        Trains the model on matches that were played.
+
+        Parameters:
+            matches:
+                An iterable of Match objects (or projections of them containing at least `key` and `alliances`). Matches that weren't played are skipped.
+
+        Returns:
+            The predictor itself, so that it can be chained (eg `OPRPredictor().fit(matches).predict(schedule)`).
+        """  # noqa
+        match_arrays = MatchArrays.from_matches(matches, self.team_index)
+        self._fit(match_arrays[match_arrays.played])
+
+        return self
+
+    def predict(self, matches: typing.Iterable[typing.Any]) -> MatchPredictions:
+        """
+        Predicts the outcome of matches (eg an event's whole schedule) with vectorized operations.
+
+        Parameters:
+            matches:
+                An iterable of Match objects (or projections of them containing at least `key` and `alliances`), which don't need to have been played.
+
+        Returns:
+            A MatchPredictions object containing the calibrated probability of the red alliance winning each match and each alliance's predicted score (NaN if the model doesn't predict scores).
+        """  # noqa
+        match_arrays = MatchArrays.from_matches(matches, self.team_index, sort=False)
+        red_win_probabilities, red_scores, blue_scores = self._predict(match_arrays)
+
+        return MatchPredictions(
+            match_keys=match_arrays.match_keys,
+            red_win_probabilities=self._calibrated(red_win_probabilities),
+            red_scores=red_scores,
+            blue_scores=blue_scores,
+        )
+
+    def calibrate(self, matches: typing.Iterable[typing.Any], iterations: int = 25) -> "MatchPredictor":
+        """
+        Calibrates the predicted win probabilities with Platt scaling, fitting a logistic regression of the outcomes of matches on the log-odds the model predicted for them. The matches should be different from the ones the model was trained on.
+
+        Parameters:
+            matches:
+                An iterable of Match objects that were played. Ties count as half a win for each alliance.
+            iterations:
+                An integer representing the maximum amount of Newton's method iterations used to fit the regression.
+
+        Returns:
+            The predictor itself, so that it can be chained.
+        """  # noqa
+        match_arrays = MatchArrays.from_matches(matches, self.team_index, sort=False)
+        match_arrays = match_arrays[match_arrays.played]
+        features = numpy.stack([_logit(self._predict(match_arrays)[0]), numpy.ones(len(match_arrays))], axis=1)
+        outcomes = match_arrays.outcomes
+
+        # Platt's smoothed targets keep the fit from becoming infinitely confident when few matches were passed in
+        wins, losses = (outcomes == 1).sum(), (outcomes == 0).sum()
+        outcomes = numpy.where(
+            outcomes == 1, (wins + 1) / (wins + 2), numpy.where(outcomes == 0, 1 / (losses + 2), 0.5)
+        )
+        coefficients = numpy.array([1.0, 0.0])
+
+        def log_likelihood(coefficients: "numpy.ndarray") -> float:
+            log_odds = features @ coefficients
+            return float((outcomes * log_odds - numpy.logaddexp(0, log_odds)).sum())
+
+        # Newton's method, halving steps that would make the fit worse (predictions can start out very overconfident)
+        for _ in range(iterations):
+            probabilities = _sigmoid(features @ coefficients)
+            hessian = (features.T * probabilities * (1 - probabilities)) @ features + numpy.eye(2) * 1e-6
+            step = numpy.linalg.solve(hessian, features.T @ (outcomes - probabilities))
+
+            while log_likelihood(coefficients + step) < log_likelihood(coefficients) and numpy.abs(step).max() > 1e-8:
+                step /= 2
+
+            coefficients += step
+
+            if numpy.abs(step).max() < 1e-8:
+                break
+
+        self.calibration = tuple(coefficients.tolist())
+
+        return self
+
+    def brier_score(self, matches: typing.Iterable[typing.Any]) -> float:
+        """
+        Evaluates the model on matches that were played.
+
+        Parameters:
+            matches:
+                An iterable of Match objects that were played.
+
+        Returns:
+            The mean squared difference between the predicted win probability of the red alliance and the outcome of each match (0 being perfect and 0.25 being as good as always predicting 50%).
+        """  # noqa
+        match_arrays = MatchArrays.from_matches(matches, self.team_index, sort=False)
+        match_arrays = match_arrays[match_arrays.played]
+        red_win_probabilities = self._calibrated(self._predict(match_arrays)[0])
+
+        return float(numpy.mean((red_win_probabilities - match_arrays.outcomes) ** 2))
+
+    def _calibrated(self, red_win_probabilities: "numpy.ndarray") -> "numpy.ndarray":
+        """Applies the calibration fitted by `calibrate` to win probabilities predicted by the model."""
+        slope, intercept = self.calibration
+        return _sigmoid(slope * _logit(red_win_probabilities) + intercept)
+
+    @abc.abstractmethod
+    def _fit(self, match_arrays: MatchArrays) -> None:
+        """Trains the model on the arrays of matches that were played."""
+
+    @abc.abstractmethod
+    def _predict(self, match_arrays: MatchArrays) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+        """Returns the uncalibrated probability of the red alliance winning each match and each alliance's predicted score."""  # noqa
+
+    def _team_values(self, values: "numpy.ndarray", default: float) -> "numpy.ndarray":
+        """Extends an array of values indexed by team with a default value for the teams added since the model was trained."""  # noqa
+        return numpy.concatenate([values, numpy.full(max(len(self.team_index) - len(values), 0), default)])
+
+
+class OPRPredictor(MatchPredictor):
+    """Class representing a model that predicts each alliance's score as the sum of its teams' OPRs."""
+
+    def __init__(self, oprs: typing.Optional[dict[str, float]] = None, regularization: float = 1.0):
+        """
+        Parameters:
+            oprs:
+                A dictionary mapping team keys to their OPRs (eg `Event.oprs().oprs`) to predict with instead of computing them with `fit`. `calibrate` should then be called to estimate how much scores vary.
+            regularization:
+                A number representing how much teams' OPRs are pulled towards the average team's share of an alliance's score, which keeps the OPRs of teams that played few matches reasonable.
+        """  # noqa
+        if numpy is None:
+            raise ImportError("numpy is required for match predictions (pip install falcon-alliance[analysis]).")
+
+        super().__init__()
+        self.regularization = regularization
+        self.average_opr = sum(oprs.values()) / len(oprs) if oprs else 0.0
+        self.team_index.update((team_key, team_num) for team_num, team_key in enumerate(oprs or {}))
+        self.oprs = numpy.array(list((oprs or {}).values()), dtype=numpy.float64)
+        self.score_deviation = 1.0
+
+    def to_dict(self) -> dict[str, float]:
+        """Returns a dictionary mapping each team key to its OPR."""
+        return dict(zip(self.team_index, self._team_values(self.oprs, self.average_opr).tolist()))
+
+    def _fit(self, match_arrays: MatchArrays) -> None:
+        teams = match_arrays.teams.reshape(len(match_arrays) * 2, -1)
+        scores = match_arrays.scores.reshape(-1)
+        has_team = teams >= 0
+        team_count = len(self.team_index)
+        self.average_opr = float(scores.sum() / max(has_team.sum(), 1))
+
+        # The normal equations are built from pairs of teams on the same alliance instead of a (alliances, teams) matrix
+        first_teams, second_teams = (
+            numpy.broadcast_to(teams[:, :, None], teams.shape + teams.shape[1:]),
+            numpy.broadcast_to(teams[:, None, :], teams.shape + teams.shape[1:]),
+        )
+        pairs = (first_teams >= 0) & (second_teams >= 0)
+        normal_matrix = numpy.zeros((team_count, team_count))
+        numpy.add.at(normal_matrix, (first_teams[pairs], second_teams[pairs]), 1)
+
+        residuals = scores - has_team.sum(axis=1) * self.average_opr
+        targets = numpy.bincount(
+            teams[has_team], weights=numpy.repeat(residuals, has_team.sum(axis=1)), minlength=team_count
+        )
+        self.oprs = self.average_opr + numpy.linalg.solve(
+            normal_matrix + numpy.eye(team_count) * self.regularization, targets
+        )
+
+        predicted_scores = numpy.where(has_team, self.oprs[teams], 0).sum(axis=1)
+        self.score_deviation = float(numpy.std(scores - predicted_scores)) or 1.0
+
+    def _predict(self, match_arrays: MatchArrays) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+        oprs = self._team_values(self.oprs, self.average_opr)
+        alliance_scores = numpy.where(match_arrays.teams >= 0, oprs[match_arrays.teams], 0).sum(axis=2)
+
+        # Both alliances' scores vary independently, so the difference between them varies by sqrt(2) times as much
+        red_win_probabilities = 0.5 * (
+            1
+            + numpy.vectorize(math.erf, otypes=[float])(
+                (alliance_scores[:, 0] - alliance_scores[:, 1]) / (2 * self.score_deviation)
+            )
+        )
+
+        return red_win_probabilities, alliance_scores[:, 0], alliance_scores[:, 1]
+
+
+class EloPredictor(MatchPredictor):
+    """Class representing a model that predicts which alliance wins from its teams' Elo ratings."""
+
+    def __init__(self, elo: typing.Optional[EloRatings] = None):
+        """
+        Parameters:
+            elo:
+                An EloRatings object to predict with, which `fit` updates. `elo` is optional, and if not passed in, new ratings with the default parameters are used.
+        """  # noqa
+        super().__init__()
+        self.elo = elo or EloRatings()
+        self.team_index = self.elo.team_index
+
+    def _fit(self, match_arrays: MatchArrays) -> None:
+        self.elo.update(match_arrays)
+
+    def _predict(self, match_arrays: MatchArrays) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+        no_scores = numpy.full(len(match_arrays), numpy.nan)
+        return self.elo.win_probabilities(match_arrays.teams), no_scores, no_scores
+
+
+class LogisticPredictor(MatchPredictor):
+    """Class representing a logistic regression (a Bradley-Terry model) that predicts which alliance wins from a strength fitted for each team, where the log-odds of the red alliance winning are the sum of its teams' strengths minus the blue alliance's."""  # noqa
+
+    def __init__(self, regularization: float = 1.0, iterations: int = 25):
+        """
+        Parameters:
+            regularization:
+                A number representing how much teams' strengths are pulled towards 0 (the average team), which keeps the strengths of teams that played few matches reasonable.
+            iterations:
+                An integer representing the maximum amount of Newton's method iterations used to fit the model.
+        """  # noqa
+        if numpy is None:
+            raise ImportError("numpy is required for match predictions (pip install falcon-alliance[analysis]).")
+
+        super().__init__()
+        self.regularization = regularization
+        self.iterations = iterations
+        self.strengths = numpy.zeros(0)
+
+    def to_dict(self) -> dict[str, float]:
+        """Returns a dictionary mapping each team key to its strength."""
+        return dict(zip(self.team_index, self._team_values(self.strengths, 0.0).tolist()))
+
+    def _fit(self, match_arrays: MatchArrays) -> None:
+        team_count = len(self.team_index)
+        teams = match_arrays.teams.reshape(len(match_arrays), -1)
+        signs = numpy.broadcast_to(numpy.repeat([1.0, -1.0], match_arrays.teams.shape[2]), teams.shape) * (teams >= 0)
+        teams = numpy.maximum(teams, 0)
+        outcomes = match_arrays.outcomes
+        strengths = self._team_values(self.strengths, 0.0)
+
+        # Newton's method, with the Hessian built from pairs of teams in the same match (signed by whether they're opponents)  # noqa
+        for _ in range(self.iterations):
+            probabilities = _sigmoid((strengths[teams] * signs).sum(axis=1))
+            weights = probabilities * (1 - probabilities)
+
+            gradient = (
+                numpy.bincount(
+                    teams.ravel(), weights=(signs * (outcomes - probabilities)[:, None]).ravel(), minlength=team_count
+                )
+                - self.regularization * strengths
+            )
+            hessian = numpy.eye(team_count) * self.regularization
+            numpy.add.at(
+                hessian,
+                (
+                    numpy.broadcast_to(teams[:, :, None], teams.shape + teams.shape[1:]).ravel(),
+                    numpy.broadcast_to(teams[:, None, :], teams.shape + teams.shape[1:]).ravel(),
+                ),
+                (signs[:, :, None] * signs[:, None, :] * weights[:, None, None]).ravel(),
+            )
+            step = numpy.linalg.solve(hessian, gradient)
+            strengths = strengths + step
+
+            if numpy.abs(step).max() < 1e-8:
+                break
+
+        self.strengths = strengths
+
+    def _predict(self, match_arrays: MatchArrays) -> tuple["numpy.ndarray", "numpy.ndarray", "numpy.ndarray"]:
+        strengths = self._team_values(self.strengths, 0.0)
+        alliance_strengths = numpy.where(match_arrays.teams >= 0, strengths[match_arrays.teams], 0).sum(axis=2)
+        no_scores = numpy.full(len(match_arrays), numpy.nan)
+
+        return _sigmoid(alliance_strengths[:, 0] - alliance_strengths[:, 1]), no_scores, no_scores
@@ -0,0 +1,383 @@
+import concurrent.futures
+import copy
+import typing
+from dataclasses import dataclass
+
+from ..schemas import *
+from .elo import EloRatings
+from .match_arrays import MatchArrays
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+__all__ = ["RankDistribution", "RankingRules", "RankingSimulator"]
+
+
+@dataclass(frozen=True)
+class RankingRules:
+    """Class representing how teams are ranked during the qualification matches of an event in a certain year."""
+
+    win_points: float
+    tie_points: float
+    bonus_points: int
+    average: bool
+    score_points: bool = False
+
+    @classmethod
+    def for_year(cls, year: int) -> "RankingRules":
+        """
+        Retrieves the ranking rules of a year.
+
+        Parameters:
+            year:
+                An integer representing the year of the event.
+
+        Returns:
+            A RankingRules object where `win_points` and `tie_points` are the ranking points given to each team of an alliance that wins or ties, `bonus_points` is the maximum amount of bonus ranking points an alliance can earn in a match, `average` is whether teams are ranked by their average instead of their total and `score_points` is whether the alliance's score counts towards the ranking (like in 2015).
+        """  # noqa
+        if year < 2015:
+            return cls(win_points=2, tie_points=1, bonus_points=0, average=False)
+        elif year == 2015:
+            return cls(win_points=0, tie_points=0, bonus_points=0, average=True, score_points=True)
+        elif year == 2016:
+            return cls(win_points=2, tie_points=1, bonus_points=2, average=False)
+        elif year < 2025:
+            return cls(win_points=2, tie_points=1, bonus_points=2, average=True)
+        else:
+            return cls(win_points=3, tie_points=1, bonus_points=3, average=True)
+
+
+@dataclass()
+class RankDistribution:
+    """Class representing how many times each team finished at each rank over many simulations of an event."""
+
+    team_keys: list[str]
+    counts: "numpy.ndarray"
+
+    @classmethod
+    def from_orders(cls, team_keys: list[str], orders: "numpy.ndarray") -> "RankDistribution":
+        """
+        Counts how many times each team finished at each rank.
+
+        Parameters:
+            team_keys:
+                A list of the keys of the teams that were ranked.
+            orders:
+                An integer array of shape (simulations, teams) containing the index of the team at each rank in each simulation (eg from `numpy.argsort`).
+
+        Returns:
+            A RankDistribution object containing how many times each team finished at each rank.
+        """  # noqa
+        team_count = len(team_keys)
+        ranks = numpy.empty_like(orders)
+        numpy.put_along_axis(ranks, orders, numpy.arange(team_count), axis=1)
+
+        return cls(
+            team_keys=team_keys,
+            counts=numpy.bincount(
+                (numpy.arange(team_count) * team_count + ranks).ravel(), minlength=team_count**2
+            ).reshape(team_count, team_count),
+        )
+
+    def __getitem__(self, team_key: str) -> "numpy.ndarray":
+        return self.probabilities[self.team_keys.index(team_key)]
+
+    @property
+    def simulations(self) -> int:
+        """The amount of simulations the distribution was created from."""
+        return int(self.counts[0].sum()) if len(self.team_keys) else 0
+
+    @property
+    def probabilities(self) -> "numpy.ndarray":
+        """An array of shape (teams, ranks) containing the probability of each team finishing at each rank (the first column being rank 1)."""  # noqa
+        return self.counts / max(self.simulations, 1)
+
+    def expected_ranks(self) -> dict[str, float]:
+        """Returns a dictionary mapping each team key to the average rank the team finished at."""
+        return dict(zip(self.team_keys, (self.probabilities @ numpy.arange(1, len(self.team_keys) + 1)).tolist()))
+
+    def top(self, ranks: int) -> dict[str, float]:
+        """
+        Computes the probability of each team finishing at one of the top ranks (eg to be an alliance captain).
+
+        Parameters:
+            ranks:
+                An integer representing the amount of top ranks (eg 8 for the ranks of alliance captains).
+
+        Returns:
+            A dictionary mapping each team key to the probability of it finishing at one of the top ranks.
+        """
+        return dict(zip(self.team_keys, self.probabilities[:, :ranks].sum(axis=1).tolist()))
+
+    def __add__(self, other: "RankDistribution") -> "RankDistribution":
+        return RankDistribution(team_keys=self.team_keys, counts=self.counts + other.counts)
+
+
+class RankingSimulator:
+    """Class representing a Monte Carlo simulation of an event's remaining qualification matches to predict the final rankings."""  # noqa
+
+    # Maximum amount of simulations run at once by a process, which bounds the memory used by each of them
+    CHUNK_SIZE = 5000
+
+    def __init__(
+        self,
+        rankings: dict[str, Event.Ranking],
+        matches: list[Match],
+        year: typing.Optional[int] = None,
+        oprs: typing.Optional[dict[str, float]] = None,
+        elo: typing.Optional[EloRatings] = None,
+        rules: typing.Optional[RankingRules] = None,
+        score_deviation: typing.Optional[float] = None,
+    ):
+        """
+        Parameters:
+            rankings:
+                A dictionary mapping team keys to their current Ranking objects, as retrieved from `Event.rankings`.
+            matches:
+                A list of Match objects representing every match of the event, as retrieved from `Event.matches`. The qualification matches that weren't played yet are simulated and the ones that were are used to estimate how consistent the teams are.
+            year:
+                An integer representing the year of the event, which determines the ranking rules. `year` is optional, and if not passed in, it's inferred from the match keys.
+            oprs:
+                A dictionary mapping team keys to their OPRs (eg `Event.oprs().oprs`), used to sample the score of each alliance. Mutually exclusive with `elo`.
+            elo:
+                An EloRatings object used to sample which alliance wins each match. Mutually exclusive with `oprs`.
+            rules:
+                A RankingRules object representing how teams are ranked. `rules` is optional, and if not passed in, the rules of `year` are used.
+            score_deviation:
+                A number representing the standard deviation of an alliance's score around the sum of its teams' OPRs. `score_deviation` is optional, and if not passed in, it's estimated from the matches that were played.
+        """  # noqa
+        if numpy is None:
+            raise ImportError("numpy is required for ranking simulations (pip install falcon-alliance[analysis]).")
+        elif (oprs is None) == (elo is None):
+            raise ValueError("Exactly one of oprs and elo must be passed in to simulate matches.")
+
+        if year is None:
+            if not matches:
+                raise ValueError("year must be passed in if there aren't any matches to infer it from.")
+
+            year = int(matches[0].key[:4])
+
+        self.rules = rules or RankingRules.for_year(year)
+
+        if self.rules.score_points and elo is not None:
+            raise ValueError("Elo ratings can't be used to simulate events where scores count towards the ranking.")
+
+        remaining_matches = [
+            match
+            for match in matches
+            if match.comp_level == "qm"
+            and match.alliances
+            and any(alliance.score is None or alliance.score < 0 for alliance in match.alliances.values())
+        ]
+        self.team_index = {team_key: team_num for team_num, team_key in enumerate(rankings)}
+        self.remaining = MatchArrays.from_matches(remaining_matches, self.team_index)
+        self.team_keys = list(self.team_index)
+
+        # Surrogate matches don't count towards a team's ranking
+        self.counted = numpy.array(
+            [
+                [
+                    [team_key not in alliance.surrogate_team_keys for team_key in alliance.team_keys]
+                    + [False] * (self.remaining.teams.shape[2] - len(alliance.team_keys))
+                    for alliance in (match.alliances["red"], match.alliances["blue"])
+                ]
+                for match in sorted(remaining_matches, key=MatchArrays.chronological_key)
+            ],
+            dtype=bool,
+        ).reshape(self.remaining.teams.shape)
+
+        self._add_rankings(rankings)
+
+        if oprs is not None:
+            self.alliance_means = self._alliance_sums(oprs, self.remaining.teams)
+            self.score_deviation = (
+                score_deviation if score_deviation is not None else self._estimate_score_deviation(oprs, matches)
+            )
+            self.red_win_probabilities = None
+        else:
+            self.alliance_means = None
+            self.score_deviation = None
+            # Teams that haven't played a match yet are added to a copy, so the ratings passed in aren't modified
+            elo = copy.copy(elo)
+            elo.team_index = dict(elo.team_index)
+            self.red_win_probabilities = elo.win_probabilities(
+                MatchArrays.from_matches(remaining_matches, elo.team_index).teams
+            )
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: Event.Snapshot, elo: typing.Optional[EloRatings] = None, **kwargs
+    ) -> "RankingSimulator":
+        """
+        Creates a simulator from a snapshot of an event (see `Event.snapshot`), with teams' strengths based off their OPRs at the event unless Elo ratings are passed in.
+
+        Parameters:
+            snapshot:
+                A Snapshot object representing the event.
+            elo:
+                An EloRatings object used to sample which alliance wins each match instead of the OPRs.
+            kwargs:
+                The other parameters passed into the simulator (`rules` and `score_deviation`).
+
+        Returns:
+            A RankingSimulator object for the remaining qualification matches of the event.
+        """  # noqa
+        return cls(
+            rankings=snapshot.rankings,
+            matches=snapshot.matches,
+            year=snapshot.event.year or int(snapshot.event.key[:4]),
+            oprs=snapshot.oprs.oprs if elo is None else None,
+            elo=elo,
+            **kwargs,
+        )
+
+    def simulate(
+        self, simulations: int = 10000, processes: typing.Optional[int] = 1, seed: typing.Optional[int] = None
+    ) -> RankDistribution:
+        """
+        Simulates the remaining qualification matches many times and ranks the teams after each simulation.
+
+        The simulations are split into chunks that can be run in a process pool, and the same seed gives the same results regardless of the amount of processes. When multiple processes use the "spawn" start method (eg on Windows and macOS), this must be called under an `if __name__ == "__main__"` guard.
+
+        Parameters:
+            simulations:
+                An integer representing the amount of times to simulate the event.
+            processes:
+                An integer representing the maximum amount of processes to run the simulations in. Starting a process pool takes longer than simulating most events, so every simulation is run in the current process unless a larger amount is passed in (or None to use every CPU).
+            seed:
+                An integer used to seed the random number generator, to get the same results every time.
+
+        Returns:
+            A RankDistribution object containing how many times each team finished at each rank.
+        """  # noqa
+        chunk_sizes = [min(self.CHUNK_SIZE, simulations - start) for start in range(0, simulations, self.CHUNK_SIZE)]
+        seeds = numpy.random.SeedSequence(seed).spawn(len(chunk_sizes))
+
+        if processes == 1 or len(chunk_sizes) <= 1:
+            chunk_counts = list(map(self._simulate_chunk, chunk_sizes, seeds))
+        else:
+            with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+                chunk_counts = list(executor.map(self._simulate_chunk, chunk_sizes, seeds))
+
+        return RankDistribution(
+            team_keys=self.team_keys,
+            counts=sum(chunk_counts, numpy.zeros((len(self.team_keys), len(self.team_keys)), dtype=numpy.int64)),
+        )
+
+    def _add_rankings(self, rankings: dict[str, Event.Ranking]) -> None:
+        """Converts the current rankings (and the teams that only appear in the remaining matches) into arrays."""
+        team_count = len(self.team_keys)
+        tiebreaker_count = max((len(self._sort_order_values(ranking)) - 1 for ranking in rankings.values()), default=0)
+
+        self.points = numpy.zeros(team_count)
+        self.matches_played = numpy.zeros(team_count)
+        self.bonus_rates = numpy.zeros(team_count)
+        self.tiebreakers = numpy.zeros((team_count, tiebreaker_count))
+
+        for team_num, ranking in enumerate(rankings.values()):
+            sort_order_values = [value or 0 for value in self._sort_order_values(ranking)]
+            matches_played = ranking.matches_played or 0
+            record = ranking.record or {}
+
+            # Teams are ranked by the first sort order, which is either their total or their average
+            total = sort_order_values[0] * matches_played if self.rules.average else sort_order_values[0]
+            bonus_points = (
+                total - self.rules.win_points * record.get("wins", 0) - self.rules.tie_points * record.get("ties", 0)
+            )
+
+            self.points[team_num] = total
+            self.matches_played[team_num] = matches_played
+            self.bonus_rates[team_num] = (
+                min(max(bonus_points / matches_played / self.rules.bonus_points, 0), 1)
+                if matches_played and self.rules.bonus_points
+                else 0
+            )
+            self.tiebreakers[team_num, : len(sort_order_values) - 1] = sort_order_values[1:]
+
+        # Teams that haven't played yet are assumed to earn bonus ranking points as often as the average team
+        played = self.matches_played > 0
+        self.bonus_rates[~played] = self.bonus_rates[played].mean() if played.any() else 0.5
+
+        # Each column of `incidence` corresponds to a team and each row to an alliance in a remaining match
+        self.incidence = numpy.zeros((len(self.remaining) * 2, team_count))
+        alliance_rows = numpy.broadcast_to(
+            numpy.arange(len(self.remaining) * 2).reshape(len(self.remaining), 2, 1), self.remaining.teams.shape
+        )
+        self.incidence[alliance_rows[self.counted], self.remaining.teams[self.counted]] = 1
+
+        has_team = self.remaining.teams >= 0
+        self.alliance_bonus_rates = numpy.where(has_team, self.bonus_rates[self.remaining.teams], 0).sum(
+            axis=2
+        ) / numpy.maximum(has_team.sum(axis=2), 1)
+
+    def _simulate_chunk(self, simulations: int, seed: "numpy.random.SeedSequence") -> "numpy.ndarray":
+        """Runs a chunk of simulations and returns how many times each team finished at each rank."""
+        generator = numpy.random.default_rng(seed)
+        shape = (simulations, len(self.remaining))
+
+        if self.alliance_means is not None:
+            scores = numpy.maximum(
+                numpy.rint(generator.normal(self.alliance_means, self.score_deviation, shape + (2,))), 0
+            )
+            red_wins = scores[:, :, 0] > scores[:, :, 1]
+            ties = scores[:, :, 0] == scores[:, :, 1]
+        else:
+            scores = numpy.zeros(shape + (2,))
+            red_wins = generator.random(shape) < self.red_win_probabilities
+            ties = numpy.zeros(shape, dtype=bool)
+
+        blue_wins = ~red_wins & ~ties
+        alliance_points = (
+            numpy.stack([red_wins, blue_wins], axis=2) * self.rules.win_points
+            + ties[:, :, None] * self.rules.tie_points
+            + generator.binomial(self.rules.bonus_points, self.alliance_bonus_rates, shape + (2,))
+        )
+
+        if self.rules.score_points:
+            alliance_points = alliance_points + scores
+
+        points = self.points + alliance_points.reshape(simulations, -1) @ self.incidence
+        matches_played = self.matches_played + self.incidence.sum(axis=0)
+        ranking_values = points / numpy.maximum(matches_played, 1) if self.rules.average else points
+
+        # Sorted by ranking value, then by each tiebreaker and then randomly (the last key is the primary key)
+        order = numpy.lexsort(
+            [generator.random(ranking_values.shape)]
+            + [numpy.broadcast_to(-tiebreaker, ranking_values.shape) for tiebreaker in self.tiebreakers.T[::-1]]
+            + [-ranking_values]
+        )
+
+        return RankDistribution.from_orders(self.team_keys, order).counts
+
+    def _alliance_sums(self, team_values: dict[str, float], teams: "numpy.ndarray") -> "numpy.ndarray":
+        """Sums a value of every team in each alliance, with teams that don't have a value counting as the average team."""  # noqa
+        average_value = sum(team_values.values()) / len(team_values) if team_values else 0
+        values = numpy.array([team_values.get(team_key, average_value) for team_key in self.team_keys])
+
+        return numpy.where(teams >= 0, values[teams], 0).sum(axis=2)
+
+    @staticmethod
+    def _estimate_score_deviation(oprs: dict[str, float], matches: list[Match]) -> float:
+        """Estimates the standard deviation of an alliance's score around the sum of its teams' OPRs from the matches that were played."""  # noqa
+        residuals = [
+            alliance.score - sum(oprs[team_key] for team_key in alliance.team_keys)
+            for match in matches
+            if match.alliances
+            for alliance in match.alliances.values()
+            if alliance.score is not None
+            and alliance.score >= 0
+            and all(team_key in oprs for team_key in alliance.team_keys)
+        ]
+
+        if len(residuals) >= 2:
+            return float(numpy.std(residuals, ddof=1))
+
+        # Without enough matches to estimate it from, alliances' scores vary by about a quarter of their average
+        return 0.25 * abs(sum(oprs.values()) / max(len(oprs), 1) * 3) if oprs else 1.0
+
+    @staticmethod
+    def _sort_order_values(ranking: Event.Ranking) -> list:
+        """Retrieves the values of a ranking's sort orders in order."""
+        return [value for name, value in vars(ranking.sort_orders).items() if name != "_attributes_formatted"]
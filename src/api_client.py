@@ -1,4 +1,5 @@
 import asyncio
+import concurrent.futures
 import functools
 import itertools
 import os
@@ -19,7 +20,24 @@ __all__ = ["ApiClient"]
 class ApiClient:
     """Base class that contains all requests for the TBA API wrapper."""
 
-    def __init__(self, api_key: str = None):
+    def __init__(
+        self,
+        api_key: str = None,
+        max_concurrent_requests: int = 100,
+        parse_processes: int = 0,
+        request_timeout: typing.Optional[float] = None,
+    ):
+        """
+        Parameters:
+            api_key:
+                A string representing the TBA API key to authorize requests with. Can be None to use the `TBA_API_KEY` (or `API_KEY`) environment variable.
+            max_concurrent_requests:
+                An integer representing the maximum amount of requests that can be in flight at once.
+            parse_processes:
+                An integer representing the amount of worker processes that large responses retrieved with `fields` (eg every match of an event with score breakdowns) are decoded and projected in, so that bulk retrieval isn't limited to one core. Can be None to have a worker process for every CPU or 0 to convert every response in the event loop's thread.
+            request_timeout:
+                A number representing the maximum amount of seconds a single request to TBA can take, so that a stuck connection can't hang a call. Can be None to use aiohttp's default timeout. To give a whole call (eg a fan-out across years) a single time budget, use `deadline`.
+        """  # noqa
         if api_key is None:
             try:
                 api_key = os.environ["TBA_API_KEY"]
@@ -29,7 +47,14 @@ class ApiClient:
 
         self._headers = {"X-TBA-Auth-Key": api_key}
         BaseSchema.add_headers(self._headers)
-        InternalData.loop.run_until_complete(InternalData.set_session())
+        InternalData.loop.run_until_complete(InternalData.set_session(max_concurrent_requests, request_timeout))
+
+        # The process pool created for this client, which is shut down when the client is closed
+        self._parse_executor: typing.Optional[concurrent.futures.Executor] = None
+
+        if parse_processes != 0:
+            InternalData.set_parse_executor(parse_processes)
+            self._parse_executor = InternalData.parse_executor
 
     def __enter__(self) -> "ApiClient":
         return self
@@ -64,13 +89,84 @@ class ApiClient:
         return wrapper
 
     async def close(self) -> None:
-        """Closes the ongoing session (`aiohttp.ClientSession`)."""
+        """Closes the ongoing session (`aiohttp.ClientSession`) and shuts down the worker processes created for `parse_processes`."""  # noqa
         await InternalData.session.close()
         InternalData.session = aiohttp.ClientSession()
 
+        if self._parse_executor is not None:
+            if InternalData.parse_executor is self._parse_executor:
+                InternalData.parse_executor = None
+
+            self._parse_executor.shutdown()
+            self._parse_executor = None
+
+    async def _get_by_keys(self, coro: typing.Callable, keys: typing.Iterable[str], **kwargs) -> list:
+        """
+        Retrieves the objects that correspond to numerous keys concurrently.
+
+        Parameters:
+            coro:
+                A coroutine function that retrieves the object corresponding to a single key (eg `ApiClient.team.coro`).
+            keys:
+                An iterable of strings representing the keys to retrieve the objects of.
+            kwargs:
+                Arbritary amount of keyword arguments passed into `coro` for every key.
+
+        Returns:
+            A list of objects or exceptions in the same order as `keys`, with duplicate keys only being requested once.
+        """  # noqa
+        keys = list(keys)
+        unique_keys = list(dict.fromkeys(keys))
+
+        responses = await asyncio.gather(
+            *[coro(self, key, **kwargs) for key in unique_keys],
+            return_exceptions=True,
+        )
+        responses_by_key = dict(zip(unique_keys, responses))
+
+        return [responses_by_key[key] for key in keys]
+
+    async def _get_event_snapshot(self, event_key: str) -> Event.Snapshot:
+        """
+        Retrieves the snapshot of an event.
+
+        Parameters:
+            event_key:
+                A string representing the key of the event to retrieve the snapshot of.
+
+        Returns:
+            An Event.Snapshot object containing everything about the event.
+        """
+        event = Event(event_key)
+        return await event.snapshot.coro(event)
+
+    async def _get_team_profile(
+        self, team_key: str, years: typing.Optional[typing.Union[range, int]], simple: bool
+    ) -> Team.Profile:
+        """
+        Retrieves the profile of a team.
+
+        Parameters:
+            team_key:
+                A string representing the key of the team to retrieve the profile of.
+            years:
+                An integer or range object representing the year(s) to retrieve the team's profile from, or None for the team's whole career.
+            simple:
+                A boolean that specifies whether the team, its events and its matches should be 'shortened' and only contain more relevant information.
+
+        Returns:
+            A Team.Profile object containing everything about the team from the specified year(s).
+        """  # noqa
+        team = Team(team_key)
+        return await team.profile.coro(team, years, simple)
+
     async def _get_year_events(
-        self, year: int, simple: typing.Optional[bool] = False, keys: typing.Optional[bool] = False
-    ) -> list[typing.Union[Event, str]]:
+        self,
+        year: int,
+        simple: typing.Optional[bool] = False,
+        keys: typing.Optional[bool] = False,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+    ) -> list[typing.Union[Event, str, tuple]]:
         """
         Retrieves all the events from a year.
 
@@ -81,21 +177,28 @@ class ApiClient:
                 A boolean representing whether some of the information regarding an event should be stripped to only contain relevant information about the event.
             keys:
                 A boolean representing whether only the keys of the events should be returned.
+            fields:
+                An iterable of strings representing the only attributes each event should have (eg ['key', 'week', 'start_date']), which returns lightweight named tuples instead of Event objects to skip converting every other field. Can be None to return Event objects.
 
         Returns:
             A list of Event objects representing each event in a year or a list of strings representing all the keys of the events retrieved.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("events", year=year, simple=simple, keys=keys), headers=self._headers
+        url = ENDPOINTS["events"].url(year, simple=simple, keys=keys)
+        return await InternalData.get_objects(
+            url=url,
+            headers=self._headers,
+            constructor=list if keys else Event._constructor(fields),
+            compact=fields is not None,
         )
-        if keys:
-            return response
-        else:
-            return [Event(**event_data) for event_data in response]
 
     async def _get_team_page(
-        self, page_num: int = None, year: typing.Union[range, int] = None, simple: bool = False, keys: bool = False
-    ) -> list[typing.Union[Team, str]]:
+        self,
+        page_num: int = None,
+        year: typing.Union[range, int] = None,
+        simple: bool = False,
+        keys: bool = False,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+    ) -> list[typing.Union[Team, str, tuple]]:
         """
         Returns a page of teams (a list of 500 teams or less)
 
@@ -111,32 +214,45 @@ class ApiClient:
                 A boolean that specifies whether the results for each team should be 'shortened' and only contain more relevant information.
             keys:
                 A boolean that specifies whether only the names of the FRC teams should be retrieved.
+            fields:
+                An iterable of strings representing the only attributes each team should have (eg ['key', 'nickname']), which returns lightweight named tuples instead of Team objects to skip converting every other field. Can be None to return Team objects.
 
         Returns:
             A list of Team objects for each team in the list.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("teams", year=year, page_num=page_num, simple=simple, keys=keys), headers=self._headers
+        url = ENDPOINTS["teams"].url(year=year, page_num=page_num, simple=simple, keys=keys)
+        return await InternalData.get_objects(
+            url=url,
+            headers=self._headers,
+            constructor=list if keys else Team._constructor(fields),
+            compact=fields is not None,
         )
-        return [Team(**team_data) if not isinstance(team_data, str) else team_data for team_data in response]
 
     @synchronous
-    async def districts(self, year: int) -> list[District]:
+    async def districts(self, year: int, raw: bool = False) -> typing.Union[list[District], CachedResponse]:
         """
         Retrieves all FRC districts during a year.
 
         Parameters:
             year:
                 An integer representing the year to retrieve its FRC districts from.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
 
         Returns:
             A list of District objects with each object representing an active district of that year.
-        """
-        response = await InternalData.get(url=construct_url("districts", year=year), headers=self._headers)
+        """  # noqa
+        url = ENDPOINTS["districts"].url(year)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         return [District(**district_data) for district_data in response]
 
     @synchronous
-    async def event(self, event_key: str, simple: typing.Optional[bool] = False) -> Event:
+    async def event(
+        self, event_key: str, simple: typing.Optional[bool] = False, raw: bool = False
+    ) -> typing.Union[Event, CachedResponse]:
         """
         Retrieves and returns a record of teams based on the parameters given.
 
@@ -145,19 +261,30 @@ class ApiClient:
                 A string representing a unique key assigned to an event to set it apart from others.
             simple:
                 A boolean that specifies whether the results for the event should be 'shortened' and only contain more relevant information.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
 
         Returns:
             A Team object representing the data given.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("event", key=event_key, simple=simple), headers=self._headers
-        )
+        url = ENDPOINTS["event"].url(event_key, simple=simple)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         return Event(**response)
 
     @synchronous
     async def events(
-        self, year: typing.Union[range, int], simple: typing.Optional[bool] = False, keys: typing.Optional[bool] = False
-    ) -> list[typing.Union[Event, str]]:
+        self,
+        year: typing.Union[range, int],
+        simple: typing.Optional[bool] = False,
+        keys: typing.Optional[bool] = False,
+        partial: bool = False,
+        progress: typing.Optional[typing.Callable[[int, int], typing.Any]] = None,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        raw: bool = False,
+    ) -> typing.Union[list[typing.Union[Event, str, tuple]], CachedResponse]:
         """
         Retrieves all the events from certain year(s).
 
@@ -168,26 +295,90 @@ class ApiClient:
                 A boolean representing whether some of the information regarding an event should be stripped to only contain relevant information about the event.
             keys:
                 A boolean representing whether only the keys of the events should be returned.
+            partial:
+                A boolean that specifies whether years that fail to be retrieved should be reported in the `errors` attribute of the returned list instead of raising an error. Only used if `year` is a range object.
+            progress:
+                A function that is called with the amount of years retrieved so far and the total amount of years every time a year is retrieved. Only used if `year` is a range object.
+            fields:
+                An iterable of strings representing the only attributes each event should have (eg ['key', 'week', 'start_date']), which returns lightweight named tuples instead of Event objects to skip converting every other field. Can be None to return Event objects.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects. Can't be True if `year` is a range object, since each year is retrieved separately.
 
         Returns:
             A list of Event objects representing each event in certain year(s) or a list of strings representing all the keys of the events retrieved.
         """  # noqa
         if simple and keys:
             raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
+        elif keys and fields is not None:
+            raise ValueError(
+                "fields cannot be passed in if keys is True, since only the keys of the events are retrieved."
+            )
+        elif raw and isinstance(year, range):
+            raise ValueError("raw cannot be True when year is a range object.")
+        elif raw:
+            return await InternalData.fetch(
+                url=ENDPOINTS["events"].url(year, simple=simple, keys=keys), headers=self._headers
+            )
 
         if isinstance(year, range):
-            return list(
-                itertools.chain.from_iterable(
-                    await asyncio.gather(*[self.events.coro(self, spec_year, simple, keys) for spec_year in year])
-                )
+            year_events = await fan_out(
+                lambda spec_year: self._get_year_events(spec_year, simple, keys, fields),
+                year,
+                partial=partial,
+                progress=progress,
             )
+            return PartialResults(itertools.chain.from_iterable(year_events), year_events.errors)
         else:
-            return await self._get_year_events(year, simple, keys)
+            return await self._get_year_events(year, simple, keys, fields)
+
+    @synchronous
+    async def events_by_key(
+        self, event_keys: typing.Iterable[str], simple: typing.Optional[bool] = False
+    ) -> list[typing.Union[Event, Exception]]:
+        """
+        Retrieves numerous events by their keys concurrently.
+
+        Parameters:
+            event_keys:
+                An iterable of strings representing the keys of the events to retrieve. Duplicate keys are only requested once.
+            simple:
+                A boolean that specifies whether the results for each event should be 'shortened' and only contain more relevant information.
+
+        Returns:
+            A list in the same order as `event_keys` with an Event object for each key that was retrieved successfully or the exception (eg a TBAError for an invalid key) that was raised while retrieving said key.
+        """  # noqa
+        return await self._get_by_keys(self.event.coro, event_keys, simple=simple)
+
+    @synchronous
+    async def event_snapshots(
+        self, year: int, week: typing.Optional[int] = None
+    ) -> list[typing.Union[Event.Snapshot, Exception]]:
+        """
+        Retrieves the snapshots of every event in a season or week concurrently (see `Event.snapshot`).
+
+        Parameters:
+            year:
+                An integer representing the season to retrieve the snapshots of its events.
+            week:
+                An integer representing the week to retrieve the snapshots of its events, as numbered by TBA (0 being the first week of competition). Can be None to retrieve the snapshots of every event in the season.
+
+        Returns:
+            A list with an Event.Snapshot object for each event that was retrieved successfully or the exception that was raised while retrieving said event.
+        """  # noqa
+        events = await self._get_year_events(year)
+        event_keys = [event.key for event in events if week is None or event.week == week]
+
+        return await self._get_by_keys(ApiClient._get_event_snapshot, event_keys)
 
     @synchronous
     async def match(
-        self, match_key: str, simple: bool = False, timeseries: bool = False, zebra_motionworks: bool = False
-    ) -> typing.Optional[typing.Union[list[dict], Match, Match.ZebraMotionworks]]:
+        self,
+        match_key: str,
+        simple: bool = False,
+        timeseries: bool = False,
+        zebra_motionworks: bool = False,
+        raw: bool = False,
+    ) -> typing.Optional[typing.Union[list[dict], Match, Match.ZebraMotionworks, CachedResponse]]:
         """
         Retrieves information about a match.
 
@@ -202,6 +393,8 @@ class ApiClient:
                 A boolean that specifies whether match timeseries data should be retrieved from a match.
             zebra_motionworks:
                 A boolean that specifies whether data about where robots went during a match should be retrieved. Using this parameter, there may be no data due to the fact that very few matches use the Zebra MotionWorks technology required to get data on where the robots go during a match.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
 
         Returns:
             A Match object containing information about the match or a Match.ZebraMotionworks object representing data about where teams' robots went during the match (may not have any data for all teams or even data altogether and if so will return None) or a list of dictionaries containing timeseries data for a match.
@@ -212,12 +405,13 @@ class ApiClient:
                 "You can't mix and match parameters."
             )
 
-        response = await InternalData.get(
-            url=construct_url(
-                "match", key=match_key, simple=simple, timeseries=timeseries, zebra_motionworks=zebra_motionworks
-            ),
-            headers=self._headers,
+        url = ENDPOINTS["match"].url(
+            match_key, simple=simple, timeseries=timeseries, zebra_motionworks=zebra_motionworks
         )
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         if timeseries:  # pragma: no cover
             return response
         elif zebra_motionworks:
@@ -229,18 +423,49 @@ class ApiClient:
             return Match(**response)
 
     @synchronous
-    async def status(self) -> APIStatus:
+    async def matches_by_key(
+        self, match_keys: typing.Iterable[str], simple: bool = False
+    ) -> list[typing.Union[Match, Exception]]:
+        """
+        Retrieves numerous matches by their keys concurrently.
+
+        Parameters:
+            match_keys:
+                An iterable of strings representing the keys of the matches to retrieve. Duplicate keys are only requested once.
+            simple:
+                A boolean that specifies whether the results for each match should be 'shortened' and only contain more relevant information.
+
+        Returns:
+            A list in the same order as `match_keys` with a Match object for each key that was retrieved successfully or the exception (eg a TBAError for an invalid key) that was raised while retrieving said key.
+        """  # noqa
+        return await self._get_by_keys(self.match.coro, match_keys, simple=simple)
+
+    @synchronous
+    async def status(self, raw: bool = False) -> typing.Union[APIStatus, CachedResponse]:
         """
         Retrieves information about TBA's API status.
 
+        If TBA reports that its datafeed or some events are down, the stale cached responses of the affected endpoints are served instead of being refreshed until they recover (see `InternalData.apply_status`).
+
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             An APIStatus object containing information about TBA's API status.
-        """
-        response = await InternalData.get(url=construct_url("status").rstrip("/"), headers=self._headers)
-        return APIStatus(**response)
+        """  # noqa
+        url = ENDPOINTS["status"].url()
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
+        api_status = APIStatus(**response)
+        InternalData.apply_status(api_status.is_datafeed_down, api_status.down_events or [])
+
+        return api_status
 
     @synchronous
-    async def team(self, team_key: str, simple: bool = False) -> Team:
+    async def team(self, team_key: str, simple: bool = False, raw: bool = False) -> typing.Union[Team, CachedResponse]:
         """
         Retrieves and returns a record of teams based on the parameters given.
 
@@ -249,17 +474,31 @@ class ApiClient:
                 A string representing a unique key assigned to a team to set it apart from others (in the form of frcXXXX) where XXXX is the team number.
             simple:
                 A boolean that specifies whether the results for the team should be 'shortened' and only contain more relevant information.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
 
         Returns:
             A Team object representing the data given.
         """  # noqa
-        response = await InternalData.get(url=construct_url("team", key=team_key, simple=simple), headers=self._headers)
+        url = ENDPOINTS["team"].url(team_key, simple=simple)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         return Team(**response)
 
     @synchronous
     async def teams(
-        self, page_num: int = None, year: typing.Union[range, int] = None, simple: bool = False, keys: bool = False
-    ) -> list[typing.Union[Team, str]]:
+        self,
+        page_num: int = None,
+        year: typing.Union[range, int] = None,
+        simple: bool = False,
+        keys: bool = False,
+        partial: bool = False,
+        progress: typing.Optional[typing.Callable[[int, int], typing.Any]] = None,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        raw: bool = False,
+    ) -> typing.Union[list[typing.Union[Team, str, tuple]], CachedResponse]:
         """
         Retrieves and returns a record of teams based on the parameters given.
 
@@ -275,31 +514,105 @@ class ApiClient:
                 A boolean that specifies whether the results for each team should be 'shortened' and only contain more relevant information.
             keys:
                 A boolean that specifies whether only the names of the FRC teams should be retrieved.
+            partial:
+                A boolean that specifies whether years that fail to be retrieved should be reported in the `errors` attribute of the returned list instead of raising an error. Only used if `year` is a range object.
+            progress:
+                A function that is called with the amount of years retrieved so far and the total amount of years every time a year is retrieved. Only used if `year` is a range object.
+            fields:
+                An iterable of strings representing the only attributes each team should have (eg ['key', 'nickname']), which returns lightweight named tuples instead of Team objects to skip converting every other field. Can be None to return Team objects.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects. Can only be True if `page_num` is passed in and `year` isn't a range object, since every other call retrieves multiple pages.
 
         Returns:
             A list of Team objects for each team in the list.
         """  # noqa
         if simple and keys:
             raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
+        elif keys and fields is not None:
+            raise ValueError(
+                "fields cannot be passed in if keys is True, since only the keys of the teams are retrieved."
+            )
+        elif raw and (page_num is None or isinstance(year, range)):
+            raise ValueError("raw cannot be True unless page_num is passed in and year isn't a range object.")
+        elif raw:
+            return await InternalData.fetch(
+                url=ENDPOINTS["teams"].url(year=year, page_num=page_num, simple=simple, keys=keys),
+                headers=self._headers,
+            )
 
         if isinstance(year, range):
-            all_responses = list(
-                itertools.chain.from_iterable(
-                    await asyncio.gather(
-                        *[self.teams.coro(self, page_num, spec_year, simple, keys) for spec_year in year]
-                    )
-                )
+            # Teams in multiple years are deduplicated and sorted by their team numbers, so projections always contain them  # noqa
+            year_fields = fields
+            if fields is not None:
+                fields = tuple(fields)
+                year_fields = fields if "team_number" in fields else (*fields, "team_number")
+
+            year_teams = await fan_out(
+                lambda spec_year: self.teams.coro(self, page_num, spec_year, simple, keys, fields=year_fields),
+                year,
+                partial=partial,
+                progress=progress,
             )
 
-            return sorted(list(set(all_responses)))
+            if fields is None:
+                all_teams = sorted(set(itertools.chain.from_iterable(year_teams)))
+            else:
+                unique_teams = {team.team_number: team for team in itertools.chain.from_iterable(year_teams)}
+                all_teams = [unique_teams[team_number] for team_number in sorted(unique_teams)]
+
+                if year_fields != fields:
+                    all_teams = Team._project(all_teams, fields)
+
+            return PartialResults(all_teams, year_teams.errors)
 
         else:
             if page_num:
-                return await self._get_team_page(page_num, year, simple, keys)
+                return await self._get_team_page(page_num, year, simple, keys, fields)
             else:
                 all_teams = itertools.chain.from_iterable(
-                    await asyncio.gather(
-                        *[self._get_team_page(page_number, year, simple, keys) for page_number in range(0, 20)]
+                    await fan_out(
+                        lambda page_number: self._get_team_page(page_number, year, simple, keys, fields), range(0, 20)
                     )
                 )
                 return list(all_teams)
+
+    @synchronous
+    async def teams_by_key(
+        self, team_keys: typing.Iterable[str], simple: bool = False
+    ) -> list[typing.Union[Team, Exception]]:
+        """
+        Retrieves numerous teams by their keys concurrently.
+
+        Parameters:
+            team_keys:
+                An iterable of strings representing the keys of the teams to retrieve (in the form of frcXXXX). Duplicate keys are only requested once.
+            simple:
+                A boolean that specifies whether the results for each team should be 'shortened' and only contain more relevant information.
+
+        Returns:
+            A list in the same order as `team_keys` with a Team object for each key that was retrieved successfully or the exception (eg a TBAError for an invalid key) that was raised while retrieving said key.
+        """  # noqa
+        return await self._get_by_keys(self.team.coro, team_keys, simple=simple)
+
+    @synchronous
+    async def team_profiles(
+        self,
+        team_keys: typing.Iterable[str],
+        years: typing.Optional[typing.Union[range, int]] = None,
+        simple: bool = False,
+    ) -> list[typing.Union[Team.Profile, Exception]]:
+        """
+        Retrieves the profiles of numerous teams concurrently (see `Team.profile`).
+
+        Parameters:
+            team_keys:
+                An iterable of strings representing the keys of the teams to retrieve the profiles of. Duplicate keys are only requested once.
+            years:
+                An integer representing the year to retrieve the teams' profiles from or a range object representing the years the teams' profiles should be retrieved from. Can be None to retrieve each team's profile across its whole career.
+            simple:
+                A boolean that specifies whether the teams, their events and their matches should be 'shortened' and only contain more relevant information.
+
+        Returns:
+            A list in the same order as `team_keys` with a Team.Profile object for each team that was retrieved successfully or the exception that was raised while retrieving said team.
+        """  # noqa
+        return await self._get_by_keys(ApiClient._get_team_profile, team_keys, years=years, simple=simple)
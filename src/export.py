@@ -0,0 +1,398 @@
+import abc
+import datetime
+import json
+import os
+import typing
+
+from .schemas import *
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+__all__ = ["Exporter", "export", "NDJSONExporter", "ParquetExporter"]
+
+INT_COLUMNS = {
+    "set_number",
+    "match_number",
+    "red_score",
+    "blue_score",
+    "team_number",
+    "rookie_year",
+    "event_type",
+    "year",
+    "week",
+    "playoff_type",
+    "award_type",
+}
+FLOAT_COLUMNS = {"lat", "lng"}
+TIMESTAMP_COLUMNS = {"time", "actual_time", "predicted_time", "post_result_time", "start_date", "end_date"}
+LIST_COLUMNS = {
+    "red_team_keys",
+    "red_surrogate_team_keys",
+    "red_dq_team_keys",
+    "blue_team_keys",
+    "blue_surrogate_team_keys",
+    "blue_dq_team_keys",
+    "division_keys",
+}
+STRING_COLUMNS = {
+    "key",
+    "event_key",
+    "comp_level",
+    "winning_alliance",
+    "nickname",
+    "name",
+    "school_name",
+    "city",
+    "state_prov",
+    "country",
+    "postal_code",
+    "location_name",
+    "website",
+    "event_code",
+    "district_key",
+    "short_name",
+    "event_type_string",
+    "timezone",
+    "parent_event_key",
+    "playoff_type_string",
+    "team_key",
+    "awardee",
+}
+
+
+class Exporter(abc.ABC):
+    """Base class for streaming writers that export matches, teams, events and awards as flat rows, one chunk at a time."""  # noqa
+
+    def __init__(
+        self,
+        path: typing.Union[str, os.PathLike],
+        score_breakdown_fields: typing.Iterable[str] = (),
+        chunk_size: int = 10_000,
+    ):
+        """
+        Parameters:
+            path:
+                A path to the file to export to.
+            score_breakdown_fields:
+                An iterable of strings representing the fields of each alliance's score breakdown to include as columns of a match (eg 'autoPoints' becomes 'red_autoPoints' and 'blue_autoPoints').
+            chunk_size:
+                An integer representing the maximum amount of rows kept in memory before they're written to the file.
+        """  # noqa
+        self.path = path
+        self.score_breakdown_fields = list(score_breakdown_fields)
+        self.chunk_size = chunk_size
+        self.rows_written = 0
+
+        self._rows: list[dict] = []
+
+    def __enter__(self) -> "Exporter":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, items: typing.Iterable[typing.Union[Match, Team, Event, Award]]) -> None:
+        """
+        Adds rows to the file, writing them out every time `chunk_size` rows are buffered.
+
+        Parameters:
+            items:
+                An iterable (eg a generator) of Match, Team, Event or Award objects. Awards are exported with one row per recipient.
+        """  # noqa
+        for item in items:
+            self._rows.extend(self.rows(item))
+
+            if len(self._rows) >= self.chunk_size:
+                self.flush()
+
+    def flush(self) -> None:
+        """Writes every buffered row to the file."""
+        if self._rows:
+            self._write_chunk(self._rows)
+            self.rows_written += len(self._rows)
+            self._rows = []
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Writes every buffered row to the file and closes it."""
+
+    def rows(self, item: typing.Union[Match, Team, Event, Award]) -> list[dict]:
+        """
+        Flattens an object into the rows it's exported as.
+
+        Parameters:
+            item:
+                A Match, Team, Event or Award object.
+
+        Returns:
+            A list of dictionaries mapping each column to its value.
+        """
+        if isinstance(item, Match):
+            row = {
+                "key": item.key,
+                "event_key": item.event_key,
+                "comp_level": item.comp_level,
+                "set_number": item.set_number,
+                "match_number": item.match_number,
+                "winning_alliance": item.winning_alliance,
+                "time": item.time,
+                "actual_time": item.actual_time,
+                "predicted_time": item.predicted_time,
+                "post_result_time": item.post_result_time,
+            }
+
+            # Matches without alliances (eg ones that weren't scheduled yet) are exported with empty alliance columns
+            for color in ("red", "blue"):
+                match_alliance = (item.alliances or {}).get(color)
+                row[f"{color}_score"] = match_alliance.score if match_alliance else None
+                row[f"{color}_team_keys"] = match_alliance.team_keys if match_alliance else None
+                row[f"{color}_surrogate_team_keys"] = match_alliance.surrogate_team_keys if match_alliance else None
+                row[f"{color}_dq_team_keys"] = match_alliance.dq_team_keys if match_alliance else None
+
+            for color in ("red", "blue"):
+                alliance_breakdown = (item.score_breakdown or {}).get(color) or {}
+
+                for field in self.score_breakdown_fields:
+                    value = alliance_breakdown.get(field)
+                    row[f"{color}_{field}"] = json.dumps(value) if isinstance(value, (dict, list)) else value
+
+            return [row]
+        elif isinstance(item, Team):
+            return [
+                {
+                    "key": item.key,
+                    "team_number": item.team_number,
+                    "nickname": item.nickname,
+                    "name": item.name,
+                    "school_name": item.school_name,
+                    "city": item.city,
+                    "state_prov": item.state_prov,
+                    "country": item.country,
+                    "postal_code": item.postal_code,
+                    "lat": item.lat,
+                    "lng": item.lng,
+                    "rookie_year": item.rookie_year,
+                }
+            ]
+        elif isinstance(item, Event):
+            return [
+                {
+                    "key": item.key,
+                    "name": item.name,
+                    "short_name": item.short_name,
+                    "event_code": item.event_code,
+                    "event_type": item.event_type,
+                    "event_type_string": item.event_type_string,
+                    "district_key": item.district.key if item.district else None,
+                    "year": item.year,
+                    "week": item.week,
+                    "start_date": item.start_date,
+                    "end_date": item.end_date,
+                    "city": item.city,
+                    "state_prov": item.state_prov,
+                    "country": item.country,
+                    "postal_code": item.postal_code,
+                    "lat": item.lat,
+                    "lng": item.lng,
+                    "location_name": item.location_name,
+                    "timezone": item.timezone,
+                    "website": item.website,
+                    "parent_event_key": item.parent_event_key,
+                    "division_keys": item.division_keys,
+                    "playoff_type": item.playoff_type,
+                    "playoff_type_string": item.playoff_type_string,
+                }
+            ]
+        elif isinstance(item, Award):
+            return [
+                {
+                    "name": item.name,
+                    "award_type": item.award_type,
+                    "event_key": item.event_key,
+                    "year": item.year,
+                    "team_key": recipient.team_key,
+                    "awardee": recipient.awardee,
+                }
+                for recipient in item.recipient_list or [Award.AwardRecipient(team_key=None, awardee=None)]
+            ]
+        else:
+            raise TypeError(f"{type(item).__name__} objects can't be exported.")
+
+    @abc.abstractmethod
+    def _write_chunk(self, rows: list[dict]) -> None:
+        """Writes rows to the file."""
+
+
+class NDJSONExporter(Exporter):
+    """Exporter that writes one JSON object per line, with datetimes formatted in ISO 8601."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._file = open(self.path, "w")
+
+    def close(self) -> None:
+        self.flush()
+        self._file.close()
+
+    def _write_chunk(self, rows: list[dict]) -> None:
+        self._file.write("".join(f"{json.dumps(row, default=self._serialize)}\n" for row in rows))
+
+    @staticmethod
+    def _serialize(value: typing.Any) -> str:
+        if isinstance(value, datetime.datetime):
+            return value.isoformat()
+
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+class ParquetExporter(Exporter):
+    """
+    Exporter that writes a Parquet file with one row group per chunk (requires pyarrow).
+
+    The columns of the file are determined by the first chunk, so every row written must be of the same kind (eg matches).
+    The types of score breakdown columns are inferred from their values. If a later chunk doesn't fit a column's type (eg a float in a column of integers), the column is widened and the row groups written so far are rewritten with the wider type.
+    """  # noqa
+
+    def __init__(self, *args, **kwargs):
+        if pyarrow is None:
+            raise ImportError("pyarrow is required to export to Parquet (pip install falcon-alliance[parquet]).")
+
+        super().__init__(*args, **kwargs)
+        self.schema: typing.Optional["pyarrow.Schema"] = None
+
+        self._writer: typing.Optional["pyarrow.parquet.ParquetWriter"] = None
+
+    def close(self) -> None:
+        self.flush()
+
+        if self._writer is not None:
+            self._writer.close()
+
+    def _write_chunk(self, rows: list[dict]) -> None:
+        if self.schema is None:
+            self.schema = pyarrow.schema(
+                [(column, self._column_type(column, [row.get(column) for row in rows])) for column in rows[0]]
+            )
+            self._writer = pyarrow.parquet.ParquetWriter(self.path, self.schema)
+
+        for row in rows:
+            if row.keys() - set(self.schema.names):
+                raise ValueError(f"Row with columns {list(row)} doesn't match the schema of {self.path}.")
+
+        schema = pyarrow.schema(
+            [
+                (
+                    field.name,
+                    self._widen(field.type, self._column_type(field.name, [row.get(field.name) for row in rows])),
+                )
+                for field in self.schema
+            ]
+        )
+
+        if schema != self.schema:
+            self._rewrite(schema)
+
+        columns = []
+
+        for field in self.schema:
+            values = [row.get(field.name) for row in rows]
+
+            if pyarrow.types.is_string(field.type):
+                values = [value if value is None else str(value) for value in values]
+
+            columns.append(pyarrow.array(values, type=field.type))
+
+        self._writer.write_table(pyarrow.Table.from_arrays(columns, schema=self.schema))
+
+    def _rewrite(self, schema: "pyarrow.Schema") -> None:
+        """Rewrites the row groups written so far with a wider schema, which every following chunk is written with."""
+        self._writer.close()
+        written_table = pyarrow.parquet.read_table(self.path).cast(schema)
+
+        self.schema = schema
+        self._writer = pyarrow.parquet.ParquetWriter(self.path, schema)
+        self._writer.write_table(written_table, row_group_size=self.chunk_size)
+
+    @staticmethod
+    def _column_type(column: str, values: list) -> "pyarrow.DataType":
+        """
+        Determines the Arrow type of a column.
+
+        Parameters:
+            column:
+                A string representing the name of the column.
+            values:
+                A list of the column's values in a chunk, used to infer the type of score breakdown columns.
+
+        Returns:
+            A pyarrow.DataType object representing the type of the column (the null type for score breakdown columns without any values yet).
+        """  # noqa
+        if column in INT_COLUMNS:
+            return pyarrow.int64()
+        elif column in FLOAT_COLUMNS:
+            return pyarrow.float64()
+        elif column in TIMESTAMP_COLUMNS:
+            return pyarrow.timestamp("s")
+        elif column in LIST_COLUMNS:
+            return pyarrow.list_(pyarrow.string())
+        elif column in STRING_COLUMNS:
+            return pyarrow.string()
+
+        values = [value for value in values if value is not None]
+
+        if not values:
+            return pyarrow.null()
+        elif all(isinstance(value, bool) for value in values):
+            return pyarrow.bool_()
+        elif all(isinstance(value, int) and not isinstance(value, bool) for value in values):
+            return pyarrow.int64()
+        elif all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in values):
+            return pyarrow.float64()
+        else:
+            return pyarrow.string()
+
+    @staticmethod
+    def _widen(column_type: "pyarrow.DataType", values_type: "pyarrow.DataType") -> "pyarrow.DataType":
+        """Determines the narrowest Arrow type that fits values of both types."""
+        if column_type == values_type or pyarrow.types.is_null(values_type):
+            return column_type
+        elif pyarrow.types.is_null(column_type):
+            return values_type
+        elif {column_type, values_type} <= {pyarrow.int64(), pyarrow.float64()}:
+            return pyarrow.float64()
+        else:
+            return pyarrow.string()
+
+
+def export(
+    path: typing.Union[str, os.PathLike],
+    items: typing.Iterable[typing.Union[Match, Team, Event, Award]],
+    score_breakdown_fields: typing.Iterable[str] = (),
+    chunk_size: int = 10_000,
+) -> int:
+    """
+    Exports matches, teams, events or awards to a file, choosing its format based off its extension.
+
+    Parameters:
+        path:
+            A path to the file to export to. Files ending in '.parquet' are written as Parquet and every other file is written as newline-delimited JSON.
+        items:
+            An iterable (eg a generator) of Match, Team, Event or Award objects.
+        score_breakdown_fields:
+            An iterable of strings representing the fields of each alliance's score breakdown to include as columns of a match.
+        chunk_size:
+            An integer representing the maximum amount of rows kept in memory before they're written to the file.
+
+    Returns:
+        An integer representing the amount of rows written.
+    """  # noqa
+    exporter_type = ParquetExporter if os.fspath(path).endswith(".parquet") else NDJSONExporter
+
+    with exporter_type(path, score_breakdown_fields, chunk_size) as exporter:
+        exporter.write(items)
+
+    return exporter.rows_written
@@ -0,0 +1,46 @@
+import os
+import typing
+
+from .utils import *
+
+__all__ = ["Job"]
+
+
+class Job:
+    """Class representing a resumable bulk download that records the response of every URL it retrieves to a checkpoint."""  # noqa
+
+    def __init__(self, checkpoint: typing.Union[str, os.PathLike, Checkpoint], verify: bool = True):
+        """
+        Parameters:
+            checkpoint:
+                A path to the checkpoint file (SQLite if it ends in '.db', '.sqlite' or '.sqlite3' and JSON Lines otherwise) or a Checkpoint object. If the file already exists, the responses in it are reused instead of being retrieved again so that an interrupted download can be resumed.
+            verify:
+                A boolean representing whether the integrity of every recorded response should be checked when the job is opened, so that corrupted responses are retrieved again.
+        """  # noqa
+        self.checkpoint = checkpoint if isinstance(checkpoint, Checkpoint) else Checkpoint.open(checkpoint)
+        self.corrupted_urls = self.checkpoint.verify() if verify else []
+
+    def __enter__(self) -> "Job":
+        if InternalData.checkpoint is not None:
+            raise RuntimeError("Another job is already running.")
+
+        InternalData.checkpoint = self.checkpoint
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        InternalData.checkpoint = None
+        self.checkpoint.close()
+
+    async def __aenter__(self) -> "Job":
+        return self.__enter__()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.__exit__(*exc_info)
+
+    @property
+    def completed_urls(self) -> list[str]:
+        """The URLs whose responses were recorded to the checkpoint so far."""
+        return self.checkpoint.urls()
+
+    def __len__(self) -> int:
+        return len(self.checkpoint)
@@ -12,6 +12,8 @@ except ImportError:
 class Award(BaseSchema):
     """Class representing an award's information for a team or during an event."""
 
+    _converted_fields = frozenset({"recipient_list"})
+
     @dataclass
     class AwardRecipient:
         team_key: str
@@ -1,9 +1,25 @@
+import collections
+import functools
+import typing
+
+try:
+    from utils import InternalData
+except ImportError:
+    from ..utils import InternalData
+
+
 class BaseSchema:
     """Base class for all schemas."""
 
     _headers = None
 
-    def __init__(self):
+    # Attributes that are converted from the data TBA returns instead of being stored as is
+    _converted_fields: frozenset[str] = frozenset()
+
+    def __eq__(self, other):
+        return vars(self) == vars(other)
+
+    def __repr__(self):  # pragma: no cover
         attributes_formatted = ""
 
         for attr_name, attr_value in vars(self).items():
@@ -19,13 +35,7 @@ class BaseSchema:
             else:
                 attributes_formatted += f"{attr_name}={attr_value!r}, "
 
-        self._attributes_formatted = attributes_formatted[:-2]
-
-    def __eq__(self, other):
-        return vars(self) == vars(other)
-
-    def __repr__(self):  # pragma: no cover
-        return f"{type(self).__name__}({self._attributes_formatted})"
+        return f"{type(self).__name__}({attributes_formatted[:-2]})"
 
     @classmethod
     def add_headers(cls, headers: dict) -> None:
@@ -36,3 +46,118 @@ class BaseSchema:
             headers: A dictionary that is in the format of {"X-TBA-Auth-Key": api_key} for TBA be able to authorize sending requests.
         """
         cls._headers = headers
+
+    @classmethod
+    def _construct_all(cls, items_data: list[dict]) -> list["BaseSchema"]:
+        """
+        Constructs an object for every item (the constructor `InternalData.get_objects` converts full responses with).
+
+        Items that were constructed before and didn't change since (eg a team in `Event.teams` of every event it attended) reuse the same object through `InternalData.identity_map`, so objects returned by different methods can be the same object and shouldn't be modified.
+
+        Parameters:
+            items_data: A list of dictionaries containing the data of each item (eg from TBA's response).
+
+        Returns:
+            A list of objects of this schema.
+        """  # noqa
+        identity_map = InternalData.identity_map
+
+        if identity_map is None:
+            return [cls(**item_data) for item_data in items_data]
+
+        return [identity_map.construct(cls, item_data) for item_data in items_data]
+
+    @classmethod
+    def _constructor(cls, fields: typing.Optional[typing.Iterable[str]] = None) -> typing.Callable[[list[dict]], list]:
+        """
+        Retrieves the function that converts a response containing items of this schema, which can be run in a parse worker process.
+
+        Parameters:
+            fields: An iterable of strings representing the only attributes each item should have, or None to construct full objects.
+
+        Returns:
+            A picklable function that takes in a list of dictionaries and returns a list of objects or named tuples.
+        """  # noqa
+        if fields is None:
+            return cls._construct_all
+
+        return functools.partial(cls._construct_projections, fields=tuple(fields))
+
+    @classmethod
+    def _construct_projections(cls, items_data: list[dict], fields: typing.Iterable[str]) -> list[tuple]:
+        """
+        Constructs lightweight objects containing only some of the attributes of each item, skipping the conversion of every other field.
+
+        Parameters:
+            items_data: A list of dictionaries containing the data of each item (eg from TBA's response).
+            fields: An iterable of strings representing the attributes to keep (eg ['key', 'alliances', 'winning_alliance']).
+
+        Returns:
+            A list of named tuples containing the requested attributes of each item, converted the same way as they are for the full objects.
+        """  # noqa
+        fields = tuple(fields)
+
+        if not items_data:
+            return []
+
+        # Validates the fields against a full object so that misspelled attributes raise an error
+        cls._project([cls(**items_data[0])], fields)
+
+        projection_type = _projection_type(cls.__name__, fields)
+        converted_fields = [field for field in fields if field in cls._converted_fields]
+        projections = []
+
+        for item_data in items_data:
+            if converted_fields:
+                item = cls(**{field: item_data[field] for field in ("key", *converted_fields) if field in item_data})
+                projections.append(
+                    projection_type._make(
+                        [
+                            getattr(item, field) if field in cls._converted_fields else item_data.get(field)
+                            for field in fields
+                        ]
+                    )
+                )
+            else:
+                projections.append(projection_type._make([item_data.get(field) for field in fields]))
+
+        return projections
+
+    @classmethod
+    def _project(cls, items: list["BaseSchema"], fields: typing.Iterable[str]) -> list[tuple]:
+        """
+        Converts objects into lightweight named tuples containing only some of their attributes.
+
+        Parameters:
+            items: A list of objects of this schema.
+            fields: An iterable of strings representing the attributes to keep.
+
+        Returns:
+            A list of named tuples containing the requested attributes of each object.
+        """
+        fields = tuple(fields)
+        projection_type = _projection_type(cls.__name__, fields)
+
+        if items and not all(hasattr(items[0], field) for field in fields):
+            raise ValueError(
+                f"{cls.__name__} objects don't have the attribute(s) "
+                f"{', '.join(field for field in fields if not hasattr(items[0], field))}."
+            )
+
+        return [projection_type._make([getattr(item, field) for field in fields]) for item in items]
+
+
+@functools.lru_cache(maxsize=None)
+def _projection_type(schema_name: str, fields: tuple[str, ...]) -> type:
+    """Creates (once per set of fields) the named tuple type that projections of a schema are constructed as."""
+    projection_type = collections.namedtuple(f"{schema_name}Projection", fields)
+
+    # The type is created at runtime so it can't be pickled by reference (eg when projections are sent back from a parse worker process)  # noqa
+    projection_type.__reduce__ = lambda projection: (_make_projection, (schema_name, fields, tuple(projection)))
+
+    return projection_type
+
+
+def _make_projection(schema_name: str, fields: tuple[str, ...], values: tuple) -> tuple:
+    """Recreates a pickled projection, creating its named tuple type if it doesn't exist in this process yet."""
+    return _projection_type(schema_name, fields)._make(values)
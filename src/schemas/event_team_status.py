@@ -28,6 +28,9 @@ class EventTeamStatus:
         def __repr__(self):  # pragma: no cover
             return f"SortOrders({self._attributes_formatted.rstrip(', ')})"
 
+        def __eq__(self, other):
+            return vars(self) == vars(other)
+
     @dataclass()
     class Ranking:
         """Class representing a team's ranking information during qualifications of an event."""
@@ -141,5 +144,8 @@ class EventTeamStatus:
         self._attributes_formatted += "qual=Qualifications(...)"
         self._attributes_formatted = self._attributes_formatted.replace("self.", "")
 
+    def __eq__(self, other):
+        return vars(self) == vars(other)
+
     def __repr__(self) -> str:  # pragma: no cover
         return f"EventTeamStatus({self._attributes_formatted})"
@@ -3,7 +3,7 @@ import datetime
 import functools
 import itertools
 import typing
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from re import match
 from statistics import mean
 
@@ -16,8 +16,10 @@ from .robot import Robot
 
 try:
     from utils import *
+    from utils.fan_out import REQUEST_ERRORS
 except ImportError:
     from ..utils import *
+    from ..utils.fan_out import REQUEST_ERRORS
 
 __all__ = ["District", "Event", "Team"]
 PARSING_FORMAT = "%Y-%m-%d"
@@ -86,7 +88,9 @@ class District(BaseSchema):
         self,
         simple: bool = False,
         keys: bool = False,
-    ) -> list[typing.Union[str, "Event"]]:
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        raw: bool = False,
+    ) -> typing.Union[list[typing.Union[str, "Event", tuple]], CachedResponse]:
         """
         Retrieves a list of events in the given district.
 
@@ -95,28 +99,40 @@ class District(BaseSchema):
                 A boolean that specifies whether the results for each event should be 'shortened' and only contain more relevant information.
             keys:
                 A boolean that specifies whether only the keys of the events in a given district should be retrieved.
+            fields:
+                An iterable of strings representing the only attributes each event should have (eg ['key', 'week', 'start_date']), which returns lightweight named tuples instead of Event objects to skip converting every other field. Can be None to return Event objects.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
 
         Returns:
             A list of strings with each string representing an event's key for all the events in the given district or a list of Event objects with each object representing an event in the given district.
         """  # noqa
         if simple and keys:
             raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
+        elif keys and fields is not None:
+            raise ValueError(
+                "fields cannot be passed in if keys is True, since only the keys of the events are retrieved."
+            )
 
-        response = await InternalData.get(
-            url=construct_url("district", key=self.key, endpoint="events", simple=simple, keys=keys),
+        url = ENDPOINTS["district_events"].url(self.key, simple=simple, keys=keys)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        return await InternalData.get_objects(
+            url=url,
             headers=self._headers,
+            constructor=list if keys else Event._constructor(fields),
+            compact=fields is not None,
         )
-        if keys:
-            return response
-        else:
-            return [Event(**event_data) for event_data in response]
 
     @synchronous
     async def teams(
         self,
         simple: bool = False,
         keys: bool = False,
-    ) -> list[typing.Union[str, "Team"]]:
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        raw: bool = False,
+    ) -> typing.Union[list[typing.Union[str, "Team", tuple]], CachedResponse]:
         """
         Retrieves a list of teams in the given district.
 
@@ -125,39 +141,57 @@ class District(BaseSchema):
                 A boolean that specifies whether the results for each team should be 'shortened' and only contain more relevant information.
             keys:
                 A boolean that specifies whether only the keys of the teams in a given district should be retrieved.
+            fields:
+                An iterable of strings representing the only attributes each team should have (eg ['key', 'nickname']), which returns lightweight named tuples instead of Team objects to skip converting every other field. Can be None to return Team objects.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
 
         Returns:
             A list of strings with each string representing a team's key for all the teams in the given district or a list of Team objects with each object representing a team in the given district.
         """  # noqa
         if simple and keys:
             raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
+        elif keys and fields is not None:
+            raise ValueError(
+                "fields cannot be passed in if keys is True, since only the keys of the teams are retrieved."
+            )
 
-        response = await InternalData.get(
-            url=construct_url("district", key=self.key, endpoint="teams", simple=simple, keys=keys),
+        url = ENDPOINTS["district_teams"].url(self.key, simple=simple, keys=keys)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        return await InternalData.get_objects(
+            url=url,
             headers=self._headers,
+            constructor=list if keys else Team._constructor(fields),
+            compact=fields is not None,
         )
-        if keys:
-            return response
-        else:
-            return [Team(**event_data) for event_data in response]
 
     @synchronous
-    async def rankings(self) -> list[Ranking]:
+    async def rankings(self, raw: bool = False) -> typing.Union[list[Ranking], CachedResponse]:
         """
         Retrieves a list of team district rankings for the given district.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             A list of Ranking objects with each Ranking object representing a team's district ranking for the given district.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("district", key=self.key, endpoint="rankings"), headers=self._headers
-        )
+        url = ENDPOINTS["district_rankings"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         return [self.Ranking(**team_ranking_data) for team_ranking_data in response]
 
 
 class Event(BaseSchema):
     """Class representing an event containing methods to get specific event information."""
 
+    _converted_fields = frozenset({"district", "start_date", "end_date", "webcasts"})
+
     @dataclass()
     class DistrictPoints:
         """Class representing an event's district points given for all teams."""
@@ -260,6 +294,9 @@ class Event(BaseSchema):
         def __repr__(self):  # pragma: no cover
             return f"ExtraStats({self._attributes_formatted.rstrip(', ')})"
 
+        def __eq__(self, other):
+            return vars(self) == vars(other)
+
     class SortOrders:
         """Information about the team used to determine ranking for an event."""
 
@@ -275,6 +312,9 @@ class Event(BaseSchema):
         def __repr__(self):  # pragma: no cover
             return f"SortOrders({self._attributes_formatted.rstrip(', ')})"
 
+        def __eq__(self, other):
+            return vars(self) == vars(other)
+
     @dataclass()
     class Ranking:
         """Class representing a team's ranking during an event."""
@@ -301,6 +341,87 @@ class Event(BaseSchema):
             if self.date:
                 self.date: datetime.datetime = datetime.datetime.strptime(self.date, PARSING_FORMAT)
 
+    @dataclass()
+    class Snapshot:
+        """Class representing everything about an event at a point in time, with its data linked together."""
+
+        # Sections that are left as None if they fail to be retrieved instead of failing the whole snapshot
+        OPTIONAL_SECTIONS: typing.ClassVar[frozenset[str]] = frozenset({"insights", "predictions", "district_points"})
+
+        event: "Event"
+        teams: dict[str, "Team"]
+        matches: list[Match]
+        rankings: dict[str, "Event.Ranking"]
+        alliances: list["Event.Alliance"]
+        awards: list[Award]
+        oprs: "Event.OPRs"
+        insights: typing.Optional["Event.Insights"]
+        predictions: typing.Optional[dict]
+        district_points: typing.Optional["Event.DistrictPoints"]
+        errors: dict[str, BaseException] = field(default_factory=dict)
+
+        def __post_init__(self):
+            self._alliances_by_team = {
+                team_key: alliance
+                for alliance in self.alliances
+                for team_key in alliance.picks + ([alliance.backup["in"]] if alliance.backup else [])
+            }
+
+        @property
+        def ranked_teams(self) -> list[tuple["Team", "Event.Ranking"]]:
+            """A list of tuples containing each ranked team and its ranking, ordered by rank."""
+            return [
+                (self.teams.get(team_key) or Team(team_key), ranking)
+                for team_key, ranking in sorted(self.rankings.items(), key=lambda ranking_item: ranking_item[1].rank)
+            ]
+
+        def alliance_of(self, team_key: str) -> typing.Optional["Event.Alliance"]:
+            """
+            Retrieves the playoff alliance a team was on during the event.
+
+            Parameters:
+                team_key:
+                    A string representing the key of the team (eg 'frc4099').
+
+            Returns:
+                An Alliance object representing the team's playoff alliance or None if the team wasn't on one.
+            """
+            return self._alliances_by_team.get(team_key)
+
+        def match_alliances(self, match: Match) -> dict[str, typing.Optional["Event.Alliance"]]:
+            """
+            Retrieves the playoff alliances that played in a match.
+
+            Parameters:
+                match:
+                    A Match object representing a match from the event.
+
+            Returns:
+                A dictionary mapping each color ('red' and 'blue') to the Alliance object that played as that color or None if no playoff alliance did (eg in qualification matches).
+            """  # noqa
+            return {
+                color: next(filter(None, (self.alliance_of(team_key) for team_key in match_alliance.team_keys)), None)
+                for color, match_alliance in (match.alliances or {}).items()
+            }
+
+        def team_matches(self, team_key: str) -> list[Match]:
+            """
+            Retrieves all the matches a team played during the event.
+
+            Parameters:
+                team_key:
+                    A string representing the key of the team (eg 'frc4099').
+
+            Returns:
+                A list of Match objects representing each match the team played.
+            """
+            return [
+                game_match
+                for game_match in self.matches
+                if game_match.alliances
+                and any(team_key in match_alliance.team_keys for match_alliance in game_match.alliances.values())
+            ]
+
     def __init__(self, *args, **kwargs):
         if len(args) == 1:
             (self.key,) = args
@@ -318,16 +439,15 @@ class Event(BaseSchema):
         self.state_prov: typing.Optional[str] = kwargs.get("state_prov")
         self.country: typing.Optional[str] = kwargs.get("country")
 
-        try:
-            self.start_date: typing.Optional[datetime.datetime] = datetime.datetime.strptime(
-                kwargs["start_date"], PARSING_FORMAT
-            )
-            self.end_date: typing.Optional[datetime.datetime] = datetime.datetime.strptime(
-                kwargs["end_date"], PARSING_FORMAT
-            )
-        except KeyError:
-            self.start_date = None
-            self.end_date = None
+        start_date = kwargs.get("start_date")
+        end_date = kwargs.get("end_date")
+
+        self.start_date: typing.Optional[datetime.datetime] = (
+            datetime.datetime.strptime(start_date, PARSING_FORMAT) if start_date else None
+        )
+        self.end_date: typing.Optional[datetime.datetime] = (
+            datetime.datetime.strptime(end_date, PARSING_FORMAT) if end_date else None
+        )
 
         self.year: typing.Optional[int] = kwargs.get("year")
 
@@ -382,60 +502,106 @@ class Event(BaseSchema):
 
         return wrapper
 
+    @classmethod
+    def _construct_ranking(cls, rank_info: dict, rankings_info: dict) -> "Event.Ranking":
+        """
+        Constructs a team's ranking from the response of TBA's rankings endpoint for an event.
+
+        Parameters:
+            rank_info:
+                A dictionary containing the ranking information of one team.
+            rankings_info:
+                A dictionary representing the whole response, containing the names of the extra stats and sort orders.
+
+        Returns:
+            A Ranking object representing the team's ranking during the event.
+        """
+        return cls.Ranking(
+            **{
+                **rank_info,
+                "extra_stats": cls.ExtraStats(rank_info["extra_stats"], rankings_info["extra_stats_info"]),
+                "sort_orders": cls.SortOrders(rank_info["sort_orders"], rankings_info["sort_order_info"]),
+            }
+        )
+
     @synchronous
-    async def alliances(self) -> list[Alliance]:
+    async def alliances(self, raw: bool = False) -> typing.Union[list[Alliance], CachedResponse]:
         """
         Retrieves all alliances of an event.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             A list of Alliance objects representing each alliance in the event.
-        """
-        response = await InternalData.get(
-            url=construct_url("event", key=self.key, endpoint="alliances"), headers=self._headers
-        )
-        return [self.Alliance(**alliance_info) for alliance_info in response]
+        """  # noqa
+        url = ENDPOINTS["event_alliances"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
+        return [self.Alliance(**alliance_info) for alliance_info in response or []]
 
     @synchronous
-    async def awards(self) -> list[Award]:
+    async def awards(self, raw: bool = False) -> typing.Union[list[Award], CachedResponse]:
         """
         Retrieves all awards distributed in an event.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             A list of Award objects representing each award distributed in an event.
-        """
-        response = await InternalData.get(
-            url=construct_url("event", key=self.key, endpoint="awards"), headers=self._headers
-        )
+        """  # noqa
+        url = ENDPOINTS["event_awards"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         return [Award(**award_info) for award_info in response]
 
     @synchronous
-    async def district_points(self) -> typing.Optional[DistrictPoints]:
+    async def district_points(self, raw: bool = False) -> typing.Optional[typing.Union[DistrictPoints, CachedResponse]]:
         """
         Retrieves district points for teams during an event for both qualification and tiebreaker matches.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             A DistrictPoints object containing "points" and "tiebreakers" fields, with each field possessing a dictionary mapping team keys to their points or None if the event doesn't take place in a district or district points are not applicable to the event.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("event", key=self.key, endpoint="district_points"), headers=self._headers
-        )
+        url = ENDPOINTS["event_district_points"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         event_district_points = response
 
         if event_district_points:
             return self.DistrictPoints(**event_district_points)
 
     @synchronous
-    async def insights(self) -> typing.Optional[Insights]:
+    async def insights(self, raw: bool = False) -> typing.Optional[typing.Union[Insights, CachedResponse]]:
         """
         Retrieves insights of an event (specific data about performance and the like at the event; specific by game).
         Insights can only be retrieved for any events from 2016 and onwards.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             An Insight object containing qualification and playoff insights from the event. Can be None if the event hasn't occurred yet, and the fields of Insight may be None depending on how far the event has advanced.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("event", key=self.key, endpoint="insights"), headers=self._headers
-        )
+        url = ENDPOINTS["event_insights"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         insights = response
 
         if insights:
@@ -443,8 +609,13 @@ class Event(BaseSchema):
 
     @synchronous
     async def matches(
-        self, simple: bool = False, keys: bool = False, timeseries: bool = False
-    ) -> list[typing.Union[str, Match]]:
+        self,
+        simple: bool = False,
+        keys: bool = False,
+        timeseries: bool = False,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        raw: bool = False,
+    ) -> typing.Union[list[typing.Union[str, Match, tuple]], CachedResponse]:
         """
         Retrieves all matches that occurred during an event.
 
@@ -457,6 +628,10 @@ class Event(BaseSchema):
                 A boolean that specifies whether only the keys of the matches should be retrieved.
             timeseries:
                 A boolean that specifies whether only the keys of the matches that have timeseries data should be retrieved.
+            fields:
+                An iterable of strings representing the only attributes each match should have (eg ['key', 'alliances', 'winning_alliance']), which returns lightweight named tuples instead of Match objects to skip converting every other field. Can be None to return Match objects.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
 
         Returns:
             A dictionary with team keys as the keys of the dictionary and an EventTeamStatus object representing the status of said team as the values of the dictionary or a list of strings representing the keys of the teams that participated in an event or a list of Team objects, each representing a team that participated in an event.
@@ -466,30 +641,38 @@ class Event(BaseSchema):
                 "Only one parameter out of `simple`, `keys`, and `statuses`"
                 " can be True. You can't mix and match parameters."
             )
+        elif (keys or timeseries) and fields is not None:
+            raise ValueError("fields cannot be passed in if keys or timeseries is True, since only keys are retrieved.")
 
-        response = await InternalData.get(
-            url=construct_url(
-                "event", key=self.key, endpoint="matches", simple=simple, keys=keys, timeseries=timeseries
-            ),
+        url = ENDPOINTS["event_matches"].url(self.key, simple=simple, keys=keys, timeseries=timeseries)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        return await InternalData.get_objects(
+            url=url,
             headers=self._headers,
+            constructor=list if keys or timeseries else Match._constructor(fields),
+            compact=fields is not None,
         )
-        if keys or timeseries:
-            return response
-        else:
-            return [Match(**match_data) for match_data in response]
 
     @synchronous
-    async def oprs(self) -> OPRs:
+    async def oprs(self, raw: bool = False) -> typing.Union[OPRs, CachedResponse]:
         """
         Retrieves different metrics for all teams during an event.
         To see an explanation on OPR and other metrics retrieved from an event, see https://www.thebluealliance.com/opr.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             An OPRs object containing a key/value pair for the OPRs, DPRs, and CCWMs of all teams at an event. The fields of `OPRs` may be empty if OPRs, DPRs, and CCWMs weren't calculated.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("event", key=self.key, endpoint="oprs"), headers=self._headers
-        )
+        url = ENDPOINTS["event_oprs"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         metric_data = response
 
         if metric_data:
@@ -498,44 +681,99 @@ class Event(BaseSchema):
             return self.OPRs(oprs={}, dprs={}, ccwms={})
 
     @synchronous
-    async def predictions(self) -> dict:
+    async def predictions(self, raw: bool = False) -> typing.Union[dict, CachedResponse]:
         """
         Retrieves predictions for matches of an event. May not work for all events since this endpoint is in beta per TBA.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             A dictionary containing the predictions of an event from TBA (contains year-specific information). May be an empty dictionary if there are no predictions available for that event.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("event", key=self.key, endpoint="predictions"), headers=self._headers
-        )
+        url = ENDPOINTS["event_predictions"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         return response
 
     @synchronous
-    async def rankings(self) -> dict[str, Ranking]:
+    async def rankings(self, raw: bool = False) -> typing.Union[dict[str, Ranking], CachedResponse]:
         """
         Retrieves a list of team rankings for an event.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             A dictionary with team keys as the keys of the dictionary and Ranking objects for that team's information about their ranking at an event as values of the dictionary.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("event", key=self.key, endpoint="rankings"), headers=self._headers
-        )
+        url = ENDPOINTS["event_rankings"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         rankings_info = response
-        rankings_dict = {}
 
-        for rank_info in rankings_info["rankings"]:
-            rank_info["extra_stats"] = self.ExtraStats(rank_info["extra_stats"], rankings_info["extra_stats_info"])
-            rank_info["sort_orders"] = self.SortOrders(rank_info["sort_orders"], rankings_info["sort_order_info"])
+        return {
+            rank_info["team_key"]: self._construct_ranking(rank_info, rankings_info)
+            for rank_info in (rankings_info or {}).get("rankings") or []
+        }
 
-            rankings_dict[rank_info["team_key"]] = self.Ranking(**rank_info)
+    @synchronous
+    async def snapshot(self) -> Snapshot:
+        """
+        Retrieves an event's information, teams, matches, rankings, alliances, awards, OPRs, insights, predictions and district points concurrently.
 
-        return rankings_dict
+        If the insights, predictions or district points fail to be retrieved because of a request error (eg TBA responding with a server error), they're left as None and the error is recorded in the `errors` attribute of the snapshot. If any other section fails, the requests that are still running are cancelled and the error is raised.
+
+        Returns:
+            A Snapshot object containing everything about the event, with rankings linked to Team objects and matches linked to playoff alliances.
+        """  # noqa
+        sections = {
+            "event": lambda: InternalData.get(url=ENDPOINTS["event"].url(self.key), headers=self._headers),
+            "teams": lambda: self.teams.coro(self),
+            "matches": lambda: self.matches.coro(self),
+            "rankings": lambda: self.rankings.coro(self),
+            "alliances": lambda: self.alliances.coro(self),
+            "awards": lambda: self.awards.coro(self),
+            "oprs": lambda: self.oprs.coro(self),
+            "insights": lambda: self.insights.coro(self),
+            "predictions": lambda: self.predictions.coro(self),
+            "district_points": lambda: self.district_points.coro(self),
+        }
+        errors = {}
+
+        async def retrieve_section(section: str) -> typing.Any:
+            try:
+                return await sections[section]()
+            except REQUEST_ERRORS as error:
+                if section not in self.Snapshot.OPTIONAL_SECTIONS:
+                    raise
+
+                errors[section] = error
+
+        results = dict(zip(sections, await fan_out(retrieve_section, sections, limit=len(sections))))
+
+        return self.Snapshot(
+            event=Event(**results.pop("event")),
+            teams={team.key: team for team in results.pop("teams")},
+            errors=errors,
+            **results,
+        )
 
     @synchronous
     async def teams(
-        self, simple: bool = False, keys: bool = False, statuses: bool = False
-    ) -> typing.Union[list[typing.Union[str, "Team"]], dict[str, EventTeamStatus]]:
+        self,
+        simple: bool = False,
+        keys: bool = False,
+        statuses: bool = False,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        raw: bool = False,
+    ) -> typing.Union[list[typing.Union[str, "Team", tuple]], dict[str, EventTeamStatus], CachedResponse]:
         """
         Retrieves all teams who participated at an event.
 
@@ -546,6 +784,10 @@ class Event(BaseSchema):
                 A boolean that specifies whether only the names of the FRC teams should be retrieved.
             statuses:
                 A boolean that specifies whether a key/value pair of the statuses of teams in an event should be returned.
+            fields:
+                An iterable of strings representing the only attributes each team should have (eg ['key', 'nickname']), which returns lightweight named tuples instead of Team objects to skip converting every other field. Can be None to return Team objects.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
 
         Returns:
             A dictionary with team keys as the keys of the dictionary and an EventTeamStatus object representing the status of said team as the values of the dictionary or a list of strings representing the keys of the teams that participated in an event or a list of Team objects, each representing a team that participated in an event.
@@ -555,26 +797,51 @@ class Event(BaseSchema):
                 "Only one parameter out of `simple`, `keys`, and `statuses` can be True."
                 " You can't mix and match parameters."
             )
+        elif (keys or statuses) and fields is not None:
+            raise ValueError("fields cannot be passed in if keys or statuses is True.")
+
+        url = ENDPOINTS["event_teams"].url(self.key, simple=simple, keys=keys, statuses=statuses)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        if not statuses:
+            return await InternalData.get_objects(
+                url=url,
+                headers=self._headers,
+                constructor=list if keys else Team._constructor(fields),
+                compact=fields is not None,
+            )
 
-        response = await InternalData.get(
-            url=construct_url("event", key=self.key, endpoint="teams", simple=simple, keys=keys, statuses=statuses),
-            headers=self._headers,
-        )
-        if keys:
-            return response
-        elif statuses:
-            return {
-                team_key: EventTeamStatus(team_key, team_status_info)
-                for team_key, team_status_info in response.items()
-                if team_status_info
-            }
-        else:
-            return [Team(**team_data) for team_data in response]
+        response = await InternalData.get(url=url, headers=self._headers)
+        return {
+            team_key: EventTeamStatus(team_key, team_status_info)
+            for team_key, team_status_info in response.items()
+            if team_status_info
+        }
 
 
 class Team(BaseSchema):
     """Class representing a team's metadata with methods to get team specific data."""
 
+    _converted_fields = frozenset({"team_number"})
+
+    @dataclass()
+    class Profile:
+        """Class representing everything about a team across multiple years."""
+
+        team: "Team"
+        years: list[int]
+        events: list[Event]
+        matches: list[Match]
+        awards: list[Award]
+        robots: list[Robot]
+        districts: list[District]
+        media: list[Media]
+        social_media: list[Media]
+
+    # The amount of seconds the years a team participated in are reused for before they are retrieved again.
+    YEARS_PARTICIPATED_MAX_AGE = 24 * 60 * 60
+
     def __init__(self, *args, **kwargs):
         if len(args) == 2:
             if isinstance(args[0], int) and isinstance(args[1], str):
@@ -632,29 +899,61 @@ class Team(BaseSchema):
 
         return wrapper
 
+    async def _get_years_within(self, year: range) -> tuple[list[int], bool]:
+        """
+        Determines which years in a range a team participated in and whether retrieving data from every year at once would be cheaper than retrieving it year by year.
+
+        Parameters:
+            year:
+                A range object representing the years to retrieve data from.
+
+        Returns:
+            A tuple containing a list of integers representing the years within the range the team participated in and a boolean representing whether those years cover most of the team's career.
+        """  # noqa
+        years_participated = await self.years_participated.coro(self)
+        years = [spec_year for spec_year in year if spec_year in years_participated]
+
+        return years, len(years) > 1 and 2 * len(years) > len(years_participated)
+
     async def _get_year_events(
-        self, year: int, simple: bool, keys: bool, statuses: bool
-    ) -> typing.Union[list[typing.Union[str, Event]], dict[str, EventTeamStatus]]:
-        response = await InternalData.get(
-            url=construct_url(
-                "team", key=self.key, endpoint="events", year=year, simple=simple, keys=keys, statuses=statuses
-            ),
+        self,
+        year: typing.Optional[int],
+        simple: bool,
+        keys: bool,
+        statuses: bool,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        years: typing.Optional[list[int]] = None,
+        ordered: bool = False,
+    ) -> typing.Union[list[typing.Union[str, Event, tuple]], dict[str, EventTeamStatus]]:
+        if statuses:
+            constructor = _construct_event_statuses
+        else:
+            constructor = list if keys else Event._constructor(fields)
+
+            if years is not None or ordered:
+                constructor = functools.partial(
+                    _select_events,
+                    constructor=constructor,
+                    keys=keys,
+                    years=None if years is None else tuple(years),
+                    ordered=ordered,
+                )
+
+        return await InternalData.get_objects(
+            url=ENDPOINTS["team_events"].url(self.key, year=year, simple=simple, keys=keys, statuses=statuses),
             headers=self._headers,
+            constructor=constructor,
+            compact=fields is not None,
         )
-        if keys:
-            return response
-        elif not statuses:
-            return [Event(**event_data) for event_data in response]
-        else:
-            return {
-                event_key: EventTeamStatus(event_key, team_status_info)
-                for event_key, team_status_info in response.items()
-                if team_status_info
-            }
 
     async def _get_year_matches(
-        self, year: int, event_code: typing.Optional[str], simple: bool, keys: bool
-    ) -> list[Match]:
+        self,
+        year: int,
+        event_code: typing.Optional[str],
+        simple: bool,
+        keys: bool,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+    ) -> list[typing.Union[Match, str, tuple]]:
         """
         Retrieves all matches a team played from a certain year.
 
@@ -667,14 +966,19 @@ class Team(BaseSchema):
                 A boolean representing whether each match's information should be stripped to only contain relevant information.
             keys:
                 A boolean representing whether only the keys of the matches a team played from said year should be returned:
+            fields:
+                An iterable of strings representing the only attributes each match should have (eg ['key', 'alliances', 'winning_alliance']), which returns lightweight named tuples instead of Match objects to skip converting every other field. Can be None to return Match objects.
 
         Returns:
             A list of Match objects representing each match a team played based on the conditions; might be empty if team didn't play matches that year.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("team", key=self.key, endpoint="matches", year=year, simple=simple, keys=keys),
-            headers=self._headers,
-        )
+        url = ENDPOINTS["team_matches"].url(self.key, year=year, simple=simple, keys=keys)
+        if not keys and not event_code:
+            return await InternalData.get_objects(
+                url=url, headers=self._headers, constructor=Match._constructor(fields), compact=fields is not None
+            )
+
+        response = await InternalData.get(url=url, headers=self._headers)
         if keys:
             if event_code:
                 return [match_key for match_key in response if event_code in match_key]
@@ -682,9 +986,9 @@ class Team(BaseSchema):
                 return response
         else:
             if event_code:
-                return [Match(**match_data) for match_data in response if event_code in match_data["event_key"]]
-            else:
-                return [Match(**match_data) for match_data in response]
+                response = [match_data for match_data in response if event_code in match_data["event_key"]]
+
+            return Match._constructor(fields)(response)
 
     async def _get_year_media(self, year: int, media_tag: typing.Optional[str] = None) -> list[Media]:
         """
@@ -699,63 +1003,93 @@ class Team(BaseSchema):
         Returns:
             A list of Media objects representing individual media from a team during a year.
         """
+        response = await InternalData.get(url=self._media_url(year, media_tag), headers=self._headers)
+        return [Media(**media_data) for media_data in response]
+
+    def _media_url(self, year: int, media_tag: typing.Optional[str] = None) -> str:
+        """Constructs the URL of a team's media from a year, only including the media with `media_tag` if passed in."""
         if media_tag:
-            url = construct_url(
-                "team", key=self.key, endpoint="media", second_endpoint="tag", media_tag=media_tag, year=year
-            )
+            return ENDPOINTS["team_media_tag"].url(self.key, media_tag, year=year)
         else:
-            url = construct_url("team", key=self.key, endpoint="media", year=year)
-
-        response = await InternalData.get(url=url, headers=self._headers)
-        return [Media(**media_data) for media_data in response]
+            return ENDPOINTS["team_media"].url(self.key, year=year)
 
     @synchronous
-    async def awards(self, year: typing.Optional[typing.Union[range, int]] = None) -> list[Award]:
+    async def awards(
+        self, year: typing.Optional[typing.Union[range, int]] = None, raw: bool = False
+    ) -> typing.Union[list[Award], CachedResponse]:
         """
         Retrieves all awards a team has gotten either during its career or during certain year(s).
 
         Parameters:
             year:
                 An integer representing a year that the awards should be returned for or a range object representing the years that awards should be returned from. Can be None if no year is passed in as it is an optional parameter.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects. Can't be True if `year` is a range object, since each year is retrieved separately.
 
         Returns:
             A list of Award objects representing each award a team has got based on the parameters; may be empty if the team has gotten no awards.
         """  # noqa
+        if raw and isinstance(year, range):
+            raise ValueError("raw cannot be True when year is a range object.")
+        elif raw:
+            return await InternalData.fetch(
+                url=ENDPOINTS["team_awards"].url(self.key, year=year), headers=self._headers
+            )
+
+        if isinstance(year, range):
+            years, retrieve_all_years = await self._get_years_within(year)
+
+            if not retrieve_all_years:
+                year_awards = await fan_out(lambda spec_year: self.awards.coro(self, spec_year), years)
+                return list(itertools.chain.from_iterable(year_awards))
+
         response = await InternalData.get(
-            url=construct_url("team", key=self.key, endpoint="awards", year=year if isinstance(year, int) else False),
+            url=ENDPOINTS["team_awards"].url(self.key, year=year if isinstance(year, int) else None),
             headers=self._headers,
         )
         if isinstance(year, range):
-            return [Award(**award_data) for award_data in response if award_data["year"] in year]
+            return [Award(**award_data) for award_data in response if award_data["year"] in years]
         else:
             return [Award(**award_data) for award_data in response]
 
     @synchronous
-    async def years_participated(self) -> list[int]:
+    async def years_participated(self, raw: bool = False) -> typing.Union[list[int], CachedResponse]:
         """
         Returns all the years this team has participated in.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             A list of integers representing every year this team has participated in.
-        """
-        response = await InternalData.get(
-            url=construct_url("team", key=self.key, endpoint="years_participated"), headers=self._headers
-        )
+        """  # noqa
+        url = ENDPOINTS["team_years_participated"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers, max_age=self.YEARS_PARTICIPATED_MAX_AGE)
+
+        response = await InternalData.get(url=url, headers=self._headers, max_age=self.YEARS_PARTICIPATED_MAX_AGE)
         return response
 
     @synchronous
-    async def districts(self) -> list[District]:
+    async def districts(self, raw: bool = False) -> typing.Union[list[District], CachedResponse]:
         """
         Retrieves a list of districts representing each year this team was in said district.
 
         If a team has never been in a district, the list will be empty.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             A list of districts representing each year this team was in said district if a team has participated in a district, otherwise returns an empty list.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("team", key=self.key, endpoint="districts"), headers=self._headers
-        )
+        url = ENDPOINTS["team_districts"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         return [District(**district_data) for district_data in response]
 
     @synchronous
@@ -765,7 +1099,11 @@ class Team(BaseSchema):
         event_code: typing.Optional[str] = None,
         simple: typing.Optional[bool] = False,
         keys: typing.Optional[bool] = False,
-    ) -> list[Match]:
+        partial: bool = False,
+        progress: typing.Optional[typing.Callable[[int, int], typing.Any]] = None,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        raw: bool = False,
+    ) -> typing.Union[list[typing.Union[Match, str, tuple]], CachedResponse]:
         """
         Retrieves all matches a team played from certain year(s).
 
@@ -778,60 +1116,150 @@ class Team(BaseSchema):
                 A boolean representing whether each match's information should be stripped to only contain relevant information. Can be False if `simple` isn't passed in.
             keys:
                 A boolean representing whether only the keys of the matches a team played from said year should be returned. Can be False if `keys` isn't passed in.
+            partial:
+                A boolean that specifies whether years that fail to be retrieved should be reported in the `errors` attribute of the returned list instead of raising an error. Only used if `year` is a range object.
+            progress:
+                A function that is called with the amount of years retrieved so far and the total amount of years every time a year is retrieved. Only used if `year` is a range object.
+            fields:
+                An iterable of strings representing the only attributes each match should have (eg ['key', 'alliances', 'winning_alliance']), which returns lightweight named tuples instead of Match objects to skip converting every other field. Can be None to return Match objects.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects. Can't be True if `year` is a range object or `event_code` is passed in, since those are retrieved separately or filtered after being retrieved.
 
         Returns:
             A list of Match objects representing each match a team played based on the conditions; might be empty if team didn't play matches in the specified year(s).
         """  # noqa
         if simple and keys:
             raise ValueError("simple and keys cannot both be True, you must choose one mode over the other.")
+        elif keys and fields is not None:
+            raise ValueError(
+                "fields cannot be passed in if keys is True, since only the keys of the matches are retrieved."
+            )
+        elif raw and (isinstance(year, range) or event_code):
+            raise ValueError("raw cannot be True when year is a range object or event_code is passed in.")
+        elif raw:
+            return await InternalData.fetch(
+                url=ENDPOINTS["team_matches"].url(self.key, year=year, simple=simple, keys=keys), headers=self._headers
+            )
 
         if isinstance(year, range):
-            return list(
-                itertools.chain.from_iterable(
-                    await asyncio.gather(
-                        *[self.matches.coro(self, spec_year, event_code, simple, keys) for spec_year in year]
-                    )
-                )
+            years, _ = await self._get_years_within(year)
+            year_matches = await fan_out(
+                lambda spec_year: self._get_year_matches(spec_year, event_code, simple, keys, fields),
+                years,
+                partial=partial,
+                progress=progress,
             )
+            return PartialResults(itertools.chain.from_iterable(year_matches), year_matches.errors)
         else:
-            return await self._get_year_matches(year, event_code, simple, keys)
+            return await self._get_year_matches(year, event_code, simple, keys, fields)
 
     @synchronous
-    async def media(self, year: typing.Union[range, int], media_tag: typing.Optional[str] = None) -> list[Media]:
+    async def media(
+        self,
+        year: typing.Union[range, int],
+        media_tag: typing.Optional[str] = None,
+        partial: bool = False,
+        progress: typing.Optional[typing.Callable[[int, int], typing.Any]] = None,
+        raw: bool = False,
+    ) -> typing.Union[list[Media], CachedResponse]:
         """
         Retrieves all the media of a certain team based off the parameters.
 
         Parameters:
             year:
-                An integer representing a year to retrieve a team's media from or a range object representing all the years media from a team should be retrieved from.
+                An integer representing a year to retrieve a team's media from or a range object representing all the years media from a team should be retrieved from (only the years the team participated in are retrieved).
             media_tag:
                 A string representing the type of media to be returned. Can be None if media_tag is not passed in.
+            partial:
+                A boolean that specifies whether years that fail to be retrieved should be reported in the `errors` attribute of the returned list instead of raising an error. Only used if `year` is a range object.
+            progress:
+                A function that is called with the amount of years retrieved so far and the total amount of years every time a year is retrieved. Only used if `year` is a range object.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects. Can't be True if `year` is a range object, since each year is retrieved separately.
 
         Returns:
             A list of Media objects representing individual media from a team.
         """  # noqa
+        if raw and isinstance(year, range):
+            raise ValueError("raw cannot be True when year is a range object.")
+        elif raw:
+            return await InternalData.fetch(url=self._media_url(year, media_tag), headers=self._headers)
+
         if isinstance(year, range):
-            return list(
-                itertools.chain.from_iterable(
-                    await asyncio.gather(*[self.media.coro(self, spec_year, media_tag) for spec_year in year])
-                )
+            years, _ = await self._get_years_within(year)
+            year_media = await fan_out(
+                lambda spec_year: self._get_year_media(spec_year, media_tag),
+                years,
+                partial=partial,
+                progress=progress,
             )
+            return PartialResults(itertools.chain.from_iterable(year_media), year_media.errors)
         else:
             return await self._get_year_media(year, media_tag)
 
     @synchronous
-    async def robots(self) -> list[Robot]:
+    async def profile(self, years: typing.Optional[typing.Union[range, int]] = None, simple: bool = False) -> Profile:
+        """
+        Retrieves a team's information, events, matches, awards, robots, districts, media and social media concurrently.
+
+        Parameters:
+            years:
+                An integer representing the year to retrieve the team's profile from or a range object representing the years the team's profile should be retrieved from. Can be None to retrieve the team's profile across its whole career.
+            simple:
+                A boolean that specifies whether the team, its events and its matches should be 'shortened' and only contain more relevant information.
+
+        Returns:
+            A Profile object containing everything about the team from the specified year(s).
+        """  # noqa
+        years_participated = await self.years_participated.coro(self)
+
+        if years is None:
+            years = range(min(years_participated, default=0), max(years_participated, default=-1) + 1)
+        elif isinstance(years, int):
+            years = range(years, years + 1)
+
+        team_data, events, matches, awards, robots, districts, media, social_media = await asyncio.gather(
+            InternalData.get(url=ENDPOINTS["team"].url(self.key, simple=simple), headers=self._headers),
+            self.events.coro(self, years, simple=simple),
+            self.matches.coro(self, years, simple=simple),
+            self.awards.coro(self, years),
+            self.robots.coro(self),
+            self.districts.coro(self),
+            self.media.coro(self, years),
+            self.social_media.coro(self),
+        )
+
+        return self.Profile(
+            team=Team(**team_data),
+            years=[spec_year for spec_year in years_participated if spec_year in years],
+            events=events,
+            matches=matches,
+            awards=awards,
+            robots=[robot for robot in robots if robot.year in years],
+            districts=[district for district in districts if district.year in years],
+            media=media,
+            social_media=social_media,
+        )
+
+    @synchronous
+    async def robots(self, raw: bool = False) -> typing.Union[list[Robot], CachedResponse]:
         """
         Retrieves a list of robots representing each robot for every year the team has played if they named the robot.
 
         If a team has never named a robot, the list will be empty.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             A list of districts representing each year this team was in said district if a team has named a robot, otherwise returns an empty list.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("team", key=self.key, endpoint="robots"), headers=self._headers
-        )
+        url = ENDPOINTS["team_robots"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         return [Robot(**robot_data) for robot_data in response]
 
     @synchronous
@@ -841,7 +1269,11 @@ class Team(BaseSchema):
         simple: bool = False,
         keys: bool = False,
         statuses: bool = False,
-    ) -> typing.Union[list[typing.Union[Event, str]], dict[str, EventTeamStatus]]:
+        partial: bool = False,
+        progress: typing.Optional[typing.Callable[[int, int], typing.Any]] = None,
+        fields: typing.Optional[typing.Iterable[str]] = None,
+        raw: bool = False,
+    ) -> typing.Union[list[typing.Union[Event, str, tuple]], dict[str, EventTeamStatus], CachedResponse]:
         """
         Retrieves and returns a record of teams based on the parameters given.
 
@@ -856,6 +1288,14 @@ class Team(BaseSchema):
                 A boolean that specifies whether only the names of the events this team has participated in should be returned.
             statuses:
                 A boolean that specifies whether a key/value pair of the statuses of teams in an event should be returned.
+            partial:
+                A boolean that specifies whether years that fail to be retrieved should be reported in the `errors` attribute of the returned list instead of raising an error. Only used if `year` is a range object.
+            progress:
+                A function that is called with the amount of years retrieved so far and the total amount of years every time a year is retrieved. Only used if `year` is a range object.
+            fields:
+                An iterable of strings representing the only attributes each event should have (eg ['key', 'week', 'start_date']), which returns lightweight named tuples instead of Event objects to skip converting every other field. Can be None to return Event objects.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects. Can't be True if `year` is a range object, since each year is retrieved separately.
 
         Returns:
             A list of Event objects for each event that was returned or a list of strings representing the keys of the events or a dictionary with team keys as the keys of the dictionary and an EventTeamStatus object representing the status of said team as the values of the dictionary.
@@ -871,17 +1311,36 @@ class Team(BaseSchema):
             raise ValueError("statuses cannot be True if a year isn't passed into Team.events.")
         elif statuses and isinstance(year, range):
             raise ValueError("statuses cannot be True when year is a range object.")
+        elif (keys or statuses) and fields is not None:
+            raise ValueError("fields cannot be passed in if keys or statuses is True.")
+        elif raw and isinstance(year, range):
+            raise ValueError("raw cannot be True when year is a range object.")
+        elif raw:
+            return await InternalData.fetch(
+                url=ENDPOINTS["team_events"].url(self.key, year=year, simple=simple, keys=keys, statuses=statuses),
+                headers=self._headers,
+            )
 
         if isinstance(year, range):
-            return list(
-                itertools.chain.from_iterable(
-                    await asyncio.gather(
-                        *[self.events.coro(self, spec_year, simple, keys, statuses) for spec_year in year]
-                    )
-                )
+            years, retrieve_all_years = await self._get_years_within(year)
+
+            if retrieve_all_years:
+                all_events = await self._get_year_events(None, simple, keys, statuses, fields, years, ordered=True)
+
+                if progress is not None:
+                    progress(len(years), len(years))
+
+                return PartialResults(all_events)
+
+            year_events = await fan_out(
+                lambda spec_year: self._get_year_events(spec_year, simple, keys, statuses, fields, ordered=True),
+                years,
+                partial=partial,
+                progress=progress,
             )
+            return PartialResults(itertools.chain.from_iterable(year_events), year_events.errors)
         else:
-            return await self._get_year_events(year, simple, keys, statuses)
+            return await self._get_year_events(year, simple, keys, statuses, fields)
 
     @synchronous
     async def event(
@@ -893,7 +1352,8 @@ class Team(BaseSchema):
         simple: bool = False,
         keys: bool = False,
         status: bool = False,
-    ) -> typing.Union[list[Award], EventTeamStatus, list[typing.Union[Match, str]]]:
+        raw: bool = False,
+    ) -> typing.Union[typing.Union[list[Award], EventTeamStatus, list[typing.Union[Match, str]]], CachedResponse]:
         """
         Retrieves and returns a record of teams based on the parameters given.
 
@@ -910,6 +1370,8 @@ class Team(BaseSchema):
                 A boolean that specifies whether only the keys of the matches the team played should be returned. Do note that `keys` should only be True in conjunction with `matches`
             status:
                 A boolean that specifies whether a key/value pair of the status of the team during an event should be returned. `status` should only be the only boolean out of the parameters that is True when using it.
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
 
         Returns:
             A list of Match objects representing each match a team played or an EventTeamStatus object to represent the team's status during an event or a list of strings representing the keys of the matches the team played in or a list of Award objects to represent award(s) a team got during an event.
@@ -929,20 +1391,13 @@ class Team(BaseSchema):
                 "if statuses is True then simple, keys, and matches must be False."
             )
 
-        response = await InternalData.get(
-            url=construct_url(
-                "team",
-                key=self.key,
-                endpoint="event",
-                event_key=event_key,
-                awards=awards,
-                matches=matches,
-                status=status,
-                simple=simple,
-                keys=keys,
-            ),
-            headers=self._headers,
+        url = ENDPOINTS["team_event"].url(
+            self.key, event_key, awards=awards, matches=matches, status=status, simple=simple, keys=keys
         )
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         if matches and keys:
             return response
         elif matches:
@@ -953,16 +1408,22 @@ class Team(BaseSchema):
             return EventTeamStatus(event_key, response)
 
     @synchronous
-    async def social_media(self) -> list[Media]:
+    async def social_media(self, raw: bool = False) -> typing.Union[list[Media], CachedResponse]:
         """
         Retrieves all social media accounts of a team registered on TBA.
 
+        Parameters:
+            raw:
+                A boolean that specifies whether the undecoded response should be returned as a CachedResponse object (containing its body and headers) instead of being decoded into objects.
+
         Returns:
             A list of Media objects representing each social media account of a team. May be empty if a team has no social media accounts.
         """  # noqa
-        response = await InternalData.get(
-            url=construct_url("team", key=self.key, endpoint="social_media"), headers=self._headers
-        )
+        url = ENDPOINTS["team_social_media"].url(self.key)
+        if raw:
+            return await InternalData.fetch(url=url, headers=self._headers)
+
+        response = await InternalData.get(url=url, headers=self._headers)
         return [Media(**social_media_info) for social_media_info in response]
 
     def __hash__(self) -> int:
@@ -970,3 +1431,37 @@ class Team(BaseSchema):
 
     def __lt__(self, other: "Team") -> bool:
         return self.team_number < other.team_number
+
+
+def _select_events(
+    events_data: list[typing.Union[str, dict]],
+    constructor: typing.Callable[[list], list],
+    keys: bool,
+    years: typing.Optional[tuple[int, ...]],
+    ordered: bool,
+) -> list[typing.Union[str, Event, tuple]]:
+    """Keeps only the events from `years` (if not None), optionally puts them in chronological order and converts them with `constructor`."""  # noqa
+    if years is not None:
+        events_data = [
+            event_data for event_data in events_data if (int(event_data[:4]) if keys else event_data["year"]) in years
+        ]
+
+    # Events from a range of years are put in chronological order (keys in alphabetical order within each year), no matter how they were retrieved  # noqa
+    if ordered:
+        events_data = sorted(
+            events_data,
+            key=lambda event_data: (int(event_data[:4]), event_data)
+            if keys
+            else (event_data["year"], event_data.get("start_date") or ""),
+        )
+
+    return constructor(events_data)
+
+
+def _construct_event_statuses(statuses_data: dict[str, typing.Optional[dict]]) -> dict[str, EventTeamStatus]:
+    """Converts the statuses of a team at each event, skipping events without a status."""
+    return {
+        event_key: EventTeamStatus(event_key, team_status_info)
+        for event_key, team_status_info in statuses_data.items()
+        if team_status_info
+    }
@@ -13,6 +13,8 @@ except ImportError:
 class Match(BaseSchema):
     """Class representing a match's metadata with methods to get match specific data."""
 
+    _converted_fields = frozenset({"alliances", "time", "actual_time", "predicted_time", "post_result_time"})
+
     @dataclass()
     class Alliance:
         """Class representing an alliance's performance/metadata during a match."""
@@ -53,10 +55,14 @@ class Match(BaseSchema):
         self.match_number: typing.Optional[int] = kwargs.get("match_number")
 
         alliances = kwargs.get("alliances")
-        self.alliances: typing.Optional[dict] = {
-            "red": self.Alliance(**alliances["red"]),
-            "blue": self.Alliance(**alliances["blue"]),
-        }
+        self.alliances: typing.Optional[dict] = (
+            {
+                "red": self.Alliance(**alliances["red"]),
+                "blue": self.Alliance(**alliances["blue"]),
+            }
+            if alliances
+            else None
+        )
         self.winning_alliance: typing.Optional[str] = kwargs.get("winning_alliance")
 
         self.event_key: typing.Optional[str] = kwargs.get("event_key")
@@ -0,0 +1,199 @@
+import asyncio
+import contextlib
+import os
+import sys
+import typing
+
+from .job import *
+from .schemas import *
+from .utils import *
+
+__all__ = ["Season"]
+
+
+class Season:
+    """Class representing every event, team, match and ranking of a season loaded into memory and indexed by key."""
+
+    def __init__(self, year: int):
+        self.year = year
+
+        self.events: dict[str, Event] = {}
+        self.teams: dict[str, Team] = {}
+        self.matches: dict[str, Match] = {}
+        self.rankings: dict[str, dict[str, Event.Ranking]] = {}
+
+        self.event_teams: dict[str, list[str]] = {}
+        self.event_matches: dict[str, list[str]] = {}
+        self.team_events: dict[str, list[str]] = {}
+        self.team_matches: dict[str, list[str]] = {}
+
+    @classmethod
+    def load(
+        cls,
+        year: int,
+        progress: typing.Optional[typing.Callable[[int, int], typing.Any]] = None,
+        checkpoint: typing.Optional[typing.Union[str, os.PathLike]] = None,
+        limit: int = 10,
+    ) -> "Season":
+        """
+        Retrieves every event of a season along with the teams, matches and rankings of each event.
+
+        Teams are retrieved once for the whole season instead of once per event, and key strings are interned so that every reference to the same team, event or match shares one string.
+
+        Parameters:
+            year:
+                An integer representing the season to load.
+            progress:
+                A function that is called with the amount of events loaded so far and the total amount of events every time an event is loaded.
+            checkpoint:
+                A path to a checkpoint file (see `Job`) that the response of every URL retrieved is recorded to. If the file already exists, the responses in it are reused instead of being retrieved again, so that an interrupted load can be resumed.
+            limit:
+                An integer representing the maximum amount of events that can be retrieved at once.
+
+        Returns:
+            A Season object containing everything about the season.
+        """  # noqa
+        return InternalData.loop.run_until_complete(cls.load_async(year, progress, checkpoint, limit))
+
+    @classmethod
+    async def load_async(
+        cls,
+        year: int,
+        progress: typing.Optional[typing.Callable[[int, int], typing.Any]] = None,
+        checkpoint: typing.Optional[typing.Union[str, os.PathLike]] = None,
+        limit: int = 10,
+    ) -> "Season":
+        """Asynchronous version of `Season.load`."""
+        season = cls(year)
+
+        with Job(checkpoint) if checkpoint else contextlib.nullcontext():
+            events_data, teams_data = await asyncio.gather(
+                InternalData.get(url=ENDPOINTS["events"].url(year), headers=BaseSchema._headers),
+                season._get_teams_data(),
+            )
+            season._add_teams(teams_data)
+            season._add_events(events_data)
+
+            event_keys = list(season.events)
+            all_event_data = await fan_out(season._get_event_data, event_keys, limit=limit, progress=progress)
+
+        for event_key, event_data in zip(event_keys, all_event_data):
+            season._add_event_data(event_key, event_data)
+
+        return season
+
+    async def _get_teams_data(self) -> list[dict]:
+        """Retrieves every page of teams that participated during the season."""
+        pages = await fan_out(
+            lambda page_num: InternalData.get(
+                url=ENDPOINTS["teams"].url(year=self.year, page_num=page_num), headers=BaseSchema._headers
+            ),
+            range(0, 20),
+        )
+        return [team_data for page in pages for team_data in page]
+
+    async def _get_event_data(self, event_key: str) -> dict[str, typing.Any]:
+        """
+        Retrieves the matches, rankings and keys of the teams of an event.
+
+        Parameters:
+            event_key:
+                A string representing the key of the event.
+
+        Returns:
+            A dictionary containing the raw matches, rankings and team keys of the event.
+        """
+        matches, rankings, team_keys = await asyncio.gather(
+            InternalData.get(url=ENDPOINTS["event_matches"].url(event_key), headers=BaseSchema._headers),
+            InternalData.get(url=ENDPOINTS["event_rankings"].url(event_key), headers=BaseSchema._headers),
+            InternalData.get(url=ENDPOINTS["event_teams"].url(event_key, keys=True), headers=BaseSchema._headers),
+        )
+        return {"matches": matches, "rankings": rankings, "team_keys": team_keys}
+
+    def _add_teams(self, teams_data: list[dict]) -> None:
+        """
+        Adds every team of the season to the indexes.
+
+        Parameters:
+            teams_data:
+                A list of dictionaries containing the data of each team.
+        """
+        for team_data in teams_data:
+            team = Team(**{**team_data, "key": sys.intern(team_data["key"])})
+
+            self.teams[team.key] = team
+            self.team_events[team.key] = []
+            self.team_matches[team.key] = []
+
+    def _add_events(self, events_data: list[dict]) -> None:
+        """
+        Adds every event of the season to the indexes.
+
+        Parameters:
+            events_data:
+                A list of dictionaries containing the data of each event.
+        """
+        for event_data in events_data:
+            event = Event(**{**event_data, "key": sys.intern(event_data["key"])})
+            self.events[event.key] = event
+
+    def _add_event_data(self, event_key: str, event_data: dict[str, typing.Any]) -> None:
+        """
+        Adds the matches, rankings and teams of an event to the indexes.
+
+        Parameters:
+            event_key:
+                A string representing the key of the event.
+            event_data:
+                A dictionary containing the raw matches, rankings and team keys of the event.
+        """
+        event_key = sys.intern(event_key)
+        self.event_teams[event_key] = [self._intern_team_key(team_key) for team_key in event_data["team_keys"]]
+        self.event_matches[event_key] = []
+
+        for team_key in self.event_teams[event_key]:
+            self.team_events[team_key].append(event_key)
+
+        for match_data in event_data["matches"]:
+            game_match = Match(**{**match_data, "key": sys.intern(match_data["key"]), "event_key": event_key})
+
+            # Matches that weren't scheduled yet don't have alliances
+            if game_match.alliances:
+                for match_alliance in game_match.alliances.values():
+                    match_alliance.team_keys = [
+                        self._intern_team_key(team_key) for team_key in match_alliance.team_keys
+                    ]
+
+                    for team_key in match_alliance.team_keys:
+                        self.team_matches[team_key].append(game_match.key)
+
+            self.matches[game_match.key] = game_match
+            self.event_matches[event_key].append(game_match.key)
+
+        rankings_info = event_data["rankings"] or {}
+        self.rankings[event_key] = {
+            self._intern_team_key(rank_info["team_key"]): Event._construct_ranking(
+                {**rank_info, "team_key": self._intern_team_key(rank_info["team_key"])}, rankings_info
+            )
+            for rank_info in rankings_info.get("rankings") or []
+        }
+
+    def _intern_team_key(self, team_key: str) -> str:
+        """
+        Interns a team key, adding the team to the indexes if it wasn't retrieved with the rest of the season's teams.
+
+        Parameters:
+            team_key:
+                A string representing the key of the team.
+
+        Returns:
+            The interned team key.
+        """
+        team_key = sys.intern(team_key)
+
+        if team_key not in self.teams:
+            self.teams[team_key] = Team(team_key)
+            self.team_events[team_key] = []
+            self.team_matches[team_key] = []
+
+        return team_key
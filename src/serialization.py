@@ -0,0 +1,102 @@
+import datetime
+import enum
+import functools
+import typing
+
+from .schemas import *
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover
+    msgpack = None
+
+__all__ = ["dumps", "loads"]
+
+# msgpack extension type codes
+SCHEMA_EXT = 1
+DATETIME_EXT = 2
+ENUM_EXT = 3
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_types() -> dict[str, type]:
+    """Maps the qualified name of every schema class (including nested classes like 'Event.Ranking') to the class."""
+    schema_types = {}
+    unvisited_types = [APIStatus, Award, District, Event, EventTeamStatus, Match, Media, Robot, Team]
+
+    while unvisited_types:
+        schema_type = unvisited_types.pop()
+        schema_types[schema_type.__qualname__] = schema_type
+        unvisited_types.extend(
+            nested_type
+            for nested_type in vars(schema_type).values()
+            if isinstance(nested_type, type) and nested_type.__qualname__.startswith(f"{schema_type.__qualname__}.")
+        )
+
+    return schema_types
+
+
+def _encode(obj: typing.Any) -> "msgpack.ExtType":
+    """Encodes the objects msgpack can't serialize by itself (called by msgpack for each of them)."""
+    if isinstance(obj, enum.Enum):
+        return msgpack.ExtType(ENUM_EXT, msgpack.packb([type(obj).__qualname__, obj.value], default=_encode))
+    elif isinstance(obj, datetime.datetime):
+        return msgpack.ExtType(DATETIME_EXT, obj.isoformat().encode())
+    elif _schema_types().get(type(obj).__qualname__) is type(obj):
+        return msgpack.ExtType(SCHEMA_EXT, msgpack.packb([type(obj).__qualname__, vars(obj)], default=_encode))
+
+    raise TypeError(f"{type(obj).__name__} objects can't be serialized.")
+
+
+def _decode(code: int, data: bytes) -> typing.Any:
+    """Decodes the objects `_encode` serialized (called by msgpack for each of them)."""
+    if code == DATETIME_EXT:
+        return datetime.datetime.fromisoformat(data.decode())
+
+    type_name, state = msgpack.unpackb(data, ext_hook=_decode, strict_map_key=False)
+    schema_type = _schema_types()[type_name]
+
+    if code == ENUM_EXT:
+        return schema_type(state)
+
+    # The constructors convert TBA's responses, so the attributes are restored as is instead
+    obj = object.__new__(schema_type)
+    vars(obj).update(state)
+
+    return obj
+
+
+def dumps(obj: typing.Any) -> bytes:
+    """
+    Serializes schema objects (eg a Match, a list of Event.Ranking objects or a dictionary of Team objects) into a compact binary format (requires msgpack).
+
+    Every attribute is serialized, including the attributes of ExtraStats and SortOrders objects that depend on the event, so `loads(dumps(obj)) == obj`.
+
+    Parameters:
+        obj:
+            A schema object or any combination of lists, dictionaries and primitive values containing schema objects.
+
+    Returns:
+        A bytes object containing the serialized objects.
+    """  # noqa
+    if msgpack is None:
+        raise ImportError("msgpack is required to serialize objects (pip install falcon-alliance[msgpack]).")
+
+    return msgpack.packb(obj, default=_encode)
+
+
+def loads(data: bytes) -> typing.Any:
+    """
+    Deserializes the objects that were serialized with `dumps`, without converting their attributes again.
+
+    Parameters:
+        data:
+            A bytes object returned by `dumps`.
+
+    Returns:
+        The deserialized objects. Tuples (including named tuples returned when `fields` is passed in) are deserialized as lists.
+    """  # noqa
+    if msgpack is None:
+        raise ImportError("msgpack is required to deserialize objects (pip install falcon-alliance[msgpack]).")
+
+    return msgpack.unpackb(data, ext_hook=_decode, strict_map_key=False)
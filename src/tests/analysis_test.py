@@ -0,0 +1,437 @@
+import random
+
+import pytest
+
+from ..analysis import *
+from ..schemas import *
+
+
+def sample_matches(years: range = range(2019, 2023), seed: int = 0) -> list[Match]:
+    generator = random.Random(seed)
+    team_keys = [f"frc{team_number}" for team_number in range(1, 61)]
+    matches = []
+
+    for year in years:
+        for event_num in range(3):
+            event_team_keys = generator.sample(team_keys, 30)
+
+            for match_number in range(1, 31):
+                generator.shuffle(event_team_keys)
+                matches.append(
+                    Match(
+                        key=f"{year}event{event_num}_qm{match_number}",
+                        comp_level="qm",
+                        match_number=match_number,
+                        alliances={
+                            alliance: {
+                                "score": generator.randint(0, 100),
+                                "team_keys": alliance_team_keys,
+                                "surrogate_team_keys": [],
+                                "dq_team_keys": [],
+                            }
+                            for alliance, alliance_team_keys in (
+                                ("red", event_team_keys[:3]),
+                                ("blue", event_team_keys[3:6]),
+                            )
+                        },
+                    )
+                )
+
+    return matches
+
+
+def sequential_elo(matches: list[Match], k: float = 12.0, year_regression: float = 0.2) -> dict[str, float]:
+    ratings = {}
+    current_year = None
+
+    for match in sorted(matches, key=MatchArrays.chronological_key):
+        year = int(match.key[:4])
+
+        if current_year is not None and year > current_year:
+            ratings = {team_key: rating + (1500 - rating) * year_regression for team_key, rating in ratings.items()}
+
+        current_year = year
+        red, blue = match.alliances["red"], match.alliances["blue"]
+        red_rating = sum(ratings.get(team_key, 1500) for team_key in red.team_keys)
+        blue_rating = sum(ratings.get(team_key, 1500) for team_key in blue.team_keys)
+        outcome = (red.score > blue.score) + 0.5 * (red.score == blue.score)
+        change = k * (outcome - 1 / (1 + 10 ** ((blue_rating - red_rating) / 400)))
+
+        for team_key in red.team_keys:
+            ratings[team_key] = ratings.get(team_key, 1500) + change
+
+        for team_key in blue.team_keys:
+            ratings[team_key] = ratings.get(team_key, 1500) - change
+
+    return ratings
+
+
+def test_elo_ratings():
+    """Tests `EloRatings.update` to ensure that updating matches in batches gives the same ratings as updating them one by one."""
+    pytest.importorskip("numpy")
+
+    matches = sample_matches()
+    random.Random(1).shuffle(matches)
+    elo_ratings = EloRatings()
+    elo_ratings.update(matches)
+    expected_ratings = sequential_elo(matches)
+    assert elo_ratings.matches_played == len(matches) and all(
+        elo_ratings[team_key] == pytest.approx(rating) for team_key, rating in expected_ratings.items()
+    )
+
+
+def test_elo_ratings_incremental():
+    """Tests `EloRatings.update` to ensure that updating the ratings one year at a time gives the same ratings as updating them all at once."""
+    pytest.importorskip("numpy")
+
+    matches = sample_matches()
+    elo_ratings = EloRatings()
+
+    for year in range(2019, 2023):
+        elo_ratings.update(match for match in matches if match.key.startswith(str(year)))
+
+    expected_ratings = sequential_elo(matches)
+    assert elo_ratings.year == 2022 and all(
+        elo_ratings[team_key] == pytest.approx(rating) for team_key, rating in expected_ratings.items()
+    )
+
+
+def sample_event(
+    played: int = 20, match_count: int = 40, seed: int = 0
+) -> tuple[dict[str, Event.Ranking], list[Match], dict[str, float]]:
+    generator = random.Random(seed)
+    team_keys = [f"frc{team_number}" for team_number in range(1, 25)]
+    oprs = {team_key: generator.uniform(5, 40) for team_key in team_keys}
+    matches = []
+    ranking_points = dict.fromkeys(team_keys, 0)
+    records = {team_key: {"wins": 0, "losses": 0, "ties": 0} for team_key in team_keys}
+
+    for match_number in range(1, match_count + 1):
+        match_team_keys = generator.sample(team_keys, 6)
+        alliances = {
+            alliance: {
+                "score": int(sum(oprs[team_key] for team_key in alliance_team_keys) + generator.gauss(0, 10))
+                if match_number <= played
+                else -1,
+                "team_keys": alliance_team_keys,
+                "surrogate_team_keys": [],
+                "dq_team_keys": [],
+            }
+            for alliance, alliance_team_keys in (("red", match_team_keys[:3]), ("blue", match_team_keys[3:]))
+        }
+        matches.append(
+            Match(key=f"2022test_qm{match_number}", comp_level="qm", match_number=match_number, alliances=alliances)
+        )
+
+        if match_number <= played:
+            for alliance, opponent in (("red", "blue"), ("blue", "red")):
+                result = "wins" if alliances[alliance]["score"] > alliances[opponent]["score"] else "losses"
+
+                for team_key in alliances[alliance]["team_keys"]:
+                    records[team_key][result] += 1
+                    ranking_points[team_key] += 2 * (result == "wins") + generator.randint(0, 2)
+
+    rankings_info = {"extra_stats_info": [], "sort_order_info": [{"name": "Ranking Score", "precision": 2}]}
+    rankings = {
+        team_key: Event._construct_ranking(
+            {
+                "dq": 0,
+                "extra_stats": [],
+                "matches_played": sum(records[team_key].values()),
+                "qual_average": None,
+                "rank": rank,
+                "record": records[team_key],
+                "sort_orders": [ranking_points[team_key] / max(sum(records[team_key].values()), 1)],
+                "team_key": team_key,
+            },
+            rankings_info,
+        )
+        for rank, team_key in enumerate(
+            sorted(team_keys, key=lambda team_key: -ranking_points[team_key] / max(sum(records[team_key].values()), 1)),
+            start=1,
+        )
+    }
+
+    return rankings, matches, oprs
+
+
+def test_ranking_simulator():
+    """Tests `RankingSimulator.simulate` to ensure that every team finishes at exactly one rank per simulation and that the results only depend on the seed."""  # noqa
+    pytest.importorskip("numpy")
+
+    rankings, matches, oprs = sample_event()
+    simulator = RankingSimulator(rankings, matches, oprs=oprs)
+    rank_distribution = simulator.simulate(12000, processes=1, seed=4099)
+    assert (
+        len(simulator.remaining) == 20
+        and rank_distribution.simulations == 12000
+        and (rank_distribution.counts.sum(axis=0) == 12000).all()
+        and (simulator.simulate(12000, processes=2, seed=4099).counts == rank_distribution.counts).all()
+    )
+
+
+def test_ranking_simulator_elo():
+    """Tests `RankingSimulator` with Elo ratings to ensure that teams without a rating are simulated at the initial rating without being added to the ratings passed in."""  # noqa
+    pytest.importorskip("numpy")
+
+    rankings, matches, _ = sample_event()
+    elo = EloRatings()
+    elo.update(matches[:10])
+    team_index, ratings = dict(elo.team_index), elo.ratings.copy()
+
+    simulator = RankingSimulator(rankings, matches, elo=elo)
+    rank_distribution = simulator.simulate(1000, seed=4099)
+    assert (
+        elo.team_index == team_index
+        and (elo.ratings == ratings).all()
+        and len(team_index) < len(rankings)
+        and (rank_distribution.counts.sum(axis=0) == 1000).all()
+    )
+
+
+def test_ranking_simulator_completed():
+    """Tests `RankingSimulator.simulate` to ensure that the rankings of an event without remaining matches stay the same."""
+    pytest.importorskip("numpy")
+
+    rankings, matches, oprs = sample_event(played=40)
+    rank_distribution = RankingSimulator(rankings, matches, oprs=oprs).simulate(100, seed=4099)
+    ranking_scores = [ranking.sort_orders.ranking_score for ranking in rankings.values()]
+    assert all(
+        rank_distribution[team_key][ranking.rank - 1] == 1
+        for team_key, ranking in rankings.items()
+        if ranking_scores.count(ranking.sort_orders.ranking_score) == 1
+    )
+
+
+def sample_alliances(alliance_count: int = 8) -> list[Event.Alliance]:
+    return [
+        Event.Alliance(
+            name=f"Alliance {alliance_num + 1}",
+            declines=[],
+            picks=[f"frc{team_number}" for team_number in range(alliance_num * 3 + 1, alliance_num * 3 + 4)],
+            status={
+                "playoff_average": None,
+                "level": "sf",
+                "record": {"losses": 0, "ties": 0, "wins": 0},
+                "current_level_record": {"losses": 0, "ties": 0, "wins": 0},
+                "status": "playing",
+            },
+        )
+        for alliance_num in range(alliance_count)
+    ]
+
+
+def test_playoff_simulator():
+    """Tests `PlayoffSimulator.simulate` with a double-elimination bracket to ensure that exactly one alliance wins each simulated event."""  # noqa
+    pytest.importorskip("numpy")
+
+    _, _, oprs = sample_event()
+    playoff_distribution = PlayoffSimulator(
+        PlayoffType.DOUBLE_ELIM_8_TEAM, sample_alliances(), oprs=oprs, score_deviation=10
+    ).simulate(10000, seed=4099)
+    assert (
+        sum(playoff_distribution.win_probabilities().values()) == pytest.approx(1)
+        and sum(playoff_distribution.reach_probabilities("f1").values()) == pytest.approx(2)
+        and playoff_distribution.reach_probabilities("sf1")["Alliance 1"] == 1
+    )
+
+
+def test_playoff_simulator_update():
+    """Tests `PlayoffSimulator.update` with a legacy best-of-3 bracket to ensure that alliances that were eliminated can't win the event."""  # noqa
+    pytest.importorskip("numpy")
+
+    alliances = sample_alliances()
+    elo = EloRatings()
+    playoff_simulator = PlayoffSimulator(PlayoffType.BRACKET_8_TEAM, alliances, elo=elo)
+    playoff_simulator.update(
+        Match(
+            key=f"2022test_qf1m{match_number}",
+            comp_level="qf",
+            set_number=1,
+            match_number=match_number,
+            alliances={
+                "red": {"score": 10, "team_keys": alliances[0].picks, "surrogate_team_keys": [], "dq_team_keys": []},
+                "blue": {"score": 20, "team_keys": alliances[7].picks, "surrogate_team_keys": [], "dq_team_keys": []},
+            },
+        )
+        for match_number in (1, 2)
+    )
+    playoff_distribution = playoff_simulator.simulate(1000)
+    assert (
+        playoff_distribution.win_probabilities("qf1")["Alliance 8"] == 1
+        and playoff_distribution.win_probabilities()["Alliance 1"] == 0
+        and len(elo) == 0
+    )
+
+
+def test_playoff_simulator_playoff_types():
+    """Tests `PlayoffSimulator` with the playoff types of TBA events to ensure that each format is simulated with its own bracket and that custom brackets are rejected."""  # noqa
+    pytest.importorskip("numpy")
+
+    _, _, oprs = sample_event()
+    four_team_bracket, bo5_finals = (
+        PlayoffSimulator(Event(key="2019test", playoff_type=playoff_type).playoff_type, alliances, oprs=oprs)
+        for playoff_type, alliances in ((2, sample_alliances(4)), (6, sample_alliances(2)))
+    )
+    assert (
+        [series.key for series in four_team_bracket.bracket] == ["sf1", "sf2", "f1"]
+        and sum(four_team_bracket.simulate(1000, seed=4099).win_probabilities().values()) == pytest.approx(1)
+        and [series.wins_needed for series in bo5_finals.bracket] == [3]
+    )
+
+    with pytest.raises(ValueError, match="isn't supported"):
+        PlayoffSimulator(Event(key="2019test", playoff_type=8).playoff_type, sample_alliances(), oprs=oprs)
+
+
+def test_calculate_district_points():
+    """Tests `calculate_district_points` with a double-elimination bracket that the higher seed always wins to ensure that alliance, playoff and award points are given out correctly."""  # noqa
+    pytest.importorskip("numpy")
+
+    rankings, matches, _ = sample_event(played=40)
+    alliances = sample_alliances()
+    winners, losers = [], []
+
+    for series in BRACKETS[PlayoffType.DOUBLE_ELIM_8_TEAM]:
+        red, blue = (
+            source_num - 1 if source == "seed" else (winners if source == "winner" else losers)[source_num]
+            for source, source_num in (series.red, series.blue)
+        )
+        winners.append(min(red, blue))
+        losers.append(max(red, blue))
+        matches.extend(
+            Match(
+                key=f"2023test_{series.key}m{match_number}",
+                comp_level=series.comp_level,
+                set_number=series.set_number,
+                match_number=match_number,
+                alliances={
+                    color: {
+                        "score": 100 if alliance_num == winners[-1] else 50,
+                        "team_keys": alliances[alliance_num].picks,
+                        "surrogate_team_keys": [],
+                        "dq_team_keys": [],
+                    }
+                    for color, alliance_num in (("red", red), ("blue", blue))
+                },
+            )
+            for match_number in range(1, series.wins_needed + 1)
+        )
+
+    awards = [
+        Award(name="FIRST Impact Award", award_type=0, recipient_list=[{"team_key": "frc24", "awardee": None}]),
+        Award(name="Winner", award_type=1, recipient_list=[{"team_key": "frc1", "awardee": None}]),
+    ]
+    district_points = calculate_district_points(rankings, alliances, awards, matches, playoff_type=10)
+    assert (
+        district_points.points["frc1"]["alliance_points"] == 16
+        and district_points.points["frc1"]["elim_points"] == 30
+        and district_points.points["frc1"]["award_points"] == 0
+        and district_points.points["frc6"]["alliance_points"] == 2
+        and district_points.points["frc6"]["elim_points"] == 20
+        and district_points.points["frc24"]["award_points"] == 10
+        and all(
+            team_points["total"]
+            == team_points["qual_points"]
+            + team_points["alliance_points"]
+            + team_points["elim_points"]
+            + team_points["award_points"]  # noqa
+            and 4 <= team_points["qual_points"] <= 22
+            for team_points in district_points.points.values()
+        )
+    )
+
+
+def test_district_projection():
+    """Tests `DistrictProjection.simulate` to ensure that teams that don't attend any remaining events keep their place relative to each other."""  # noqa
+    pytest.importorskip("numpy")
+
+    generator = random.Random(0)
+    team_keys = [f"frc{team_number}" for team_number in range(1, 61)]
+    rankings = [
+        District.Ranking(team_key=team_key, rank=rank, rookie_bonus=0, point_total=100 - rank, event_points=[])
+        for rank, team_key in enumerate(team_keys, start=1)
+    ]
+    remaining_events = {"2023test": team_keys[30:]}
+    rank_distribution = DistrictProjection(
+        rankings, remaining_events, {team_key: generator.gauss(20, 8) for team_key in team_keys}, 2023
+    ).simulate(1000, seed=4099)
+    expected_ranks = rank_distribution.expected_ranks()
+    assert rank_distribution.simulations == 1000 and all(
+        expected_ranks[team_keys[team_num]] < expected_ranks[team_keys[team_num + 1]] for team_num in range(29)
+    )
+
+
+def test_match_predictors():
+    """Tests `OPRPredictor`, `LogisticPredictor` and `EloPredictor` to ensure that they predict matches better than chance and that predictions stay in the order the matches were passed in."""  # noqa
+    pytest.importorskip("numpy")
+
+    _, matches, _ = sample_event(played=120, match_count=120)
+    schedule = list(reversed(matches[80:]))
+
+    for predictor in (OPRPredictor(), LogisticPredictor(), EloPredictor()):
+        predictions = predictor.fit(matches[:60]).calibrate(matches[60:80]).predict(schedule)
+        assert (
+            predictions.match_keys == [match.key for match in schedule]
+            and ((predictions.red_win_probabilities > 0) & (predictions.red_win_probabilities < 1)).all()
+            and predictor.brier_score(schedule) < 0.25
+        )
+
+
+def test_opr_predictor():
+    """Tests `OPRPredictor.fit` to ensure that the OPRs it computes are close to the teams' actual contributions."""
+    numpy = pytest.importorskip("numpy")
+
+    _, matches, oprs = sample_event(played=120, match_count=120)
+    opr_predictor = OPRPredictor(regularization=0.1).fit(matches)
+    fitted_oprs = opr_predictor.to_dict()
+    assert (
+        numpy.corrcoef(list(oprs.values()), [fitted_oprs[team_key] for team_key in oprs])[0, 1] > 0.9
+        and not numpy.isnan(opr_predictor.predict(matches).red_scores).any()
+    )
+
+
+def test_decode_breakdowns():
+    """Tests `decode_breakdowns` to ensure that nested score breakdowns are flattened into typed columns that line up with the matches, and that a year's decoder keeps its category codes between batches."""  # noqa
+    numpy = pytest.importorskip("numpy")
+
+    matches = sample_matches(years=range(2023, 2024))
+    generator = random.Random(0)
+
+    for match in matches:
+        match.score_breakdown = {
+            color: {
+                "autoPoints": generator.randint(0, 30),
+                "activationBonusAchieved": generator.random() < 0.5,
+                "endGameChargeStationRobot1": generator.choice(["None", "Park", "Docked"]),
+                "autoCommunity": {"T": [generator.choice(["None", "Cone", "Cube"]) for _ in range(9)]},
+            }
+            for color in ("red", "blue")
+        }
+
+    del matches[-1].score_breakdown["blue"]["autoPoints"]
+    breakdown_columns = decode_breakdowns(matches[:50])[2023]
+    later_breakdown_columns = BreakdownDecoder.for_year(2023).decode(matches[50:])
+    auto_points = [
+        [match.score_breakdown[color].get("autoPoints", 0) for color in ("red", "blue")] for match in matches
+    ]
+    charge_station = "endGameChargeStationRobot1"
+    assert (
+        breakdown_columns["autoPoints"].dtype == numpy.int64
+        and breakdown_columns["activationBonusAchieved"].dtype == bool
+        and numpy.concatenate([breakdown_columns["autoPoints"], later_breakdown_columns["autoPoints"]]).tolist()
+        == auto_points
+        and breakdown_columns.labels("autoCommunity.T.8")[0, 1]
+        == matches[0].score_breakdown["blue"]["autoCommunity"]["T"][8]
+        and later_breakdown_columns.labels(charge_station)[-1, 0] == matches[-1].score_breakdown["red"][charge_station]
+        and later_breakdown_columns.categories[charge_station] == breakdown_columns.categories[charge_station]
+    )
+
+    team_averages = breakdown_columns.team_averages("autoPoints")
+    team_key = matches[0].alliances["red"].team_keys[0]
+    team_auto_points = [
+        match.score_breakdown[color]["autoPoints"]
+        for match in matches[:50]
+        for color in ("red", "blue")
+        if team_key in match.alliances[color].team_keys
+    ]
+    assert team_averages[team_key] == pytest.approx(sum(team_auto_points) / len(team_auto_points))
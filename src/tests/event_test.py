@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from ..api_client import ApiClient
@@ -77,6 +79,53 @@ def test_event_matches_keys():
         )
 
 
+def test_event_matches_raw():
+    """Tests TBA's endpoint to retrieve the undecoded response of all the matches that occurred at an event."""
+    with ApiClient():
+        chs_comp_matches_raw = Event("2022chcmp").matches(raw=True)
+        assert (
+            isinstance(chs_comp_matches_raw, CachedResponse)
+            and isinstance(chs_comp_matches_raw.body, bytes)
+            and "Content-Type" in chs_comp_matches_raw.headers
+            and [match_data["key"] for match_data in chs_comp_matches_raw.json()]
+            == [comp_match.key for comp_match in Event("2022chcmp").matches()]
+        )
+
+
+def test_event_matches_fields():
+    """Tests TBA's endpoint to retrieve only some of the attributes of all the matches that occurred at an event."""
+    with ApiClient():
+        chs_comp_matches = Event("2022chcmp").matches()
+        chs_comp_matches_fields = Event("2022chcmp").matches(fields=["key", "alliances", "winning_alliance"])
+        assert [
+            (comp_match.key, comp_match.alliances, comp_match.winning_alliance) for comp_match in chs_comp_matches
+        ] == [tuple(comp_match) for comp_match in chs_comp_matches_fields]
+
+
+def test_event_matches_parse_processes():
+    """Tests `Event.matches` with a parse executor to ensure that projections of matches converted in worker processes are the same as the ones converted in the event loop's thread, and that the worker processes are shut down with the client."""  # noqa
+    min_parse_offload_size = InternalData.min_parse_offload_size
+    InternalData.min_parse_offload_size = 0
+
+    try:
+        with ApiClient(parse_processes=2):
+            chs_comp_matches = Event("2022chcmp").matches(fields=["key", "alliances", "winning_alliance"])
+    finally:
+        InternalData.min_parse_offload_size = min_parse_offload_size
+
+    assert InternalData.parse_executor is None
+
+    with ApiClient():
+        assert chs_comp_matches == Event("2022chcmp").matches(fields=["key", "alliances", "winning_alliance"])
+
+
+def test_event_matches_fields_invalid():
+    """Tests TBA's endpoint to retrieve matches with an attribute that doesn't exist to ensure that it raises an error."""
+    with ApiClient():
+        with pytest.raises(ValueError):
+            Event("2022chcmp").matches(fields=["key", "alliance"])
+
+
 def test_event_matches_extra_parameters():
     """Tests `Event.matches` to ensure that an error is raised when more than one parameter out of `simple`, `keys` and `timeseries` is True."""
     with pytest.raises(ValueError):
@@ -178,3 +227,69 @@ def test_event_teams_extra_parameters():
     with pytest.raises(ValueError):
         with ApiClient():
             Event("2022chcmp").teams(simple=True, keys=True, statuses=True)
+
+
+def test_event_snapshot():
+    """Tests `Event.snapshot` to retrieve everything about an event at once with its rankings linked to teams."""
+    with ApiClient():
+        chs_comp_snapshot = Event("2022chcmp").snapshot()
+        assert (
+            isinstance(chs_comp_snapshot, Event.Snapshot)
+            and all(isinstance(comp_match, Match) for comp_match in chs_comp_snapshot.matches)
+            and all(
+                isinstance(comp_team, Team) and comp_team.key == team_ranking.team_key
+                for comp_team, team_ranking in chs_comp_snapshot.ranked_teams
+            )
+        )
+
+
+def test_event_snapshot_optional_sections():
+    """Tests `Event.snapshot` to ensure that a snapshot is still returned when an optional section (predictions) fails to be retrieved, with the error recorded in the snapshot."""  # noqa
+    responses = {
+        "event": {"key": "2022test", "name": "Test Event", "year": 2022},
+        "event_teams": [{"key": "frc4099", "team_number": 4099}],
+        "event_matches": [],
+        "event_rankings": {"rankings": [], "extra_stats_info": [], "sort_order_info": []},
+        "event_alliances": [],
+        "event_awards": [],
+        "event_oprs": {"oprs": {"frc4099": 10.0}, "dprs": {"frc4099": 5.0}, "ccwms": {"frc4099": 5.0}},
+        "event_insights": None,
+        "event_district_points": None,
+    }
+    urls = [ENDPOINTS[endpoint].url("2022test") for endpoint in responses]
+
+    for url, response in zip(urls, responses.values()):
+        cached_response = CachedResponse(body=json.dumps(response).encode())
+        cached_response.refresh({"Cache-Control": "max-age=60"})
+        InternalData.cache_response(url, cached_response)
+
+    InternalData.circuit_breakers["event/predictions"] = CircuitBreaker()
+    InternalData.circuit_breakers["event/predictions"].trip(60)
+
+    try:
+        test_event_snapshot = Event("2022test").snapshot()
+    finally:
+        del InternalData.circuit_breakers["event/predictions"]
+
+        for url in urls:
+            InternalData.invalidate(url)
+
+    assert (
+        test_event_snapshot.event.name == "Test Event"
+        and list(test_event_snapshot.teams) == ["frc4099"]
+        and test_event_snapshot.predictions is None
+        and list(test_event_snapshot.errors) == ["predictions"]
+        and isinstance(test_event_snapshot.errors["predictions"], CircuitOpenError)
+    )
+
+
+def test_event_snapshot_match_alliances():
+    """Tests `Event.Snapshot.match_alliances` to ensure that playoff matches are linked to the alliances that played in them."""
+    with ApiClient():
+        chs_comp_snapshot = Event("2022chcmp").snapshot()
+        finals = [comp_match for comp_match in chs_comp_snapshot.matches if comp_match.comp_level == "f"]
+        assert finals and all(
+            isinstance(alliance, Event.Alliance)
+            for final in finals
+            for alliance in chs_comp_snapshot.match_alliances(final).values()
+        )
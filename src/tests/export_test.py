@@ -0,0 +1,129 @@
+import json
+
+import pytest
+
+from ..export import *
+from ..schemas import *
+
+SAMPLE_MATCH = {
+    "key": "2022chcmp_qm1",
+    "event_key": "2022chcmp",
+    "comp_level": "qm",
+    "set_number": 1,
+    "match_number": 1,
+    "alliances": {
+        "red": {
+            "score": 40,
+            "team_keys": ["frc4099", "frc2363", "frc1629"],
+            "surrogate_team_keys": [],
+            "dq_team_keys": [],
+        },
+        "blue": {
+            "score": 35,
+            "team_keys": ["frc614", "frc339", "frc1731"],
+            "surrogate_team_keys": [],
+            "dq_team_keys": [],
+        },
+    },
+    "winning_alliance": "red",
+    "time": 1649420400,
+    "score_breakdown": {
+        "red": {"autoPoints": 12, "endgameRobot1": "Traversal"},
+        "blue": {"autoPoints": 8, "endgameRobot1": "None"},
+    },
+}
+
+
+def test_export_ndjson(tmp_path):
+    """Tests `export` to ensure that matches are written as one flat JSON object per line with the selected score breakdown fields."""
+    rows_written = export(
+        tmp_path / "matches.ndjson",
+        (Match(**SAMPLE_MATCH) for _ in range(3)),
+        score_breakdown_fields=["autoPoints"],
+        chunk_size=2,
+    )
+
+    with open(tmp_path / "matches.ndjson") as export_file:
+        rows = [json.loads(line) for line in export_file]
+
+    assert (
+        rows_written == 3
+        and len(rows) == 3
+        and rows[0]["red_team_keys"] == ["frc4099", "frc2363", "frc1629"]
+        and rows[0]["red_autoPoints"] == 12
+        and rows[0]["blue_autoPoints"] == 8
+        and "red_endgameRobot1" not in rows[0]
+    )
+
+
+def test_export_ndjson_awards(tmp_path):
+    """Tests `export` to ensure that awards are written with one row per recipient."""
+    award = Award(
+        name="Winner",
+        award_type=1,
+        event_key="2022chcmp",
+        year=2022,
+        recipient_list=[{"team_key": "frc4099", "awardee": None}, {"team_key": "frc2363", "awardee": None}],
+    )
+    export(tmp_path / "awards.ndjson", [award])
+
+    with open(tmp_path / "awards.ndjson") as export_file:
+        assert [json.loads(line)["team_key"] for line in export_file] == ["frc4099", "frc2363"]
+
+
+def test_export_parquet(tmp_path):
+    """Tests `export` to ensure that matches are written to Parquet with typed columns."""
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+    export(
+        tmp_path / "matches.parquet",
+        (Match(**SAMPLE_MATCH) for _ in range(5)),
+        score_breakdown_fields=["autoPoints", "endgameRobot1"],
+        chunk_size=2,
+    )
+    table = pyarrow_parquet.read_table(tmp_path / "matches.parquet")
+
+    assert (
+        table.num_rows == 5
+        and str(table.schema.field("red_autoPoints").type) == "int64"
+        and str(table.schema.field("blue_endgameRobot1").type) == "string"
+        and table.column("red_team_keys").to_pylist()[0] == ["frc4099", "frc2363", "frc1629"]
+    )
+
+
+def test_export_ndjson_match_without_alliances(tmp_path):
+    """Tests `export` to ensure that a match without alliances is written with empty alliance columns instead of failing the export."""  # noqa
+    export(tmp_path / "matches.ndjson", [Match(**{**SAMPLE_MATCH, "alliances": None}), Match(**SAMPLE_MATCH)])
+
+    with open(tmp_path / "matches.ndjson") as export_file:
+        rows = [json.loads(line) for line in export_file]
+
+    assert (
+        rows[0]["red_score"] is None
+        and rows[0]["blue_team_keys"] is None
+        and rows[1]["red_score"] == 40
+        and rows[0].keys() == rows[1].keys()
+    )
+
+
+def test_export_parquet_widened_columns(tmp_path):
+    """Tests `export` to ensure that score breakdown columns are widened when a later chunk doesn't fit the type inferred from the earlier chunks."""  # noqa
+    pyarrow_parquet = pytest.importorskip("pyarrow.parquet")
+
+    auto_points = [None, None, 12, 8, 12.5, 4]
+    export(
+        tmp_path / "matches.parquet",
+        (
+            Match(**{**SAMPLE_MATCH, "score_breakdown": {"red": {"autoPoints": points}, "blue": {"autoPoints": 0}}})
+            for points in auto_points
+        ),
+        score_breakdown_fields=["autoPoints"],
+        chunk_size=2,
+    )
+    table = pyarrow_parquet.read_table(tmp_path / "matches.parquet")
+
+    assert (
+        str(table.schema.field("red_autoPoints").type) == "double"
+        and table.column("red_autoPoints").to_pylist() == auto_points
+        and pyarrow_parquet.ParquetFile(tmp_path / "matches.parquet").metadata.num_row_groups == 3
+    )
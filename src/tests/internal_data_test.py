@@ -0,0 +1,259 @@
+import asyncio
+import gc
+import json
+
+import pytest
+
+from ..utils import *
+
+
+def test_priority_semaphore():
+    """Tests `PrioritySemaphore` to ensure that free slots are handed to the waiters with the highest priority first, in the order they started waiting, and that cancelled waiters don't keep a slot."""  # noqa
+
+    async def wait_in_order() -> list[str]:
+        semaphore = PrioritySemaphore(1)
+        acquired = []
+
+        async def request(name: str, priority: Priority) -> None:
+            with request_priority(priority):
+                async with semaphore:
+                    acquired.append(name)
+                    await asyncio.sleep(0)
+
+        await semaphore.acquire()
+        tasks = [
+            asyncio.ensure_future(request(name, priority))
+            for name, priority in [
+                ("bulk1", Priority.BULK),
+                ("normal", Priority.NORMAL),
+                ("bulk2", Priority.BULK),
+                ("cancelled", Priority.INTERACTIVE),
+                ("interactive", Priority.INTERACTIVE),
+            ]
+        ]
+        await asyncio.sleep(0)
+
+        tasks[3].cancel()
+        semaphore.release()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        return acquired + [str(semaphore.locked())]
+
+    assert InternalData.loop.run_until_complete(wait_in_order()) == ["interactive", "normal", "bulk1", "bulk2", "False"]
+
+
+def test_deadline():
+    """Tests `deadline` to ensure that a fan-out waiting on a stuck request returns the results that finished in time and reports the request that didn't."""  # noqa
+    stuck_url = "https://www.thebluealliance.com/api/v3/team/frc1"
+    cached_url = "https://www.thebluealliance.com/api/v3/team/frc2"
+
+    async def fetch_with_deadline() -> PartialResults:
+        cached_response = CachedResponse(body=b'{"key": "frc2"}')
+        cached_response.refresh({"Cache-Control": "max-age=60"})
+        InternalData.cache_response(cached_url, cached_response)
+        InternalData.in_flight[stuck_url] = asyncio.get_running_loop().create_future()
+
+        try:
+            with deadline(0.05):
+                return await fan_out(
+                    lambda url: InternalData.get(url=url, headers={}), [stuck_url, cached_url], partial=True
+                )
+        finally:
+            del InternalData.in_flight[stuck_url]
+            InternalData.invalidate(cached_url)
+
+    results = InternalData.loop.run_until_complete(fetch_with_deadline())
+    assert results == [{"key": "frc2"}] and isinstance(results.errors[stuck_url], DeadlineExceeded)
+
+
+def test_deadline_request_error():
+    """Tests `deadline` to ensure that a request that times out on its own before the deadline passes raises its own error instead of a DeadlineExceeded error."""  # noqa
+    url = "https://www.thebluealliance.com/api/v3/team/frc1"
+
+    async def fetch_with_deadline() -> None:
+        request = asyncio.get_running_loop().create_future()
+        InternalData.in_flight[url] = request
+        asyncio.get_running_loop().call_later(0.01, request.set_exception, asyncio.TimeoutError())
+
+        try:
+            with deadline(5):
+                await InternalData.get(url=url, headers={})
+        finally:
+            del InternalData.in_flight[url]
+
+    with pytest.raises(asyncio.TimeoutError) as exception_info:
+        InternalData.loop.run_until_complete(fetch_with_deadline())
+
+    assert not isinstance(exception_info.value, DeadlineExceeded)
+
+
+def test_circuit_breaker():
+    """Tests `InternalData.fetch` to ensure that stale responses are served while an endpoint family fails, that requests stop once its circuit breaker trips and that a background probe closes it again after recovery."""  # noqa
+    web = pytest.importorskip("aiohttp.web")
+    test_utils = pytest.importorskip("aiohttp.test_utils")
+    server_statuses = [200, 503, 503]
+    received_paths = []
+
+    async def handle_matches(request: "web.Request") -> "web.Response":
+        received_paths.append(request.path)
+        status = server_statuses.pop(0) if server_statuses else 200
+        return web.json_response([], status=status, headers={"Cache-Control": "max-age=0"})
+
+    async def request_while_failing() -> list:
+        app = web.Application()
+        app.router.add_get("/api/v3/event/{event_key}/matches", handle_matches)
+        InternalData.circuit_breakers["event/matches"] = CircuitBreaker(failure_threshold=2, reset_timeout=0.05)
+
+        try:
+            async with test_utils.TestServer(app) as server:
+                await InternalData.set_session()
+                url = str(server.make_url("/api/v3/event/2022chcmp/matches"))
+                uncached_url = str(server.make_url("/api/v3/event/2022iri/matches"))
+                results = [await InternalData.get(url=url, headers={}) for _ in range(4)]
+
+                with pytest.raises(CircuitOpenError):
+                    await InternalData.get(url=uncached_url, headers={})
+
+                await asyncio.sleep(0.05)
+                results.append(await InternalData.get(url=url, headers={}))
+                await asyncio.sleep(0.05)
+
+                return results + [len(received_paths), InternalData.circuit_breakers["event/matches"].is_open]
+        finally:
+            del InternalData.circuit_breakers["event/matches"]
+            InternalData.invalidate(url)
+
+    assert InternalData.loop.run_until_complete(request_while_failing()) == [[], [], [], [], [], 4, False]
+
+
+def test_datafeed_down():
+    """Tests `InternalData.apply_status` to ensure that stale responses of datafeed endpoints are served while the datafeed is down, but that responses that aren't cached are still requested without tripping any circuit breaker."""  # noqa
+    web = pytest.importorskip("aiohttp.web")
+    test_utils = pytest.importorskip("aiohttp.test_utils")
+    received_paths = []
+
+    async def handle_matches(request: "web.Request") -> "web.Response":
+        received_paths.append(request.path)
+        return web.json_response([request.match_info["event_key"]], headers={"Cache-Control": "max-age=0"})
+
+    async def request_while_down() -> list:
+        app = web.Application()
+        app.router.add_get("/api/v3/event/{event_key}/matches", handle_matches)
+
+        async with test_utils.TestServer(app) as server:
+            await InternalData.set_session()
+            cached_url = str(server.make_url("/api/v3/event/2022chcmp/matches"))
+            uncached_url = str(server.make_url("/api/v3/event/2022iri/matches"))
+            stale_response = CachedResponse(body=b'["stale"]')
+            stale_response.refresh({"Cache-Control": "max-age=0"})
+            InternalData.cache_response(cached_url, stale_response)
+            InternalData.apply_status(True, [])
+
+            try:
+                return [
+                    await InternalData.get(url=cached_url, headers={}),
+                    await InternalData.get(url=uncached_url, headers={}),
+                    received_paths,
+                    InternalData.circuit_breaker("event/matches").is_open,
+                ]
+            finally:
+                InternalData.apply_status(False, [])
+                InternalData.invalidate(cached_url)
+                InternalData.invalidate(uncached_url)
+
+    assert InternalData.loop.run_until_complete(request_while_down()) == [
+        ["stale"],
+        ["2022iri"],
+        ["/api/v3/event/2022iri/matches"],
+        False,
+    ]
+
+
+def test_endpoint_urls():
+    """Tests `Endpoint.url` to ensure that it constructs the same URLs as `construct_url` no matter the order options are passed in, and that it rejects options the route doesn't take."""  # noqa
+    assert (
+        ENDPOINTS["team_events"].url("frc4099", keys=True, year=2022)
+        == construct_url("team", key="frc4099", endpoint="events", year=2022, keys=True)
+        and ENDPOINTS["teams"].url(year=2022, page_num=0, simple=False)
+        == construct_url("teams", year=2022, page_num=0, simple=False)
+        and ENDPOINTS["team_media_tag"].url("frc4099", "youtube", year=2022)
+        == construct_url("team", key="frc4099", endpoint="media", second_endpoint="tag", media_tag="youtube", year=2022)
+        and ENDPOINTS["status"].url() == construct_url("status").rstrip("/")
+    )
+
+    with pytest.raises(TypeError):
+        ENDPOINTS["event_matches"].url("2022chcmp", statuses=True)
+
+
+def test_identity_map():
+    """Tests `InternalData.identity_map` to ensure that records retrieved again reuse their objects unless their data changed, and that records are forgotten once their objects aren't used anymore."""  # noqa
+    from ..schemas import Team
+
+    url = "https://www.thebluealliance.com/api/v3/event/2022chcmp/teams"
+    teams_data = [{"key": "frc4099", "team_number": 4099}, {"key": "frc1403", "team_number": 1403}]
+
+    async def fetch_teams() -> list[Team]:
+        return await InternalData.get_objects(url=url, headers={}, constructor=Team._constructor())
+
+    try:
+        cached_response = CachedResponse(body=json.dumps(teams_data).encode())
+        cached_response.refresh({"Cache-Control": "max-age=60"})
+        InternalData.cache_response(url, cached_response)
+
+        teams = InternalData.loop.run_until_complete(fetch_teams())
+        same_teams = InternalData.loop.run_until_complete(fetch_teams())
+        changed_teams = Team._construct_all([{"key": "frc4099", "team_number": 4099, "nickname": "The Falcons"}])
+        unchanged_teams = Team._construct_all([dict(teams_data[1])])
+
+        assert teams == same_teams and all(team is same_team for team, same_team in zip(teams, same_teams))
+        assert changed_teams[0] is not teams[0] and changed_teams[0].nickname == "The Falcons"
+        assert unchanged_teams[0] is teams[1]
+
+        entries = len(InternalData.identity_map)
+        del teams, same_teams, unchanged_teams
+        gc.collect()
+        assert len(InternalData.identity_map) == entries - 1
+    finally:
+        InternalData.invalidate(url)
+
+
+def test_fan_out_progress():
+    """Tests the `progress` parameter in `fan_out` to ensure that it is called every time an item finishes, not only once every item finished."""  # noqa
+    progress_updates = []
+
+    async def finish_after(delay: float) -> float:
+        await asyncio.sleep(delay)
+        return delay
+
+    results = InternalData.loop.run_until_complete(
+        fan_out(
+            finish_after,
+            [0.04, 0.0, 0.02],
+            progress=lambda done, total: progress_updates.append((done, total)),
+        )
+    )
+    assert results == [0.04, 0.0, 0.02] and progress_updates == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_fan_out_fatal_errors():
+    """Tests `fan_out` to ensure that when several items fail at once, the first error is raised and the errors of the other items are retrieved instead of being logged as never retrieved."""  # noqa
+    unretrieved_errors = []
+
+    async def fail(year: int) -> None:
+        raise ValueError(year)
+
+    async def fan_out_failing() -> str:
+        loop = asyncio.get_running_loop()
+        loop.set_exception_handler(lambda _, context: unretrieved_errors.append(context))
+
+        try:
+            await fan_out(fail, range(2020, 2023))
+        except ValueError as error:
+            raised_error = str(error)
+        finally:
+            gc.collect()
+            loop.set_exception_handler(None)
+
+        return raised_error
+
+    assert InternalData.loop.run_until_complete(fan_out_failing()) == "2020" and unretrieved_errors == []
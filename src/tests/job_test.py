@@ -0,0 +1,67 @@
+import pytest
+
+from ..api_client import ApiClient
+from ..job import Job
+from ..utils import *
+
+
+@pytest.mark.parametrize("file_name", ["checkpoint.jsonl", "checkpoint.sqlite"])
+def test_checkpoint_resume(tmp_path, file_name):
+    """Tests `Checkpoint.open` to ensure that responses recorded to a checkpoint are read back after it is reopened."""
+    checkpoint = Checkpoint.open(tmp_path / file_name)
+    checkpoint.save("https://www.thebluealliance.com/api/v3/team/frc1", b'{"key": "frc1"}')
+    checkpoint.save("https://www.thebluealliance.com/api/v3/team/frc1", b'{"key": "frc2"}')
+    checkpoint.close()
+
+    resumed_checkpoint = Checkpoint.open(tmp_path / file_name)
+    assert (
+        len(resumed_checkpoint) == 1
+        and resumed_checkpoint.get("https://www.thebluealliance.com/api/v3/team/frc1") == b'{"key": "frc1"}'
+        and resumed_checkpoint.verify() == []
+    )
+
+
+def test_checkpoint_truncated_line(tmp_path):
+    """Tests `JSONLCheckpoint` to ensure that a line cut off by an interrupted download is skipped and can be recorded again."""  # noqa
+    checkpoint = Checkpoint.open(tmp_path / "checkpoint.jsonl")
+    checkpoint.save("https://www.thebluealliance.com/api/v3/team/frc1", b'{"key": "frc1"}')
+    checkpoint.close()
+
+    with open(tmp_path / "checkpoint.jsonl", "ab") as checkpoint_file:
+        checkpoint_file.write(b'{"url": "https://www.thebluealliance.com/api/v3/team/frc2", "bo')
+
+    resumed_checkpoint = Checkpoint.open(tmp_path / "checkpoint.jsonl")
+    resumed_checkpoint.save("https://www.thebluealliance.com/api/v3/team/frc2", b'{"key": "frc2"}')
+    resumed_checkpoint.close()
+
+    assert Checkpoint.open(tmp_path / "checkpoint.jsonl").urls() == [
+        "https://www.thebluealliance.com/api/v3/team/frc1",
+        "https://www.thebluealliance.com/api/v3/team/frc2",
+    ]
+
+
+def test_checkpoint_corrupted_response(tmp_path):
+    """Tests `Checkpoint.verify` to ensure that a response that doesn't match its checksum is reported and forgotten."""
+    checkpoint = Checkpoint.open(tmp_path / "checkpoint.jsonl")
+    checkpoint.save("https://www.thebluealliance.com/api/v3/team/frc1", b'{"key": "frc1"}')
+    checkpoint.close()
+
+    with open(tmp_path / "checkpoint.jsonl", "rb") as checkpoint_file:
+        contents = checkpoint_file.read().replace(b"frc1\\", b"frc9\\")
+    with open(tmp_path / "checkpoint.jsonl", "wb") as checkpoint_file:
+        checkpoint_file.write(contents)
+
+    job = Job(tmp_path / "checkpoint.jsonl")
+    assert job.corrupted_urls == ["https://www.thebluealliance.com/api/v3/team/frc1"] and len(job) == 0
+
+
+def test_job_resume(tmp_path):
+    """Tests `Job` to ensure that a download run again inside the same checkpoint returns the recorded responses."""
+    with ApiClient() as api_client:
+        with Job(tmp_path / "checkpoint.sqlite") as job:
+            events = api_client.events(year=range(2019, 2021), simple=True)
+            completed_urls = job.completed_urls
+
+        with Job(tmp_path / "checkpoint.sqlite") as resumed_job:
+            resumed_events = api_client.events(year=range(2019, 2021), simple=True)
+            assert resumed_events == events and resumed_job.completed_urls == completed_urls
@@ -0,0 +1,42 @@
+from ..api_client import ApiClient
+from ..schemas import *
+from ..season import Season
+
+
+def test_season_load():
+    """Tests `Season.load` to retrieve every event, team, match and ranking of a season with them indexed by key."""
+    with ApiClient():
+        season = Season.load(1992)
+        assert (
+            season.events
+            and all(isinstance(event, Event) for event in season.events.values())
+            and all(
+                team_key in season.teams
+                for event_team_keys in season.event_teams.values()
+                for team_key in event_team_keys
+            )
+            and all(
+                match_key in season.matches
+                for team_match_keys in season.team_matches.values()
+                for match_key in team_match_keys
+            )
+        )
+
+
+def test_season_load_checkpoint(tmp_path):
+    """Tests `Season.load` with a checkpoint file to ensure that a season loaded from it is identical to the season that was retrieved."""
+    with ApiClient():
+        checkpoint = tmp_path / "1992.jsonl"
+        season = Season.load(1992, checkpoint=checkpoint)
+        resumed_season = Season.load(1992, checkpoint=checkpoint)
+        assert resumed_season.event_matches == season.event_matches and resumed_season.team_events == season.team_events
+
+
+def test_season_match_without_alliances():
+    """Tests `Season` with a match that doesn't have alliances to ensure that it's indexed under its event without being linked to any team."""  # noqa
+    season = Season(2022)
+    season._add_event_data(
+        "2022test",
+        {"team_keys": ["frc4099"], "matches": [{"key": "2022test_qm1", "alliances": None}], "rankings": None},
+    )
+    assert season.event_matches["2022test"] == ["2022test_qm1"] and not season.team_matches.get("frc4099")
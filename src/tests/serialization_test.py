@@ -0,0 +1,100 @@
+import pickle
+
+import pytest
+
+from ..schemas import *
+from ..serialization import *
+
+SAMPLE_RANKINGS = {
+    "extra_stats_info": [{"name": "Total Ranking Points", "precision": 0}],
+    "sort_order_info": [{"name": "Ranking Score", "precision": 2}, {"name": "Avg Match", "precision": 2}],
+    "rankings": [
+        {
+            "dq": 0,
+            "extra_stats": [40],
+            "matches_played": 12,
+            "qual_average": None,
+            "rank": 1,
+            "record": {"losses": 1, "ties": 0, "wins": 11},
+            "sort_orders": [3.33, 80.5],
+            "team_key": "frc4099",
+        }
+    ],
+}
+SAMPLE_STATUS = {
+    "alliance": {"backup": None, "name": "Alliance 1", "number": 1, "pick": 0},
+    "alliance_status_str": "...",
+    "last_match_key": "2022chcmp_f1m2",
+    "next_match_key": None,
+    "overall_status_str": "...",
+    "playoff": {
+        "current_level_record": {"losses": 0, "ties": 0, "wins": 2},
+        "level": "f",
+        "playoff_average": None,
+        "record": {"losses": 1, "ties": 0, "wins": 8},
+        "status": "won",
+    },
+    "playoff_status_str": "...",
+    "qual": {
+        "num_teams": 60,
+        "ranking": SAMPLE_RANKINGS["rankings"][0],
+        "sort_order_info": SAMPLE_RANKINGS["sort_order_info"],
+        "status": "completed",
+    },
+}
+
+
+def sample_objects() -> list:
+    return [
+        Match(
+            key="2022chcmp_qm1",
+            event_key="2022chcmp",
+            alliances={
+                "red": {"score": 40, "team_keys": ["frc4099"], "surrogate_team_keys": [], "dq_team_keys": []},
+                "blue": {"score": 35, "team_keys": ["frc614"], "surrogate_team_keys": [], "dq_team_keys": []},
+            },
+            time=1649420400,
+            score_breakdown={"red": {"autoPoints": 12}, "blue": {"autoPoints": 8}},
+        ),
+        Event(key="2022chcmp", start_date="2022-04-06", end_date="2022-04-09", district={"key": "2022chs"}),
+        Team(key="frc4099", nickname="The Falcons"),
+        Event._construct_ranking(SAMPLE_RANKINGS["rankings"][0], SAMPLE_RANKINGS),
+        EventTeamStatus("2022chcmp", SAMPLE_STATUS),
+    ]
+
+
+def test_serialization_round_trip():
+    """Tests `dumps` and `loads` to ensure that schema objects, including dynamic extra stats and sort orders, are identical after a round trip."""
+    pytest.importorskip("msgpack")
+
+    objects = sample_objects()
+    deserialized_objects = loads(dumps(objects))
+    assert (
+        deserialized_objects == objects
+        and deserialized_objects[3].sort_orders.ranking_score == 3.33
+        and deserialized_objects[4].playoff.status == EventTeamStatus.Status.WON
+    )
+
+
+def test_serialization_pickle():
+    """Tests that schema objects are identical after being pickled and unpickled (eg to be sent to another process)."""
+    objects = sample_objects()
+    assert pickle.loads(pickle.dumps(objects)) == objects
+
+
+def test_serialization_team_profile():
+    """Tests `dumps` and `loads` with a team profile to ensure that profiles, including the years they cover, are identical after a round trip."""  # noqa
+    pytest.importorskip("msgpack")
+
+    team_profile = Team.Profile(
+        team=Team(key="frc4099", nickname="The Falcons"),
+        years=[2020, 2022],
+        events=[sample_objects()[1]],
+        matches=[sample_objects()[0]],
+        awards=[],
+        robots=[],
+        districts=[],
+        media=[],
+        social_media=[],
+    )
+    assert loads(dumps(team_profile)) == team_profile
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 
 from ..api_client import ApiClient
@@ -77,6 +79,25 @@ def test_events_range():
         assert isinstance(all_events, list) and all(isinstance(event, Event) for event in all_events)
 
 
+def test_events_range_progress():
+    """Tests the `progress` parameter in `ApiClient.events` to ensure that it is called once for each year within the range object as it is retrieved."""
+    with ApiClient() as api_client:
+        progress_updates = []
+        api_client.events(
+            year=range(2020, 2023), keys=True, progress=lambda done, total: progress_updates.append((done, total))
+        )
+        assert progress_updates == [(1, 3), (2, 3), (3, 3)]
+
+
+def test_events_range_partial():
+    """Tests the `partial` parameter in `ApiClient.events` to ensure that the results of the years that were retrieved are returned in order."""
+    with ApiClient() as api_client:
+        all_event_keys = api_client.events(year=range(2020, 2023), keys=True, partial=True)
+        assert not all_event_keys.errors and [event_key[:4] for event_key in all_event_keys] == sorted(
+            event_key[:4] for event_key in all_event_keys
+        )
+
+
 def test_events_simple():
     """Tests TBA's endpoint for retrieving shortened information about all the events that occurred during a year."""
     with ApiClient() as api_client:
@@ -164,6 +185,37 @@ def test_teams_range():
         )
 
 
+def test_teams_range_fields():
+    """Tests `ApiClient.teams` with a range object and `fields` to ensure that teams in multiple years are deduplicated and sorted by their team numbers, even if the team number isn't one of the fields."""  # noqa
+    year_teams = {
+        2021: [{"key": "frc4099", "team_number": 4099, "nickname": "The Falcons"}],
+        2022: [
+            {"key": "frc4099", "team_number": 4099, "nickname": "The Falcons"},
+            {"key": "frc254", "team_number": 254, "nickname": "The Cheesy Poofs"},
+        ],
+    }
+    urls = []
+
+    for year, teams in year_teams.items():
+        for page_num in range(0, 20):
+            url = ENDPOINTS["teams"].url(year=year, page_num=page_num)
+            cached_response = CachedResponse(body=json.dumps(teams if page_num == 0 else []).encode())
+            cached_response.refresh({"Cache-Control": "max-age=60"})
+            InternalData.cache_response(url, cached_response)
+            urls.append(url)
+
+    try:
+        with ApiClient(api_key="") as api_client:
+            range_teams = api_client.teams(year=range(2021, 2023), fields=["nickname"])
+    finally:
+        for url in urls:
+            InternalData.invalidate(url)
+
+    assert [tuple(team) for team in range_teams] == [("The Cheesy Poofs",), ("The Falcons",)] and all(
+        team._fields == ("nickname",) for team in range_teams
+    )
+
+
 def test_teams_simple():
     """Tests TBA's endpoint for retrieving shortened information about all the teams that played during a year."""
     with ApiClient() as api_client:
@@ -184,3 +236,45 @@ def test_teams_extra_parameters():
     with pytest.raises(ValueError):
         with ApiClient() as api_client:
             api_client.teams(page_num=1, year=2022, simple=True, keys=True)
+
+
+def test_events_by_key():
+    """Tests `ApiClient.events_by_key` to retrieve numerous events concurrently in the order of the keys passed in."""
+    with ApiClient() as api_client:
+        events = api_client.events_by_key(["2022cmptx", "2022chcmp", "2022cmptx"])
+        assert [event.key for event in events] == ["2022cmptx", "2022chcmp", "2022cmptx"]
+
+
+def test_matches_by_key():
+    """Tests `ApiClient.matches_by_key` to retrieve numerous matches concurrently in the order of the keys passed in."""
+    with ApiClient() as api_client:
+        matches = api_client.matches_by_key(["2022cmptx_f1m1", "2022cmptx_f1m2"])
+        assert [game_match.key for game_match in matches] == ["2022cmptx_f1m1", "2022cmptx_f1m2"]
+
+
+def test_teams_by_key():
+    """Tests `ApiClient.teams_by_key` to retrieve numerous teams concurrently in the order of the keys passed in."""
+    with ApiClient() as api_client:
+        teams = api_client.teams_by_key(["frc4099", "frc254", "frc4099"])
+        assert [team.team_number for team in teams] == [4099, 254, 4099]
+
+
+def test_teams_by_key_invalid_key():
+    """Tests `ApiClient.teams_by_key` to ensure that an invalid key is reported in place without failing the other keys."""
+    with ApiClient() as api_client:
+        team4099, invalid_team = api_client.teams_by_key(["frc4099", "frc0"])
+        assert isinstance(team4099, Team) and isinstance(invalid_team, TBAError)
+
+
+def test_team_profiles():
+    """Tests `ApiClient.team_profiles` to retrieve the profiles of numerous teams concurrently in the order of the keys passed in."""
+    with ApiClient() as api_client:
+        profiles = api_client.team_profiles(["frc4099", "frc254"], years=2022)
+        assert [profile.team.team_number for profile in profiles] == [4099, 254]
+
+
+def test_event_snapshots():
+    """Tests `ApiClient.event_snapshots` to retrieve the snapshots of every event in a week concurrently."""
+    with ApiClient() as api_client:
+        snapshots = api_client.event_snapshots(2022, week=0)
+        assert snapshots and all(snapshot.event.week == 0 for snapshot in snapshots)
@@ -100,6 +100,13 @@ def test_team_matches_range():
     assert isinstance(team4099_matches, list) and all(isinstance(game_match, Match) for game_match in team4099_matches)
 
 
+def test_team_matches_range_before_rookie_year():
+    """Tests `Team.matches` with a range object that starts before the team's rookie year to ensure only years the team participated in are retrieved."""
+    with ApiClient():
+        team4099_matches = Team(4099).matches(range(2000, 2013), keys=True)
+        assert team4099_matches and all(match_key.startswith("2012") for match_key in team4099_matches)
+
+
 def test_team_matches_event_code():
     """Tests `Team.matches` to retrieve all the matches a team played in a certain event."""
     with ApiClient():
@@ -190,6 +197,15 @@ def test_team_events_range():
         )
 
 
+def test_team_events_range_order():
+    """Tests `Team.events` with a range object that covers most of a team's career (retrieving every year at once) to ensure that events are returned in chronological order like they are year by year."""  # noqa
+    with ApiClient():
+        team4099_events = Team(4099).events(range(2010, 2023))
+        assert [(event.year, event.start_date) for event in team4099_events] == sorted(
+            (event.year, event.start_date) for event in team4099_events
+        )
+
+
 def test_team_events_simple():
     """Tests TBA's endpoint to retrieve shortened information about all the events a team has ever played at."""
     with ApiClient():
@@ -300,3 +316,16 @@ def test_team_social_media():
         assert isinstance(team4099_social_media, list) and all(
             isinstance(social_media_account, Media) for social_media_account in team4099_social_media
         )
+
+
+def test_team_profile():
+    """Tests `Team.profile` to retrieve everything about a team across multiple years at once."""
+    with ApiClient():
+        team4099_profile = Team(4099).profile(range(2020, 2023))
+        assert (
+            isinstance(team4099_profile, Team.Profile)
+            and team4099_profile.team.team_number == 4099
+            and all(isinstance(game_match, Match) for game_match in team4099_profile.matches)
+            and all(team_event.year in range(2020, 2023) for team_event in team4099_profile.events)
+            and set(team4099_profile.years) <= set(range(2020, 2023))
+        )
@@ -0,0 +1,55 @@
+from ..api_client import ApiClient
+from ..schemas import *
+from ..utils import *
+from ..watcher import EventWatcher
+
+
+def test_watcher_first_poll():
+    """Tests `EventWatcher.poll` to ensure that the first poll of an event reports all of its matches, rankings and statuses as added."""
+    with ApiClient():
+        changes = EventWatcher(["2022chcmp"]).poll()
+        assert {change.kind for change in changes} == {"match", "ranking", "status"} and all(
+            change.old is None for change in changes
+        )
+
+
+def test_watcher_unchanged_poll():
+    """Tests `EventWatcher.poll` to ensure that polling an event that hasn't changed reports no changes."""
+    with ApiClient():
+        chs_comp_watcher = EventWatcher(["2022chcmp"])
+        chs_comp_watcher.poll()
+        assert chs_comp_watcher.poll() == []
+
+
+def test_watcher_subscribe():
+    """Tests `EventWatcher.subscribe` to ensure that subscribers are notified of every change."""
+    with ApiClient():
+        chs_comp_watcher = EventWatcher(["2022chcmp"])
+        notified_changes = []
+        chs_comp_watcher.subscribe(notified_changes.append)
+        assert chs_comp_watcher.poll() == notified_changes and all(
+            isinstance(change.new, Match) for change in notified_changes if change.kind == "match"
+        )
+
+
+def test_watcher_failed_poll():
+    """Tests `EventWatcher.watch` to ensure that an event keeps being polled after a poll fails because of a request error."""  # noqa
+    chs_comp_watcher = EventWatcher(["2022chcmp"], min_interval=0.01, max_interval=0.01)
+    recorded_errors = []
+
+    async def poll_event(event_key: str) -> list:
+        recorded_errors.append(dict(chs_comp_watcher.errors))
+
+        if len(recorded_errors) == 1:
+            raise TBAServerError(f"TBA responded with 503 for event/{event_key}/matches.")
+
+        chs_comp_watcher.stop()
+        return []
+
+    chs_comp_watcher._poll_event = poll_event
+    InternalData.loop.run_until_complete(chs_comp_watcher.watch())
+    assert (
+        len(recorded_errors) == 2
+        and isinstance(recorded_errors[1]["2022chcmp"], TBAServerError)
+        and chs_comp_watcher.errors == {}
+    )
@@ -0,0 +1,80 @@
+import json
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from ..schemas import *
+from ..utils import *
+from ..webhooks import WebhookReceiver
+
+SAMPLE_MATCH_SCORE = {
+    "message_type": "match_score",
+    "message_data": {
+        "event_key": "2022chcmp",
+        "match_key": "2022chcmp_qm1",
+        "event_name": "FIRST Chesapeake District Championship",
+        "match": {
+            "key": "2022chcmp_qm1",
+            "event_key": "2022chcmp",
+            "comp_level": "qm",
+            "set_number": 1,
+            "match_number": 1,
+            "alliances": {
+                "red": {"score": 42, "teams": ["frc4099", "frc1418", "frc5587"]},
+                "blue": {"score": 37, "teams": ["frc1629", "frc2199", "frc8592"]},
+            },
+        },
+    },
+}
+
+
+def post_webhook(receiver: WebhookReceiver, payload: dict, hmac_header: str = None) -> int:
+    """Posts a sample payload to a webhook receiver and returns the status of its response."""
+    body = json.dumps(payload).encode()
+
+    async def send_webhook() -> int:
+        async with TestClient(TestServer(receiver.app)) as client:
+            response = await client.post(
+                receiver.path, data=body, headers={"X-TBA-HMAC": hmac_header or receiver.signature(body)}
+            )
+            return response.status
+
+    return InternalData.loop.run_until_complete(send_webhook())
+
+
+def test_webhook_match_score():
+    """Tests `WebhookReceiver` to ensure that a match_score webhook is translated into a Match object for subscribers."""
+    receiver = WebhookReceiver("secret")
+    updates = []
+    receiver.subscribe(updates.append)
+    assert post_webhook(receiver, SAMPLE_MATCH_SCORE) == 200
+    assert (
+        len(updates) == 1
+        and isinstance(updates[0].match, Match)
+        and updates[0].match.alliances["red"].team_keys == ["frc4099", "frc1418", "frc5587"]
+    )
+
+
+def test_webhook_invalid_hmac():
+    """Tests `WebhookReceiver` to ensure that webhooks with an invalid HMAC are rejected and not passed to subscribers."""
+    receiver = WebhookReceiver("secret")
+    updates = []
+    receiver.subscribe(updates.append)
+    assert post_webhook(receiver, SAMPLE_MATCH_SCORE, hmac_header="invalid") == 401 and not updates
+
+
+def test_webhook_invalidates_cache():
+    """Tests `WebhookReceiver` to ensure that the cached responses of the event a webhook is about are invalidated."""
+    event_matches_url = construct_url("event", key="2022chcmp", endpoint="matches")
+    other_event_url = construct_url("event", key="2022chcmp2", endpoint="matches")
+    InternalData.cache_response(event_matches_url, CachedResponse(body=b"[]"))
+    InternalData.cache_response(other_event_url, CachedResponse(body=b"[]"))
+
+    assert post_webhook(WebhookReceiver("secret"), SAMPLE_MATCH_SCORE) == 200
+    assert event_matches_url not in InternalData.cache and other_event_url in InternalData.cache
+
+
+def test_webhook_verification():
+    """Tests `WebhookReceiver` to ensure that the verification key TBA sends is stored."""
+    receiver = WebhookReceiver("secret")
+    payload = {"message_type": "verification", "message_data": {"verification_key": "abc123"}}
+    assert post_webhook(receiver, payload) == 200 and receiver.verification_key == "abc123"
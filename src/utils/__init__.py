@@ -1,5 +1,38 @@
-from .exceptions import TBAError
+from .checkpoint import Checkpoint, JSONLCheckpoint, SQLiteCheckpoint
+from .circuit_breaker import CircuitBreaker, endpoint_family
+from .deadline import deadline, remaining_time
+from .endpoints import BASE_URL, ENDPOINTS, Endpoint
+from .exceptions import CircuitOpenError, DeadlineExceeded, TBAError, TBAServerError
+from .fan_out import PartialResults, fan_out
 from .functions import *
-from .internal_data import InternalData
+from .identity_map import IdentityMap
+from .internal_data import CachedResponse, InternalData
+from .priority import Priority, PrioritySemaphore, request_priority
+from .publisher import Publisher
 
-__all__ = ["construct_url", "InternalData", "TBAError"]
+__all__ = [
+    "BASE_URL",
+    "CachedResponse",
+    "Checkpoint",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "construct_url",
+    "deadline",
+    "DeadlineExceeded",
+    "Endpoint",
+    "endpoint_family",
+    "ENDPOINTS",
+    "fan_out",
+    "IdentityMap",
+    "InternalData",
+    "JSONLCheckpoint",
+    "PartialResults",
+    "Priority",
+    "PrioritySemaphore",
+    "Publisher",
+    "remaining_time",
+    "request_priority",
+    "SQLiteCheckpoint",
+    "TBAError",
+    "TBAServerError",
+]
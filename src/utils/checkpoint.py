@@ -0,0 +1,209 @@
+import abc
+import hashlib
+import json
+import os
+import sqlite3
+import typing
+
+__all__ = ["Checkpoint", "JSONLCheckpoint", "SQLiteCheckpoint"]
+
+
+class Checkpoint(abc.ABC):
+    """Base class for local files that record the responses of every URL retrieved during a bulk download."""
+
+    def __init__(self, path: typing.Union[str, os.PathLike]):
+        self.path = path
+
+    @staticmethod
+    def open(path: typing.Union[str, os.PathLike]) -> "Checkpoint":
+        """
+        Opens a checkpoint file, choosing its format based off its extension.
+
+        Parameters:
+            path:
+                A path to the checkpoint file. Files ending in '.db', '.sqlite' or '.sqlite3' are SQLite databases and every other file is stored as JSON Lines.
+
+        Returns:
+            A SQLiteCheckpoint or JSONLCheckpoint object representing the checkpoint file.
+        """  # noqa
+        if os.fspath(path).endswith((".db", ".sqlite", ".sqlite3")):
+            return SQLiteCheckpoint(path)
+        else:
+            return JSONLCheckpoint(path)
+
+    @staticmethod
+    def checksum(body: bytes) -> str:
+        """
+        Computes the checksum a response is stored with to verify its integrity when it's read back.
+
+        Parameters:
+            body:
+                A bytes object representing the body of the response.
+
+        Returns:
+            A string representing the hexadecimal SHA-256 digest of the body.
+        """
+        return hashlib.sha256(body).hexdigest()
+
+    @abc.abstractmethod
+    def __contains__(self, url: str) -> bool:
+        ...
+
+    @abc.abstractmethod
+    def __len__(self) -> int:
+        ...
+
+    @abc.abstractmethod
+    def get(self, url: str) -> typing.Optional[bytes]:
+        """
+        Retrieves the response recorded for a URL.
+
+        Parameters:
+            url:
+                A string representing the URL the response was retrieved from.
+
+        Returns:
+            A bytes object representing the body of the response or None if the URL wasn't recorded or its response failed its integrity check.
+        """  # noqa
+
+    @abc.abstractmethod
+    def save(self, url: str, body: bytes) -> None:
+        """
+        Records the response of a URL if it wasn't recorded already.
+
+        Parameters:
+            url:
+                A string representing the URL the response was retrieved from.
+            body:
+                A bytes object representing the body of the response.
+        """
+
+    def verify(self) -> list[str]:
+        """
+        Checks the integrity of every recorded response, forgetting the responses that are corrupted so that they're retrieved again.
+
+        Returns:
+            A list of strings representing the URLs whose responses were corrupted.
+        """  # noqa
+        return [url for url in self.urls() if self.get(url) is None]
+
+    @abc.abstractmethod
+    def urls(self) -> list[str]:
+        """Returns the URLs that have responses recorded."""
+
+    @abc.abstractmethod
+    def close(self) -> None:
+        """Closes the checkpoint file."""
+
+
+class JSONLCheckpoint(Checkpoint):
+    """Checkpoint stored as a JSON Lines file with one URL, response and checksum per line."""
+
+    def __init__(self, path: typing.Union[str, os.PathLike]):
+        super().__init__(path)
+
+        self._file = open(path, "a+b")
+        self._offsets: dict[str, int] = {}
+
+        self._file.seek(0)
+        offset = 0
+        line = b""
+
+        for line in self._file:
+            try:
+                self._offsets[json.loads(line)["url"]] = offset
+            except (ValueError, KeyError):  # The download was interrupted while the line was being written
+                pass
+
+            offset += len(line)
+
+        if line and not line.endswith(b"\n"):
+            self._file.write(b"\n")
+            self._file.flush()
+
+    def __contains__(self, url: str) -> bool:
+        return url in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def get(self, url: str) -> typing.Optional[bytes]:
+        if url not in self._offsets:
+            return None
+
+        self._file.seek(self._offsets[url])
+
+        try:
+            record = json.loads(self._file.readline())
+            body = record["body"].encode()
+        except (ValueError, KeyError, AttributeError):
+            record, body = {}, None
+
+        if body is None or record.get("checksum") != self.checksum(body):
+            del self._offsets[url]
+            return None
+
+        return body
+
+    def save(self, url: str, body: bytes) -> None:
+        if url in self._offsets:
+            return
+
+        self._file.seek(0, os.SEEK_END)
+        self._offsets[url] = self._file.tell()
+        self._file.write(
+            json.dumps({"url": url, "body": body.decode(), "checksum": self.checksum(body)}).encode() + b"\n"
+        )
+        self._file.flush()
+
+    def urls(self) -> list[str]:
+        return list(self._offsets)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+class SQLiteCheckpoint(Checkpoint):
+    """Checkpoint stored as a SQLite database with one row per URL."""
+
+    def __init__(self, path: typing.Union[str, os.PathLike]):
+        super().__init__(path)
+
+        self._connection = sqlite3.connect(path)
+        self._connection.execute(
+            "CREATE TABLE IF NOT EXISTS responses (url TEXT PRIMARY KEY, body BLOB NOT NULL, checksum TEXT NOT NULL)"
+        )
+        self._connection.commit()
+
+    def __contains__(self, url: str) -> bool:
+        return self._connection.execute("SELECT 1 FROM responses WHERE url = ?", (url,)).fetchone() is not None
+
+    def __len__(self) -> int:
+        return self._connection.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def get(self, url: str) -> typing.Optional[bytes]:
+        row = self._connection.execute("SELECT body, checksum FROM responses WHERE url = ?", (url,)).fetchone()
+
+        if row is None:
+            return None
+
+        body, checksum = row
+
+        if checksum != self.checksum(body):
+            self._connection.execute("DELETE FROM responses WHERE url = ?", (url,))
+            self._connection.commit()
+            return None
+
+        return body
+
+    def save(self, url: str, body: bytes) -> None:
+        self._connection.execute(
+            "INSERT OR IGNORE INTO responses (url, body, checksum) VALUES (?, ?, ?)", (url, body, self.checksum(body))
+        )
+        self._connection.commit()
+
+    def urls(self) -> list[str]:
+        return [url for (url,) in self._connection.execute("SELECT url FROM responses")]
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,126 @@
+import time
+import typing
+
+__all__ = ["CircuitBreaker", "endpoint_family"]
+
+# Path segments that change the shape of a response rather than what it's about
+RESPONSE_MODIFIERS = frozenset({"simple", "keys", "statuses", "timeseries", "zebra_motionworks"})
+
+# Endpoint families whose data comes from FIRST's datafeed, so their cached responses aren't refreshed while it's down
+DATAFEED_FAMILIES = frozenset(
+    {
+        "district/rankings",
+        "event/alliances",
+        "event/awards",
+        "event/district_points",
+        "event/insights",
+        "event/matches",
+        "event/oprs",
+        "event/predictions",
+        "event/rankings",
+        "event/teams",
+        "match",
+        "team/event",
+        "team/matches",
+    }
+)
+
+
+def endpoint_family(url: str) -> str:
+    """
+    Determines which family of endpoints a URL belongs to, which endpoints share a circuit breaker by.
+
+    Parameters:
+        url:
+            A string representing a URL of the TBA API (eg 'https://www.thebluealliance.com/api/v3/event/2022chcmp/matches/simple').
+
+    Returns:
+        A string containing the kind of object the URL is about followed by the endpoint under it if there is one (eg 'event/matches' or 'team').
+    """  # noqa
+    segments = url.split("/api/v3/", 1)[-1].strip("/").split("/")
+    endpoint = next(
+        (segment for segment in segments[2:] if not segment.isdigit() and segment not in RESPONSE_MODIFIERS), None
+    )
+
+    return segments[0] if endpoint is None else f"{segments[0]}/{endpoint}"
+
+
+def event_key_of(url: str) -> typing.Optional[str]:
+    """
+    Determines which event a URL is about.
+
+    Parameters:
+        url:
+            A string representing a URL of the TBA API.
+
+    Returns:
+        A string representing the key of the event (eg '2022chcmp' for the URL of one of its matches) or None if the URL isn't about a single event.
+    """  # noqa
+    segments = url.split("/api/v3/", 1)[-1].strip("/").split("/")
+
+    if segments[0] == "event" and len(segments) > 1:
+        return segments[1]
+    elif segments[0] == "match" and len(segments) > 1:
+        return segments[1].split("_")[0]
+    elif segments[0] == "team" and len(segments) > 3 and segments[2] == "event":
+        return segments[3]
+
+
+class CircuitBreaker:
+    """Class representing a circuit breaker that stops sending requests to a family of endpoints after repeated failures, only letting through a request every so often to probe whether they recovered."""  # noqa
+
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        """
+        Parameters:
+            failure_threshold:
+                An integer representing the amount of consecutive failures (server errors, connection errors and timeouts) that trip the circuit breaker.
+            reset_timeout:
+                A number representing the amount of seconds between the requests that are let through to probe for recovery while the circuit breaker is open.
+        """  # noqa
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+
+        self.failures = 0
+        self.retry_at: typing.Optional[float] = None
+
+    @property
+    def is_open(self) -> bool:
+        """Whether requests are currently being held back (except for probes)."""
+        return self.retry_at is not None
+
+    def allow_request(self) -> bool:
+        """
+        Determines whether a request can be sent, letting through one probe per `reset_timeout` while the circuit breaker is open.
+
+        Returns:
+            A boolean representing whether the request can be sent.
+        """  # noqa
+        if self.retry_at is None:
+            return True
+        elif time.monotonic() >= self.retry_at:
+            self.retry_at = time.monotonic() + self.reset_timeout
+            return True
+
+        return False
+
+    def record_success(self) -> None:
+        """Closes the circuit breaker after a request succeeded."""
+        self.failures = 0
+        self.retry_at = None
+
+    def record_failure(self) -> None:
+        """Counts a failed request, tripping the circuit breaker after `failure_threshold` failures in a row."""
+        self.failures += 1
+
+        if self.failures >= self.failure_threshold:
+            self.trip(self.reset_timeout)
+
+    def trip(self, duration: float) -> None:
+        """
+        Opens the circuit breaker (eg when TBA reports that the endpoints are down).
+
+        Parameters:
+            duration:
+                A number representing the amount of seconds until a request is let through to probe for recovery.
+        """
+        self.retry_at = time.monotonic() + duration
@@ -0,0 +1,41 @@
+import contextlib
+import contextvars
+import time
+import typing
+
+__all__ = ["deadline", "remaining_time"]
+
+# The time (per `time.monotonic`) every request sent from the current task has to finish by
+_current_deadline: contextvars.ContextVar[typing.Optional[float]] = contextvars.ContextVar("deadline", default=None)
+
+
+@contextlib.contextmanager
+def deadline(timeout: float) -> typing.Iterator[None]:
+    """
+    Gives everything inside the `with` block a single time budget, including every request sent by fan-outs and concurrent batch lookups.
+
+    Once the budget runs out, requests that are still waiting raise a DeadlineExceeded error. Methods that take `partial=True` report them in the `errors` attribute of the results that did finish instead. Nested deadlines can only shorten the budget of the outer one, so a single call can be given its own timeout by wrapping it in a `deadline` block.
+
+    Parameters:
+        timeout:
+            A number representing the amount of seconds everything inside the `with` block has to finish within.
+    """  # noqa
+    outer_deadline = _current_deadline.get()
+    inner_deadline = time.monotonic() + timeout
+    token = _current_deadline.set(inner_deadline if outer_deadline is None else min(inner_deadline, outer_deadline))
+
+    try:
+        yield
+    finally:
+        _current_deadline.reset(token)
+
+
+def remaining_time() -> typing.Optional[float]:
+    """
+    Retrieves the amount of time left before the current deadline (see `deadline`).
+
+    Returns:
+        A number representing the amount of seconds left (negative once the deadline passed) or None if there is no deadline.
+    """  # noqa
+    current_deadline = _current_deadline.get()
+    return None if current_deadline is None else current_deadline - time.monotonic()
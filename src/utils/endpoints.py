@@ -0,0 +1,94 @@
+import typing
+
+__all__ = ["BASE_URL", "Endpoint", "ENDPOINTS"]
+
+BASE_URL = "https://www.thebluealliance.com/api/v3/"
+
+
+class Endpoint:
+    """Class representing a precompiled template of a TBA route that produces the canonical URL (and so the cache key) of each request to it."""  # noqa
+
+    __slots__ = ("template", "options", "_format", "_positions")
+
+    def __init__(self, template: str, options: tuple[str, ...] = ()):
+        """
+        Parameters:
+            template:
+                A string representing the path of the route with a placeholder for each key it takes (eg 'event/{}/matches').
+            options:
+                A tuple of strings representing the optional path segments that can follow the template, in the order TBA expects them (eg ('year', 'simple', 'keys')).
+        """  # noqa
+        self.template = template
+        self.options = options
+
+        self._format = f"{BASE_URL}{template}".format
+        self._positions = {option: (position, f"/{option}") for position, option in enumerate(options)}
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"Endpoint({self.template!r}, {self.options!r})"
+
+    def url(self, *keys: typing.Any, **options: typing.Any) -> str:
+        """
+        Constructs the URL of a request to the route.
+
+        Parameters:
+            keys:
+                The values of the template's placeholders, in order (eg the key of the event).
+            options:
+                Arbritary amount of keyword arguments out of the route's options. Options that are None or False are left out, options that are True are added as their name (eg '/simple') and the rest are added as their value (eg '/2022'), always in the order of `options` so that the URL is the same no matter the order they were passed in.
+
+        Returns:
+            A string representing the URL, without a trailing slash.
+        """  # noqa
+        url = self._format(*keys)
+        previous_position = -1
+
+        for option, value in options.items():
+            position, segment = self._positions.get(option, (None, None))
+
+            if position is None:
+                raise TypeError(f"{self.template} doesn't take the option {option}.")
+            elif value is None or value is False:
+                continue
+            elif position < previous_position:
+                # Options passed in out of order are put back in the order TBA expects
+                return self.url(*keys, **dict(sorted(options.items(), key=lambda item: self._positions[item[0]])))
+
+            url += segment if value is True else f"/{value}"
+            previous_position = position
+
+        return url
+
+
+# Every route of the TBA API this library sends requests to (or invalidates the cached responses of)
+ENDPOINTS = {
+    "status": Endpoint("status"),
+    "districts": Endpoint("districts/{}"),
+    "district_events": Endpoint("district/{}/events", ("simple", "keys")),
+    "district_rankings": Endpoint("district/{}/rankings"),
+    "district_teams": Endpoint("district/{}/teams", ("simple", "keys")),
+    "events": Endpoint("events/{}", ("simple", "keys")),
+    "event": Endpoint("event/{}", ("simple",)),
+    "event_alliances": Endpoint("event/{}/alliances"),
+    "event_awards": Endpoint("event/{}/awards"),
+    "event_district_points": Endpoint("event/{}/district_points"),
+    "event_insights": Endpoint("event/{}/insights"),
+    "event_matches": Endpoint("event/{}/matches", ("simple", "keys", "timeseries")),
+    "event_oprs": Endpoint("event/{}/oprs"),
+    "event_predictions": Endpoint("event/{}/predictions"),
+    "event_rankings": Endpoint("event/{}/rankings"),
+    "event_teams": Endpoint("event/{}/teams", ("simple", "keys", "statuses")),
+    "match": Endpoint("match/{}", ("simple", "timeseries", "zebra_motionworks")),
+    "teams": Endpoint("teams", ("year", "page_num", "simple", "keys")),
+    "team": Endpoint("team/{}", ("simple",)),
+    "team_awards": Endpoint("team/{}/awards", ("year",)),
+    "team_districts": Endpoint("team/{}/districts"),
+    "team_event": Endpoint("team/{}/event/{}", ("awards", "matches", "status", "simple", "keys")),
+    "team_events": Endpoint("team/{}/events", ("year", "simple", "keys", "statuses")),
+    "team_matches": Endpoint("team/{}/matches", ("year", "simple", "keys")),
+    "team_media": Endpoint("team/{}/media", ("year",)),
+    "team_media_tag": Endpoint("team/{}/media/tag/{}", ("year",)),
+    "team_robots": Endpoint("team/{}/robots"),
+    "team_social_media": Endpoint("team/{}/social_media"),
+    "team_years_participated": Endpoint("team/{}/years_participated"),
+}
@@ -1,2 +1,17 @@
+import asyncio
+
+
 class TBAError(Exception):
     pass
+
+
+class DeadlineExceeded(asyncio.TimeoutError):
+    pass
+
+
+class TBAServerError(TBAError):
+    pass
+
+
+class CircuitOpenError(TBAError):
+    pass
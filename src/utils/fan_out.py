@@ -0,0 +1,101 @@
+import asyncio
+import typing
+
+import aiohttp
+
+from .exceptions import TBAError
+
+__all__ = ["fan_out", "PartialResults"]
+
+# Errors that only affect the item they were raised for and can be reported when partial results are allowed.
+REQUEST_ERRORS = (TBAError, aiohttp.ClientError, asyncio.TimeoutError)
+
+
+class PartialResults(list):
+    """List of results from a fan-out that also contains the errors raised for the items that failed."""
+
+    def __init__(self, iterable: typing.Iterable = (), errors: typing.Optional[dict] = None):
+        super().__init__(iterable)
+        self.errors: dict[typing.Any, BaseException] = errors or {}
+
+
+async def fan_out(
+    coro_function: typing.Callable[[typing.Any], typing.Awaitable],
+    items: typing.Iterable,
+    *,
+    limit: int = 10,
+    partial: bool = False,
+    progress: typing.Optional[typing.Callable[[int, int], typing.Any]] = None,
+) -> PartialResults:
+    """
+    Runs a coroutine function for every item concurrently, such as retrieving data for every year in a range.
+
+    If an item fails, every other item that is still running is cancelled (and waited on) before the error is raised.
+
+    Parameters:
+        coro_function:
+            A coroutine function that takes in an item and returns its result.
+        items:
+            An iterable of items to run `coro_function` for (eg a range object of years).
+        limit:
+            An integer representing the maximum amount of items that can be running at once.
+        partial:
+            A boolean representing whether items that fail because of a request error (eg a TBAError) should be reported in `PartialResults.errors` instead of cancelling the other items.
+        progress:
+            A function that is called with the amount of items that finished and the total amount of items every time an item finishes.
+
+    Returns:
+        A PartialResults object containing the results of the items that succeeded in the same order as `items` and the errors of the items that failed.
+    """  # noqa
+    items = list(items)
+    semaphore = asyncio.Semaphore(limit)
+
+    async def run_item(item: typing.Any) -> typing.Any:
+        async with semaphore:
+            return await coro_function(item)
+
+    tasks = [asyncio.ensure_future(run_item(item)) for item in items]
+    positions = {task: position for position, task in enumerate(tasks)}
+    pending = set(tasks)
+    finished = 0
+    errors = {}
+    failed = set()
+
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+
+            # Tasks that finished together are handled in the order of their items, and every one of their exceptions is retrieved before the first fatal one is raised  # noqa
+            exceptions = [
+                (task, asyncio.CancelledError() if task.cancelled() else task.exception())
+                for task in sorted(done, key=positions.__getitem__)
+            ]
+            fatal_exception = next(
+                (
+                    exception
+                    for _, exception in exceptions
+                    if exception is not None and not (partial and isinstance(exception, REQUEST_ERRORS))
+                ),
+                None,
+            )
+
+            if fatal_exception is not None:
+                raise fatal_exception
+
+            for task, exception in exceptions:
+                if exception is not None:
+                    errors[items[positions[task]]] = exception
+                    failed.add(task)
+
+                finished += 1
+
+                if progress is not None:
+                    progress(finished, len(tasks))
+    finally:
+        for task in pending:
+            task.cancel()
+
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    return PartialResults([task.result() for task in tasks if task not in failed], errors)
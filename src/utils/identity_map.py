@@ -0,0 +1,108 @@
+import contextlib
+import hashlib
+import json
+import typing
+import weakref
+
+__all__ = ["IdentityMap"]
+
+
+def _digest(item_data: dict) -> bytes:
+    """Hashes the data of a record, so that records can be compared without keeping their data around."""
+    return hashlib.blake2b(
+        json.dumps(item_data, sort_keys=True, separators=(",", ":")).encode(), digest_size=16
+    ).digest()
+
+
+class _Entry:
+    """The object constructed for a record, the response version it was last seen in and the digest of the data it was constructed from."""  # noqa
+
+    __slots__ = ("reference", "version", "digest")
+
+    def __init__(self, reference: weakref.ref, version: typing.Optional[str], digest: bytes):
+        self.reference = reference
+        self.version = version
+        self.digest = digest
+
+
+class IdentityMap:
+    """Class representing a map from the key of each record to the object constructed for it, so that the same record retrieved again (eg a team from `Event.teams` of every event it attended, or a match from both `Event.matches` and `Team.matches`) reuses that object instead of constructing a new one."""  # noqa
+
+    def __init__(self):
+        self._entries: dict[tuple[type, str], _Entry] = {}
+        self._version: typing.Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @contextlib.contextmanager
+    def response_version(self, version: str) -> typing.Iterator[None]:
+        """
+        Marks every record constructed inside the `with` block as coming from one version of a response, so that records seen again in the same version are reused without comparing their data.
+
+        The `with` block can't contain an `await`, since the version isn't tied to the task that set it.
+
+        Parameters:
+            version:
+                A string that is unique to the URL and the content of the response (eg the URL followed by `CachedResponse.version`).
+        """  # noqa
+        outer_version = self._version
+        self._version = version
+
+        try:
+            yield
+        finally:
+            self._version = outer_version
+
+    def construct(self, schema: type, item_data: dict) -> typing.Any:
+        """
+        Retrieves the object of a record, constructing it only if the record wasn't seen before, changed since or its object isn't used anymore.
+
+        Objects are only held onto weakly, so records are forgotten as soon as nothing else uses their objects. Since objects are shared between every response they are in, they shouldn't be modified.
+
+        Parameters:
+            schema:
+                The schema (eg Team) to construct the record as.
+            item_data:
+                A dictionary containing the data of the record (eg from TBA's response). Records without a key are always constructed.
+
+        Returns:
+            An object of `schema`.
+        """  # noqa
+        key = item_data.get("key")
+
+        if not isinstance(key, str):
+            return schema(**item_data)
+
+        map_key = (schema, key)
+        entry = self._entries.get(map_key)
+        digest = None
+
+        if entry is not None:
+            item = entry.reference()
+
+            if item is not None and self._version is not None and entry.version == self._version:
+                return item
+            elif item is not None:
+                digest = _digest(item_data)
+
+                if entry.digest == digest:
+                    entry.version = self._version or entry.version
+                    return item
+
+        item = schema(**item_data)
+        entries = self._entries
+
+        def forget(reference: weakref.ref) -> None:
+            # The record may have been constructed again since, in which case its newer entry is kept
+            current_entry = entries.get(map_key)
+
+            if current_entry is not None and current_entry.reference is reference:
+                del entries[map_key]
+
+        self._entries[map_key] = _Entry(weakref.ref(item, forget), self._version, digest or _digest(item_data))
+        return item
+
+    def clear(self) -> None:
+        """Forgets every record, so that they are all constructed again the next time they are retrieved."""
+        self._entries.clear()
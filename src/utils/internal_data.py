@@ -1,9 +1,76 @@
 import asyncio
+import concurrent.futures
+import json
+import re
+import time
 import typing
+from collections import OrderedDict
+from dataclasses import dataclass, field
 
 import aiohttp
 
-from .exceptions import TBAError
+from .checkpoint import Checkpoint
+from .circuit_breaker import CircuitBreaker, DATAFEED_FAMILIES, endpoint_family, event_key_of
+from .deadline import remaining_time
+from .exceptions import CircuitOpenError, DeadlineExceeded, TBAError, TBAServerError
+from .identity_map import IdentityMap
+from .priority import PrioritySemaphore
+
+__all__ = ["CachedResponse", "InternalData"]
+
+# Errors that a stale cached response is served instead of (stale-if-error)
+FALLBACK_ERRORS = (TBAServerError, aiohttp.ClientError, asyncio.TimeoutError)
+
+
+@dataclass()
+class CachedResponse:
+    """Class representing a response from the TBA API that is kept around for conditional requests."""
+
+    body: bytes
+    etag: typing.Optional[str] = None
+    last_modified: typing.Optional[str] = None
+    fetched_at: float = 0.0
+    expires_at: float = 0.0
+    headers: dict[str, str] = field(default_factory=dict)
+
+    @property
+    def is_fresh(self) -> bool:
+        """Whether the response can be reused without revalidating it with TBA (per its `Cache-Control` header)."""
+        return time.monotonic() < self.expires_at
+
+    @property
+    def age(self) -> float:
+        """The amount of seconds since the response was last retrieved or revalidated."""
+        return time.monotonic() - self.fetched_at
+
+    @property
+    def version(self) -> str:
+        """A string that changes whenever the content of the response changes."""
+        return self.etag or self.last_modified or str(hash(self.body))
+
+    def json(self) -> typing.Union[list, dict]:
+        """Decodes the body of the response."""
+        return json.loads(self.body)
+
+    def refresh(self, headers: typing.Mapping[str, str]) -> None:
+        """
+        Updates the headers of the response, when it was retrieved and when it expires based off the latest response.
+
+        Parameters:
+            headers:
+                A mapping containing the headers TBA responded with (eg `Cache-Control`).
+        """
+        max_age = re.search(r"max-age=(\d+)", headers.get("Cache-Control", ""))
+        self.headers.update(headers)
+        self.fetched_at = time.monotonic()
+        self.expires_at = self.fetched_at + int(max_age[1]) if max_age else 0.0
+
+
+def _decode_and_construct(
+    body: bytes, constructor: typing.Callable[[typing.Union[list, dict]], typing.Any]
+) -> typing.Any:
+    """Decodes the body of a response and converts it into objects (run in a worker process of `InternalData.parse_executor`)."""  # noqa
+    return constructor(json.loads(body))
 
 
 class InternalData:
@@ -11,9 +78,32 @@ class InternalData:
 
     loop = asyncio.get_event_loop()
     session = None
+    semaphore: typing.Optional[PrioritySemaphore] = None
+
+    cache: "OrderedDict[str, CachedResponse]" = OrderedDict()
+    max_cache_entries = 2048
+    in_flight: dict[str, asyncio.Future] = {}
+    checkpoint: typing.Optional[Checkpoint] = None
+
+    # Circuit breakers of each endpoint family (see `endpoint_family`) and the events TBA reports as down
+    circuit_breakers: dict[str, CircuitBreaker] = {}
+    failure_threshold = 5
+    reset_timeout = 30.0
+    datafeed_down = False
+    down_events: set[str] = set()
+
+    # The maximum amount of seconds a single GET request (including reading its body) can take
+    request_timeout: typing.Optional[float] = None
+
+    # Responses at least this many bytes long are decoded and converted in the parse executor (if there is one)
+    parse_executor: typing.Optional[concurrent.futures.Executor] = None
+    min_parse_offload_size = 256 * 1024
+
+    # Objects constructed from responses, reused when the same record is retrieved again (None to always construct them)
+    identity_map: typing.Optional[IdentityMap] = IdentityMap()
 
     @classmethod
-    async def get(cls, *, url: str, headers: dict) -> typing.Union[list, dict]:
+    async def get(cls, *, url: str, headers: dict, max_age: typing.Optional[float] = None) -> typing.Union[list, dict]:
         """
         Sends a GET request to the TBA API.
 
@@ -22,21 +112,352 @@ class InternalData:
                 A string representing which URL to send a GET request to.
             headers:
                 A dictionary containing the API key to authorize the request.
+            max_age:
+                A number representing the amount of seconds a cached response can be reused for without revalidating it, even if TBA says it expired.
+
+        Returns:
+            A list or dictionary containing the decoded JSON response the GET request returned.
+        """  # noqa
+        cached_response = await cls.fetch(url=url, headers=headers, max_age=max_age)
+        return cached_response.json()
+
+    @classmethod
+    async def get_objects(
+        cls,
+        *,
+        url: str,
+        headers: dict,
+        constructor: typing.Callable[[typing.Union[list, dict]], typing.Any],
+        compact: bool = False,
+        max_age: typing.Optional[float] = None,
+    ) -> typing.Any:
+        """
+        Sends a GET request to the TBA API and converts the decoded JSON response into objects.
+
+        If there is a parse executor, `compact` is True and the response is large (eg every match of a season with score breakdowns when only a few attributes of each match are kept), the response is decoded and converted in one of the executor's worker processes. Only the converted results are sent back, so large responses are decoded on multiple cores at once without blocking the event loop.
+
+        Parameters:
+            url:
+                A string representing which URL to send a GET request to.
+            headers:
+                A dictionary containing the API key to authorize the request.
+            constructor:
+                A function that converts the decoded JSON response into objects (eg `Match._constructor(fields)`). Has to be picklable (a module-level function, a class or a classmethod) to be run in a worker process.
+            compact:
+                A boolean representing whether `constructor` returns results that are much smaller than the response (eg projections). Full objects are always converted in the event loop's thread, since rebuilding them from a worker process costs as much as converting them.
+            max_age:
+                A number representing the amount of seconds a cached response can be reused for without revalidating it, even if TBA says it expired.
+
+        Returns:
+            The objects `constructor` returned.
+        """  # noqa
+        cached_response = await cls.fetch(url=url, headers=headers, max_age=max_age)
+
+        if compact and cls.parse_executor is not None and len(cached_response.body) >= cls.min_parse_offload_size:
+            return await asyncio.get_running_loop().run_in_executor(
+                cls.parse_executor, _decode_and_construct, cached_response.body, constructor
+            )
+        elif cls.identity_map is None:
+            return constructor(cached_response.json())
+
+        # Records from the same version of this response are reused without comparing their data
+        with cls.identity_map.response_version(f"{url} {cached_response.version}"):
+            return constructor(cached_response.json())
+
+    @classmethod
+    def set_parse_executor(cls, max_workers: typing.Optional[int] = None) -> None:
+        """
+        Creates a process pool that large responses are decoded and converted in, replacing the previous one.
+
+        Parameters:
+            max_workers:
+                An integer representing the amount of worker processes, or None to have a worker process for every CPU. If 0, large responses are converted in the event loop's thread like every other response.
+        """  # noqa
+        if cls.parse_executor is not None:
+            cls.parse_executor.shutdown(wait=False)
+
+        cls.parse_executor = concurrent.futures.ProcessPoolExecutor(max_workers) if max_workers != 0 else None
+
+    @classmethod
+    async def fetch(cls, *, url: str, headers: dict, max_age: typing.Optional[float] = None) -> CachedResponse:
+        """
+        Sends a conditional GET request to the TBA API, reusing the cached response if TBA reports it as unchanged.
+
+        Concurrent requests to the same URL are deduplicated so that only one of them is sent to TBA.
+        If the URL's endpoints are failing (see `circuit_breaker`), the stale cached response is returned while recovery is probed in the background. It's also returned without sending a request while TBA reports the URL's event or FIRST's datafeed as down (see `apply_status`), and if the request fails because of a server error, a connection error or a timeout.
+        Inside a `deadline` block, waiting for the request raises a DeadlineExceeded error once the deadline passes (the request itself keeps running for other callers waiting on it and is still cached).
+        While a `Job` is running, responses recorded in its checkpoint are reused and new responses are recorded to it.
+
+        Parameters:
+            url:
+                A string representing which URL to send a GET request to.
+            headers:
+                A dictionary containing the API key to authorize the request.
+            max_age:
+                A number representing the amount of seconds a cached response can be reused for without revalidating it, even if TBA says it expired.
+
+        Returns:
+            A CachedResponse object containing the undecoded body of the response and its version.
+        """  # noqa
+        checkpoint = cls.checkpoint
+
+        if checkpoint is not None:
+            checkpointed_body = checkpoint.get(url)
+
+            if checkpointed_body is not None:
+                return CachedResponse(body=checkpointed_body)
+
+        cached_response = cls.cache.get(url)
+
+        if cached_response is not None:
+            cls.cache.move_to_end(url)
+
+        if cached_response is None or not (
+            cached_response.is_fresh or (max_age is not None and cached_response.age < max_age)
+        ):
+            cached_response = await cls._refresh(url, headers, cached_response)
+
+        if checkpoint is not None:
+            checkpoint.save(url, cached_response.body)
+
+        return cached_response
+
+    @classmethod
+    async def _refresh(
+        cls, url: str, headers: dict, cached_response: typing.Optional[CachedResponse]
+    ) -> CachedResponse:
+        """
+        Retrieves the latest response from a URL, falling back to the stale cached response while its endpoints are down.
+
+        Parameters:
+            url:
+                A string representing which URL to send a GET request to.
+            headers:
+                A dictionary containing the API key to authorize the request.
+            cached_response:
+                A CachedResponse object representing the response that was previously retrieved from the URL or None if there isn't one.
+
+        Returns:
+            A CachedResponse object containing the undecoded body of the response and its version.
+        """  # noqa
+        request = cls.in_flight.get(url)
+
+        if request is None:
+            circuit_breaker = cls.circuit_breaker(endpoint_family(url))
+
+            if cached_response is not None and cls._is_down(url):
+                return cached_response
+            elif not circuit_breaker.allow_request():
+                if cached_response is not None:
+                    return cached_response
+
+                raise CircuitOpenError(
+                    f"Requests to {endpoint_family(url)} endpoints are paused since they are failing, "
+                    f"retrying in {circuit_breaker.retry_at - time.monotonic():.0f} seconds."
+                )
+
+            request = cls.in_flight[url] = asyncio.ensure_future(cls._request(url, headers, cached_response))
+            request.add_done_callback(lambda _: cls.in_flight.pop(url) if cls.in_flight.get(url) is request else None)
+
+            # While the circuit breaker is open, the request only probes for recovery and the stale response is served
+            if circuit_breaker.is_open and cached_response is not None:
+                request.add_done_callback(lambda probe: probe.cancelled() or probe.exception())
+                return cached_response
+
+        try:
+            return await cls._wait_for(request, url)
+        except FALLBACK_ERRORS:
+            if cached_response is None:
+                raise
+
+            return cached_response
+
+    @staticmethod
+    async def _wait_for(request: asyncio.Future, url: str) -> CachedResponse:
+        """
+        Waits for a request that may be shared with other callers, giving up once the current deadline passes.
+
+        Parameters:
+            request:
+                An asyncio.Future object representing the request.
+            url:
+                A string representing the URL the request was sent to.
+
+        Returns:
+            A CachedResponse object representing the response of the request.
+        """
+        remaining = remaining_time()
+
+        if remaining is None:
+            return await asyncio.shield(request)
+        elif remaining > 0 and not request.done():
+            await asyncio.wait({request}, timeout=remaining)
+
+        # Errors raised by the request itself (including its own timeout) are raised as is
+        if request.done():
+            return request.result()
+
+        raise DeadlineExceeded(f"The deadline passed before a response was received from {url}.")
+
+    @classmethod
+    async def _request(
+        cls, url: str, headers: dict, cached_response: typing.Optional[CachedResponse]
+    ) -> CachedResponse:
+        """
+        Sends a GET request to the TBA API, making it conditional if there is a cached response for the URL.
+
+        Parameters:
+            url:
+                A string representing which URL to send a GET request to.
+            headers:
+                A dictionary containing the API key to authorize the request.
+            cached_response:
+                A CachedResponse object representing the response that was previously retrieved from the URL or None if there isn't one.
 
         Returns:
-            An aiohttp.ClientResponse object representing the response the GET request returned.
+            A CachedResponse object containing the undecoded body of the response and its version.
+        """  # noqa
+        if cached_response is not None:
+            headers = dict(headers)
+            if cached_response.etag:
+                headers["If-None-Match"] = cached_response.etag
+            if cached_response.last_modified:
+                headers["If-Modified-Since"] = cached_response.last_modified
+
+        # aiohttp treats a timeout of None as no timeout at all, so its default timeout is kept if there isn't one
+        request_kwargs = (
+            {} if cls.request_timeout is None else {"timeout": aiohttp.ClientTimeout(total=cls.request_timeout)}
+        )
+
+        circuit_breaker = cls.circuit_breaker(endpoint_family(url))
+
+        try:
+            async with cls.semaphore, cls.session.get(url=url, headers=headers, **request_kwargs) as response:
+                if response.status == 304 and cached_response is not None:
+                    circuit_breaker.record_success()
+                    cached_response.refresh(response.headers)
+                    return cached_response
+
+                body = await response.read()
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            circuit_breaker.record_failure()
+            raise
+
+        if response.status >= 500:
+            circuit_breaker.record_failure()
+        else:
+            circuit_breaker.record_success()
+
+        if response.status >= 400:
+            try:
+                response_json = json.loads(body)
+            except ValueError:
+                # Server errors can come back as HTML pages from TBA's CDN
+                response_json = None
+
+            error_message = response_json.get("Error") if isinstance(response_json, dict) else None
+            raise (TBAServerError if response.status >= 500 else TBAError)(error_message or response.reason)
+
+        cached_response = CachedResponse(
+            body=body, etag=response.headers.get("ETag"), last_modified=response.headers.get("Last-Modified")
+        )
+        cached_response.refresh(response.headers)
+        cls.cache_response(url, cached_response)
+
+        return cached_response
+
+    @classmethod
+    def circuit_breaker(cls, family: str) -> CircuitBreaker:
+        """
+        Retrieves the circuit breaker of a family of endpoints, creating it if it doesn't exist yet.
+
+        Parameters:
+            family:
+                A string representing the family of endpoints (eg 'event/matches', see `endpoint_family`).
+
+        Returns:
+            A CircuitBreaker object that every request to the family of endpoints goes through.
+        """
+        if family not in cls.circuit_breakers:
+            cls.circuit_breakers[family] = CircuitBreaker(cls.failure_threshold, cls.reset_timeout)
+
+        return cls.circuit_breakers[family]
+
+    @classmethod
+    def apply_status(cls, is_datafeed_down: bool, down_events: typing.Iterable[str]) -> None:
+        """
+        Serves the stale cached responses of the endpoints TBA reports as down (per `ApiClient.status`) instead of refreshing them until they recover.
+
+        Responses that aren't cached are still requested, since TBA keeps serving the data it had before the datafeed went down. Circuit breakers are only tripped by requests that actually fail.
+
+        Parameters:
+            is_datafeed_down:
+                A boolean representing whether FIRST's datafeed (which match results, rankings, etc. come from) is down, which applies to every endpoint family that depends on it.
+            down_events:
+                An iterable of strings representing the keys of the events whose data isn't being updated.
+        """  # noqa
+        cls.datafeed_down = bool(is_datafeed_down)
+        cls.down_events = set(down_events)
+
+    @classmethod
+    def _is_down(cls, url: str) -> bool:
+        """Determines whether TBA reported the data of a URL as not being updated, either because its event or FIRST's datafeed is down."""  # noqa
+        return event_key_of(url) in cls.down_events or (cls.datafeed_down and endpoint_family(url) in DATAFEED_FAMILIES)
+
+    @classmethod
+    def cache_response(cls, url: str, cached_response: CachedResponse) -> None:
+        """
+        Stores a response in the cache, evicting the least recently used responses if the cache is full.
+
+        Parameters:
+            url:
+                A string representing the URL the response was retrieved from.
+            cached_response:
+                A CachedResponse object representing the response to store.
+        """
+        cls.cache[url] = cached_response
+        cls.cache.move_to_end(url)
+
+        while len(cls.cache) > cls.max_cache_entries:
+            cls.cache.popitem(last=False)
+
+    @classmethod
+    def invalidate(cls, url: str) -> list[str]:
         """
+        Removes a response and the responses of every endpoint nested under it from the cache.
 
-        async with cls.session.get(url=url, headers=headers) as response:
-            response_json = await response.json()
+        Parameters:
+            url:
+                A string representing the URL to invalidate (eg the URL of an event to invalidate its matches, rankings, etc.).
+
+        Returns:
+            A list of strings representing the URLs that were removed from the cache.
+        """  # noqa
+        url = url.rstrip("/")
+        invalidated_urls = [
+            cached_url for cached_url in cls.cache if cached_url == url or cached_url.startswith(f"{url}/")
+        ]
+
+        for cached_url in invalidated_urls:
+            del cls.cache[cached_url]
 
-            if isinstance(response_json, dict) and response_json.get("Error"):
-                raise TBAError(response_json["Error"])
-            else:
-                return response_json
+        return invalidated_urls
 
     @classmethod
-    async def set_session(cls) -> None:
-        """Initializes a `aiohttp.ClientSession` instance to send GET/POST requests out of."""
+    async def set_session(
+        cls, max_concurrent_requests: int = 100, request_timeout: typing.Optional[float] = None
+    ) -> None:
+        """
+        Initializes a `aiohttp.ClientSession` instance to send GET/POST requests out of.
+
+        Parameters:
+            max_concurrent_requests:
+                An integer representing the maximum amount of requests that can be in flight at once. Requests waiting for a free slot are sent in order of priority (see `request_priority`).
+            request_timeout:
+                A number representing the maximum amount of seconds a single GET request can take before raising an asyncio.TimeoutError, or None to use aiohttp's default timeout.
+        """  # noqa
         if cls.session is None:
             cls.session = aiohttp.ClientSession()
+
+        cls.semaphore = PrioritySemaphore(max_concurrent_requests)
+        cls.request_timeout = request_timeout
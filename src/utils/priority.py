@@ -0,0 +1,96 @@
+import asyncio
+import contextlib
+import contextvars
+import enum
+import heapq
+import itertools
+import typing
+
+__all__ = ["Priority", "PrioritySemaphore", "request_priority"]
+
+
+class Priority(enum.IntEnum):
+    """Enum representing how urgently requests should be sent when the maximum amount of requests are in flight."""
+
+    INTERACTIVE = 0
+    NORMAL = 1
+    BULK = 2
+
+
+# The priority of the requests sent from the current task (tasks inherit it from whoever created them)
+_current_priority: contextvars.ContextVar[Priority] = contextvars.ContextVar("priority", default=Priority.NORMAL)
+
+
+@contextlib.contextmanager
+def request_priority(priority: Priority) -> typing.Iterator[None]:
+    """
+    Sets the priority of every request sent inside the `with` block, including requests sent by fan-outs and concurrent batch lookups.
+
+    Requests with a higher priority (eg `Priority.INTERACTIVE` lookups) are sent before requests with a lower priority (eg a `Priority.BULK` crawl) that are waiting for a free slot, while requests with the same priority are sent in the order they were made.
+
+    Parameters:
+        priority:
+            A Priority representing the priority of the requests.
+    """  # noqa
+    token = _current_priority.set(Priority(priority))
+
+    try:
+        yield
+    finally:
+        _current_priority.reset(token)
+
+
+class PrioritySemaphore:
+    """Semaphore that hands out free slots to the waiter with the highest priority (the priority of the task that is waiting), then to the waiter that has waited the longest."""  # noqa
+
+    def __init__(self, value: int):
+        self._value = value
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    async def __aenter__(self) -> None:
+        await self.acquire()
+
+    async def __aexit__(self, *exc_info) -> None:
+        self.release()
+
+    def locked(self) -> bool:
+        """Whether acquiring the semaphore has to wait for a slot to be released."""
+        return self._value == 0
+
+    async def acquire(self, priority: typing.Optional[Priority] = None) -> None:
+        """
+        Waits for a free slot.
+
+        Parameters:
+            priority:
+                A Priority representing the priority to wait with, or None to use the priority of the current task (see `request_priority`).
+        """  # noqa
+        if self._value > 0 and not self._waiters:
+            self._value -= 1
+            return
+
+        if priority is None:
+            priority = _current_priority.get()
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), waiter))
+
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            # The slot was handed to this waiter right before it was cancelled, so it goes to the next waiter instead
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Releases a slot, handing it to the waiter with the highest priority if there is one."""
+        while self._waiters:
+            _, _, waiter = heapq.heappop(self._waiters)
+
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+        self._value += 1
@@ -0,0 +1,49 @@
+import inspect
+import typing
+
+__all__ = ["Publisher"]
+
+
+class Publisher:
+    """Base class for classes that notify subscribers about updates (eg `EventWatcher` and `WebhookReceiver`)."""
+
+    def __init__(self):
+        self._subscribers: list[typing.Callable[[typing.Any], typing.Any]] = []
+
+    def subscribe(self, callback: typing.Callable[[typing.Any], typing.Any]) -> typing.Callable:
+        """
+        Registers a callback to be called with every update; may be used as a decorator.
+
+        Parameters:
+            callback:
+                A function or coroutine function that takes in an update.
+
+        Returns:
+            The callback that was passed in.
+        """
+        self._subscribers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: typing.Callable[[typing.Any], typing.Any]) -> None:
+        """
+        Removes a callback that was previously registered via `subscribe`.
+
+        Parameters:
+            callback:
+                The function or coroutine function to stop calling with updates.
+        """
+        self._subscribers.remove(callback)
+
+    async def _publish(self, update: typing.Any) -> None:
+        """
+        Calls every subscriber with an update, awaiting the subscribers that are coroutine functions.
+
+        Parameters:
+            update:
+                The update to pass into every subscriber.
+        """
+        for callback in self._subscribers:
+            result = callback(update)
+
+            if inspect.isawaitable(result):
+                await result
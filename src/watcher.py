@@ -0,0 +1,281 @@
+import asyncio
+import datetime
+import itertools
+import logging
+import statistics
+import time
+import typing
+from dataclasses import dataclass
+
+from .schemas import *
+from .utils import *
+from .utils.fan_out import REQUEST_ERRORS
+
+__all__ = ["EventWatcher"]
+
+logger = logging.getLogger(__name__)
+
+
+class EventWatcher(Publisher):
+    """Class that polls live events and notifies subscribers about the matches, rankings and statuses that changed."""
+
+    @dataclass()
+    class Change:
+        """Class representing a match, ranking or team status that was added, changed or removed during an event."""
+
+        event_key: str
+        kind: str
+        key: str
+        old: typing.Optional[typing.Union[Match, Event.Ranking, EventTeamStatus]]
+        new: typing.Optional[typing.Union[Match, Event.Ranking, EventTeamStatus]]
+
+    # The delay between a match being played and its results being posted if it can't be estimated from the event.
+    DEFAULT_RESULT_DELAY = 180
+
+    def __init__(self, event_keys: typing.Iterable[str], min_interval: float = 10, max_interval: float = 600):
+        """
+        Parameters:
+            event_keys:
+                An iterable of strings representing the keys of the events to watch.
+            min_interval:
+                A number representing the least amount of seconds to wait between polling an event.
+            max_interval:
+                A number representing the most amount of seconds to wait between polling an event.
+        """
+        super().__init__()
+
+        self.event_keys = list(dict.fromkeys(event_keys))
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+
+        self._versions: dict[str, str] = {}
+        self._responses: dict[str, typing.Any] = {}
+        self._items: dict[tuple[str, str], dict[str, typing.Any]] = {}
+        self._stopped: typing.Optional[asyncio.Event] = None
+
+        # The last error raised while polling each event, which is cleared once the event is polled successfully again
+        self.errors: dict[str, BaseException] = {}
+
+    @classmethod
+    def for_active_events(
+        cls, year: int, date: typing.Optional[datetime.date] = None, **kwargs
+    ) -> "EventWatcher":  # pragma: no cover
+        """
+        Creates a watcher for every event taking place on a certain date.
+
+        Parameters:
+            year:
+                An integer representing the season to find active events from.
+            date:
+                A date object representing the day events should be taking place on. Defaults to today if not passed in.
+            kwargs:
+                Arbritary amount of keyword arguments passed into the constructor of EventWatcher.
+
+        Returns:
+            An EventWatcher object watching every event that takes place on `date`.
+        """
+        date = date or datetime.date.today()
+        response = InternalData.loop.run_until_complete(
+            InternalData.get(url=ENDPOINTS["events"].url(year, simple=True), headers=BaseSchema._headers)
+        )
+        active_events = [Event(**event_data) for event_data in response]
+
+        return cls(
+            [event.key for event in active_events if event.start_date.date() <= date <= event.end_date.date()],
+            **kwargs,
+        )
+
+    def poll(self) -> list[Change]:
+        """
+        Polls every watched event once and notifies subscribers about what changed since the last poll.
+
+        The first poll of an event reports every match, ranking and status as added.
+
+        Returns:
+            A list of Change objects representing everything that changed across all the watched events.
+        """
+        return InternalData.loop.run_until_complete(self.poll_async())
+
+    async def poll_async(self) -> list[Change]:
+        """Asynchronous version of `EventWatcher.poll`."""
+        all_changes = await asyncio.gather(*[self._poll_event(event_key) for event_key in self.event_keys])
+        return list(itertools.chain.from_iterable(all_changes))
+
+    def run(self) -> None:  # pragma: no cover
+        """Watches every event until `EventWatcher.stop` is called (eg from a subscriber)."""
+        InternalData.loop.run_until_complete(self.watch())
+
+    async def watch(self) -> None:  # pragma: no cover
+        """Asynchronous version of `EventWatcher.run`."""
+        self._stopped = asyncio.Event()
+        await asyncio.gather(*[self._watch_event(event_key) for event_key in self.event_keys])
+
+    def stop(self) -> None:
+        """Stops watching events after the ongoing polls finish."""
+        if self._stopped is not None:
+            self._stopped.set()
+
+    async def _watch_event(self, event_key: str) -> None:  # pragma: no cover
+        """
+        Polls an event until the watcher is stopped, waiting longer between polls when no results are expected.
+
+        Polls that fail because of a request error (eg TBA responding with a server error) are logged and recorded in `EventWatcher.errors`, and the event keeps being polled, waiting twice as long after each failure in a row.
+
+        Parameters:
+            event_key:
+                A string representing the key of the event to watch.
+        """  # noqa
+        failures = 0
+
+        while not self._stopped.is_set():
+            try:
+                await self._poll_event(event_key)
+            except REQUEST_ERRORS as error:
+                failures += 1
+                self.errors[event_key] = error
+                logger.warning("Polling %s failed (%d time(s) in a row): %r", event_key, failures, error)
+            else:
+                failures = 0
+                self.errors.pop(event_key, None)
+
+            interval = self._next_interval(event_key)
+
+            if failures:
+                interval = min(max(interval, self.min_interval * 2**failures), self.max_interval)
+
+            try:
+                await asyncio.wait_for(self._stopped.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _poll_event(self, event_key: str) -> list[Change]:
+        """
+        Polls the matches, rankings and team statuses of an event and notifies subscribers about what changed.
+
+        Parameters:
+            event_key:
+                A string representing the key of the event to poll.
+
+        Returns:
+            A list of Change objects representing everything that changed in the event since the last poll.
+        """
+        match_changes, ranking_changes, status_changes = await asyncio.gather(
+            self._poll_resource(
+                event_key,
+                "match",
+                ENDPOINTS["event_matches"].url(event_key),
+                lambda response: {match_data["key"]: match_data for match_data in response},
+                lambda _, match_data, __: Match(**match_data),
+            ),
+            self._poll_resource(
+                event_key,
+                "ranking",
+                ENDPOINTS["event_rankings"].url(event_key),
+                lambda response: {
+                    rank_info["team_key"]: rank_info for rank_info in (response or {}).get("rankings") or ()
+                },
+                lambda _, rank_info, response: Event._construct_ranking(rank_info, response),
+            ),
+            self._poll_resource(
+                event_key,
+                "status",
+                ENDPOINTS["event_teams"].url(event_key, statuses=True),
+                lambda response: {team_key: status_info for team_key, status_info in response.items() if status_info},
+                lambda team_key, status_info, _: EventTeamStatus(team_key, status_info),
+            ),
+        )
+        changes = match_changes + ranking_changes + status_changes
+
+        for change in changes:
+            await self._publish(change)
+
+        return changes
+
+    async def _poll_resource(
+        self,
+        event_key: str,
+        kind: str,
+        url: str,
+        index: typing.Callable[[typing.Any], dict[str, typing.Any]],
+        construct: typing.Callable[[str, typing.Any, typing.Any], typing.Any],
+    ) -> list[Change]:
+        """
+        Polls one endpoint of an event and diffs its items with the items from the last poll.
+
+        Unchanged responses (per TBA's ETag/Last-Modified headers) aren't decoded, and only the items that changed are constructed into objects.
+
+        Parameters:
+            event_key:
+                A string representing the key of the event being polled.
+            kind:
+                A string representing what type of item the endpoint returns ('match', 'ranking' or 'status').
+            url:
+                A string representing the URL of the endpoint to poll.
+            index:
+                A function that maps the decoded response to a dictionary of the raw data of each item by its key.
+            construct:
+                A function that constructs an object out of the key of an item, its raw data and the decoded response.
+
+        Returns:
+            A list of Change objects representing the items that were added, changed or removed.
+        """  # noqa
+        cached_response = await InternalData.fetch(url=url, headers=BaseSchema._headers)
+
+        if self._versions.get(url) == cached_response.version:
+            return []
+
+        response = cached_response.json()
+        old_response = self._responses.get(url)
+        old_items = self._items.get((event_key, kind), {})
+        new_items = index(response)
+
+        self._versions[url] = cached_response.version
+        self._responses[url] = response
+        self._items[(event_key, kind)] = new_items
+
+        return [
+            self.Change(
+                event_key=event_key,
+                kind=kind,
+                key=item_key,
+                old=construct(item_key, old_items[item_key], old_response) if item_key in old_items else None,
+                new=construct(item_key, new_items[item_key], response) if item_key in new_items else None,
+            )
+            for item_key in itertools.chain(new_items, old_items.keys() - new_items.keys())
+            if old_items.get(item_key) != new_items.get(item_key)
+        ]
+
+    def _next_interval(self, event_key: str) -> float:
+        """
+        Estimates how long to wait before polling an event again based off when the next match results are expected.
+
+        Parameters:
+            event_key:
+                A string representing the key of the event that was polled.
+
+        Returns:
+            A number representing the amount of seconds to wait, bounded by `min_interval` and `max_interval`.
+        """
+        matches = self._items.get((event_key, "match"), {}).values()
+        unplayed_matches = [
+            match_data
+            for match_data in matches
+            if not match_data.get("post_result_time") and match_data["alliances"]["red"]["score"] in (None, -1)
+        ]
+
+        if not unplayed_matches:
+            return self.max_interval
+
+        result_delays = [
+            match_data["post_result_time"] - match_data["actual_time"]
+            for match_data in matches
+            if match_data.get("post_result_time") and match_data.get("actual_time")
+        ]
+        result_delay = statistics.median(result_delays) if result_delays else self.DEFAULT_RESULT_DELAY
+
+        next_match_time = min(
+            match_data.get("predicted_time") or match_data.get("time") or 0 for match_data in unplayed_matches
+        )
+        seconds_until_results = next_match_time + result_delay - time.time()
+
+        return min(max(seconds_until_results, self.min_interval), self.max_interval)
@@ -0,0 +1,201 @@
+import asyncio
+import hashlib
+import hmac
+import json
+import typing
+from dataclasses import dataclass
+
+from aiohttp import web
+
+from .schemas import *
+from .utils import *
+
+__all__ = ["WebhookReceiver"]
+
+
+class WebhookReceiver(Publisher):
+    """Class representing an embeddable server that receives TBA webhooks and pushes their updates to subscribers."""
+
+    @dataclass()
+    class Update:
+        """Class representing an update TBA pushed through a webhook."""
+
+        message_type: str
+        message_data: dict
+        event_key: typing.Optional[str] = None
+        match: typing.Optional[Match] = None
+        event: typing.Optional[Event] = None
+
+    def __init__(self, secret: str, path: str = "/", refresh_cache: bool = False):
+        """
+        Parameters:
+            secret:
+                A string representing the secret of the webhook (shown on TBA's account page) to verify payloads with.
+            path:
+                A string representing the path TBA sends webhooks to.
+            refresh_cache:
+                A boolean representing whether matches should be retrieved again after their cached responses are invalidated.
+        """  # noqa
+        super().__init__()
+
+        self.secret = secret
+        self.path = path
+        self.refresh_cache = refresh_cache
+        self.verification_key: typing.Optional[str] = None
+
+        self.app = web.Application()
+        self.app.router.add_post(path, self.handle)
+
+        self._runner: typing.Optional[web.AppRunner] = None
+
+    def signature(self, body: bytes) -> str:
+        """
+        Computes the HMAC TBA sends in the `X-TBA-HMAC` header of a webhook.
+
+        Parameters:
+            body:
+                A bytes object representing the body of the webhook.
+
+        Returns:
+            A string representing the hexadecimal HMAC-SHA256 of the body keyed with the secret.
+        """
+        return hmac.new(self.secret.encode(), body, hashlib.sha256).hexdigest()
+
+    async def start(self, host: str = "0.0.0.0", port: int = 8080) -> None:  # pragma: no cover
+        """
+        Starts serving the webhook receiver in the background of the running event loop.
+
+        Parameters:
+            host:
+                A string representing the host to listen on.
+            port:
+                An integer representing the port to listen on.
+        """
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, host, port).start()
+
+    async def stop(self) -> None:  # pragma: no cover
+        """Stops serving the webhook receiver."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def handle(self, request: web.Request) -> web.Response:
+        """
+        Verifies a webhook, invalidates the cached responses it affects and notifies subscribers about its update.
+
+        Parameters:
+            request:
+                An aiohttp.web.Request object representing the webhook TBA sent.
+
+        Returns:
+            An aiohttp.web.Response object with a status of 200 if the webhook was handled, 401 if its HMAC didn't match and 400 if it couldn't be parsed.
+        """  # noqa
+        body = await request.read()
+
+        if not hmac.compare_digest(self.signature(body), request.headers.get("X-TBA-HMAC", "")):
+            return web.Response(status=401, text="Invalid HMAC")
+
+        try:
+            payload = json.loads(body)
+            update = self._construct_update(payload["message_type"], payload.get("message_data") or {})
+        except (ValueError, KeyError, TypeError):
+            return web.Response(status=400, text="Invalid payload")
+
+        self._invalidate(update)
+        await self._publish(update)
+
+        return web.Response(status=200)
+
+    def _construct_update(self, message_type: str, message_data: dict) -> Update:
+        """
+        Translates the payload of a webhook into an Update object.
+
+        Parameters:
+            message_type:
+                A string representing the type of webhook (eg 'match_score', 'upcoming_match' or 'schedule_updated').
+            message_data:
+                A dictionary containing the data of the webhook.
+
+        Returns:
+            An Update object containing the Match or Event object the webhook carried if there is one.
+        """
+        if message_type == "verification":
+            self.verification_key = message_data["verification_key"]
+
+        match_data = message_data.get("match")
+        event_data = message_data.get("event")
+
+        return self.Update(
+            message_type=message_type,
+            message_data=message_data,
+            event_key=message_data.get("event_key") or (match_data or {}).get("event_key"),
+            match=Match(**self._normalize_match(match_data)) if match_data else None,
+            event=Event(**event_data) if event_data else None,
+        )
+
+    @staticmethod
+    def _normalize_match(match_data: dict) -> dict:
+        """
+        Converts a match from a webhook into the format of TBA's API (webhooks list an alliance's teams under 'teams').
+
+        Parameters:
+            match_data:
+                A dictionary containing the data of a match from a webhook.
+
+        Returns:
+            A dictionary containing the data of the match in the format of TBA's API.
+        """
+        return {
+            **match_data,
+            "alliances": {
+                color: {
+                    "score": alliance.get("score"),
+                    "team_keys": alliance.get("team_keys", alliance.get("teams", [])),
+                    "surrogate_team_keys": alliance.get("surrogate_team_keys", []),
+                    "dq_team_keys": alliance.get("dq_team_keys", []),
+                }
+                for color, alliance in match_data["alliances"].items()
+            },
+        }
+
+    def _invalidate(self, update: Update) -> None:
+        """
+        Removes the cached responses an update made outdated from `InternalData.cache`.
+
+        Parameters:
+            update:
+                An Update object representing the update that was received.
+        """
+        match_key = update.message_data.get("match_key") or (update.match.key if update.match else None)
+        refreshed_urls = []
+
+        if match_key:
+            refreshed_urls.append(ENDPOINTS["match"].url(match_key))
+
+        if update.event_key:
+            refreshed_urls.append(ENDPOINTS["event_matches"].url(update.event_key))
+            InternalData.invalidate(ENDPOINTS["event"].url(update.event_key))
+
+            team_keys = set(update.message_data.get("team_keys", []))
+            team_keys.update(
+                recipient["team_key"]
+                for award_data in update.message_data.get("awards", [])
+                for recipient in award_data.get("recipient_list", [])
+                if recipient.get("team_key")
+            )
+            if update.match:
+                team_keys.update(*[alliance.team_keys for alliance in update.match.alliances.values()])
+
+            for team_key in team_keys:
+                InternalData.invalidate(ENDPOINTS["team_event"].url(team_key, update.event_key))
+                InternalData.invalidate(ENDPOINTS["team_matches"].url(team_key, year=update.event_key[:4]))
+                InternalData.invalidate(ENDPOINTS["team_awards"].url(team_key))
+
+        for url in refreshed_urls:
+            InternalData.invalidate(url)
+
+        if self.refresh_cache:  # pragma: no cover
+            for url in refreshed_urls:
+                asyncio.ensure_future(InternalData.fetch(url=url, headers=BaseSchema._headers))